@@ -12,6 +12,9 @@ from . import arrangement
 from . import audio
 from . import midi
 from . import automation
+from . import protocol
+from . import batch
+from . import realtime
 
 __all__ = [
     "session",
@@ -25,4 +28,7 @@ __all__ = [
     "audio",
     "midi",
     "automation",
+    "protocol",
+    "batch",
+    "realtime",
 ]
@@ -73,3 +73,15 @@ def get_scene(song, scene_index):
     if scene_index < 0 or scene_index >= len(song.scenes):
         raise IndexError("Scene index out of range")
     return song.scenes[scene_index]
+
+
+def page_bounds(total, offset=0, limit=None):
+    """Clamp an offset/limit page request to a collection of ``total`` items.
+
+    Returns:
+        (start, end, page_info) where page_info holds "total", "offset" and
+        "next_offset" (None on the last page) for the response.
+    """
+    start = min(max(0, int(offset or 0)), total)
+    end = total if limit is None else min(total, start + max(1, int(limit)))
+    return start, end, {"total": total, "offset": start, "next_offset": end if end < total else None}
@@ -2,7 +2,7 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
-from ._helpers import get_track, get_clip
+from ._helpers import get_track, get_clip, page_bounds
 
 
 def duplicate_clip_to_arrangement(song, track_index, clip_index, time, ctrl=None):
@@ -28,8 +28,8 @@ def duplicate_clip_to_arrangement(song, track_index, clip_index, time, ctrl=None
         raise
 
 
-def get_arrangement_clips(song, track_index, ctrl=None):
-    """Get all clips in arrangement view for a track."""
+def get_arrangement_clips(song, track_index, offset=0, limit=None, ctrl=None):
+    """Get clips in arrangement view for a track (one page of them when limit is given)."""
     try:
         track = get_track(song, track_index)
 
@@ -39,8 +39,11 @@ def get_arrangement_clips(song, track_index, ctrl=None):
                 "(may be a group track or return track)"
             )
 
+        arrangement_clips = track.arrangement_clips
+        start, end, page = page_bounds(len(arrangement_clips), offset, limit)
         clips = []
-        for clip in track.arrangement_clips:
+        for i in range(start, end):
+            clip = arrangement_clips[i]
             clip_info = {
                 "name": clip.name,
                 "start_time": clip.start_time,
@@ -55,12 +58,14 @@ def get_arrangement_clips(song, track_index, ctrl=None):
             }
             clips.append(clip_info)
 
-        return {
+        result = {
             "track_index": track_index,
             "track_name": track.name,
             "clip_count": len(clips),
             "clips": clips,
         }
+        result.update(page)
+        return result
     except Exception as e:
         if ctrl:
             ctrl.log_message("Error getting arrangement clips: " + str(e))
@@ -0,0 +1,98 @@
+"""Batch: run an ordered list of sub-commands back to back in one main-thread tick."""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+MAX_BATCH_COMMANDS = 500
+
+
+def _lookup_path(value, path, ref):
+    """Walk a dotted path ("devices.0.name") into a previous item's result."""
+    for part in path:
+        if isinstance(value, dict) and part in value:
+            value = value[part]
+        elif isinstance(value, (list, tuple)) and part.isdigit() and int(part) < len(value):
+            value = value[int(part)]
+        else:
+            raise ValueError("Reference '{0}' does not resolve".format(ref))
+    return value
+
+
+def resolve_refs(params, results):
+    """Replace {"$ref": "<item>.<path>"} placeholders with earlier results.
+
+    Args:
+        params: Sub-command params (dicts/lists are walked recursively).
+        results: Per-item result dicts collected so far, in batch order.
+
+    Raises:
+        ValueError: If the reference points at a missing, failed or later item,
+            or the path does not exist in that item's result.
+    """
+    if isinstance(params, dict):
+        if len(params) == 1 and "$ref" in params:
+            ref = str(params["$ref"])
+            parts = ref.split(".")
+            if not parts[0].isdigit() or int(parts[0]) >= len(results):
+                raise ValueError("Reference '{0}' must point at an earlier item".format(ref))
+            item = results[int(parts[0])]
+            if item.get("status") != "success":
+                raise ValueError("Reference '{0}' points at an item that did not succeed".format(ref))
+            return _lookup_path(item.get("result"), parts[1:], ref)
+        return dict((k, resolve_refs(v, results)) for k, v in params.items())
+    if isinstance(params, list):
+        return [resolve_refs(v, results) for v in params]
+    return params
+
+
+def run_batch(song, commands, dispatch, stop_on_error=True, ctrl=None):
+    """Execute sub-commands in order through the regular handler dispatch.
+
+    Args:
+        song: Live song object.
+        commands: List of {"type": str, "params": dict} sub-commands.
+        dispatch: Callable(command_type, params) -> result, supplied by the
+            socket server so sub-commands reach the same handler functions
+            (tracks.create_midi_track, clips.create_clip, ...) as single
+            commands do.
+        stop_on_error: Stop at the first failing item (remaining items are
+            reported as "skipped") instead of continuing.
+
+    Returns:
+        Dict with per-item "results" plus succeeded/failed/skipped counts.
+    """
+    if not isinstance(commands, list) or not commands:
+        raise ValueError("commands must be a non-empty list")
+    if len(commands) > MAX_BATCH_COMMANDS:
+        raise ValueError("Batch too large: {0} commands (max {1})".format(len(commands), MAX_BATCH_COMMANDS))
+
+    results = []
+    stopped = False
+    for index, command in enumerate(commands):
+        command_type = command.get("type") if isinstance(command, dict) else None
+        if stopped:
+            results.append({"index": index, "type": command_type, "status": "skipped"})
+            continue
+        try:
+            if not command_type:
+                raise ValueError("Item is missing 'type'")
+            if command_type == "batch":
+                raise ValueError("Nested batches are not supported")
+            params = resolve_refs(command.get("params") or {}, results)
+            result = dispatch(command_type, params)
+            results.append({"index": index, "type": command_type, "status": "success", "result": result})
+        except Exception as e:
+            if ctrl:
+                ctrl.log_message("Batch item {0} ({1}) failed: {2}".format(index, command_type, str(e)))
+            results.append({"index": index, "type": command_type, "status": "error", "message": str(e)})
+            if stop_on_error:
+                stopped = True
+
+    succeeded = sum(1 for r in results if r["status"] == "success")
+    failed = sum(1 for r in results if r["status"] == "error")
+    return {
+        "results": results,
+        "succeeded": succeeded,
+        "failed": failed,
+        "skipped": len(results) - succeeded - failed,
+        "stopped_early": stopped,
+    }
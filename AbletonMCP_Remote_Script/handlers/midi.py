@@ -4,11 +4,16 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import traceback
 
-from ._helpers import get_clip
+from ._helpers import get_clip, page_bounds
 
 
-def get_clip_notes(song, track_index, clip_index, start_time, time_span, start_pitch, pitch_span, ctrl=None):
-    """Get MIDI notes from a clip."""
+def get_clip_notes(song, track_index, clip_index, start_time, time_span, start_pitch, pitch_span,
+                   offset=0, limit=None, ctrl=None):
+    """Get MIDI notes from a clip (one page of them when limit is given).
+
+    Live has no offset-based note query, so every page still reads all notes
+    in the time/pitch range; paging only bounds the dicts and JSON built.
+    """
     try:
         clip = _get_midi_clip(song, track_index, clip_index)
 
@@ -18,9 +23,10 @@ def get_clip_notes(song, track_index, clip_index, start_time, time_span, start_p
 
         # API: get_notes(start_time, start_pitch, time_span, pitch_span)
         notes_tuple = clip.get_notes(start_time, start_pitch, time_span, pitch_span)
+        start, end, page = page_bounds(len(notes_tuple), offset, limit)
 
         notes = []
-        for note in notes_tuple:
+        for note in notes_tuple[start:end]:
             notes.append({
                 "pitch": note[0],
                 "start_time": note[1],
@@ -29,12 +35,14 @@ def get_clip_notes(song, track_index, clip_index, start_time, time_span, start_p
                 "mute": note[4] if len(note) > 4 else False,
             })
 
-        return {
+        result = {
             "clip_name": clip.name,
             "clip_length": clip.length,
             "note_count": len(notes),
             "notes": notes,
         }
+        result.update(page)
+        return result
     except Exception as e:
         if ctrl:
             ctrl.log_message("Error getting clip notes: " + str(e))
@@ -141,8 +149,11 @@ def add_notes_extended(song, track_index, clip_index, notes, ctrl=None):
         raise
 
 
-def get_notes_extended(song, track_index, clip_index, start_time, time_span, ctrl=None):
-    """Get MIDI notes with Live 11+ extended properties."""
+def get_notes_extended(song, track_index, clip_index, start_time, time_span, offset=0, limit=None, ctrl=None):
+    """Get MIDI notes with Live 11+ extended properties (one page of them when limit is given).
+
+    As with get_clip_notes, each page reads every note in the time range.
+    """
     try:
         clip = _get_midi_clip(song, track_index, clip_index)
         actual_time_span = time_span if time_span > 0 else clip.length + 1
@@ -151,8 +162,9 @@ def get_notes_extended(song, track_index, clip_index, start_time, time_span, ctr
         if hasattr(clip, 'get_notes_extended'):
             try:
                 raw_notes = clip.get_notes_extended(0, 128, start_time, actual_time_span)
+                start, end, page = page_bounds(len(raw_notes), offset, limit)
                 notes = []
-                for note in raw_notes:
+                for note in list(raw_notes)[start:end]:
                     note_dict = {
                         "pitch": note.pitch if hasattr(note, 'pitch') else note[0],
                         "start_time": note.start_time if hasattr(note, 'start_time') else note[1],
@@ -167,21 +179,24 @@ def get_notes_extended(song, track_index, clip_index, start_time, time_span, ctr
                     if hasattr(note, 'release_velocity'):
                         note_dict["release_velocity"] = note.release_velocity
                     notes.append(note_dict)
-                return {
+                result = {
                     "clip_name": clip.name,
                     "clip_length": clip.length,
                     "note_count": len(notes),
                     "extended": True,
                     "notes": notes,
                 }
+                result.update(page)
+                return result
             except Exception as exc:
                 if ctrl:
                     ctrl.log_message("get_notes_extended failed, using legacy: " + str(exc))
 
         # Legacy fallback
         notes_tuple = clip.get_notes(start_time, 0, actual_time_span, 128)
+        start, end, page = page_bounds(len(notes_tuple), offset, limit)
         notes = []
-        for note in notes_tuple:
+        for note in notes_tuple[start:end]:
             notes.append({
                 "pitch": note[0],
                 "start_time": note[1],
@@ -189,13 +204,15 @@ def get_notes_extended(song, track_index, clip_index, start_time, time_span, ctr
                 "velocity": note[3],
                 "mute": note[4] if len(note) > 4 else False,
             })
-        return {
+        result = {
             "clip_name": clip.name,
             "clip_length": clip.length,
             "note_count": len(notes),
             "extended": False,
             "notes": notes,
         }
+        result.update(page)
+        return result
     except Exception as e:
         if ctrl:
             ctrl.log_message("Error getting extended notes: " + str(e))
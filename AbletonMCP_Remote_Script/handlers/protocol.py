@@ -0,0 +1,178 @@
+"""Wire protocol: capability negotiation and request-id tagging.
+
+The socket server keeps one set of negotiated features per client connection.
+With "request_id" negotiated, every command carries an "id" that is echoed
+back on its response, so the client can keep many commands in flight and
+match responses that complete out of order (read-only commands answer
+straight away while modifying commands wait for the main-thread tick).
+
+With "pacing_hints" negotiated, responses also report how many commands are
+still queued for the main thread, which replaces the client's blind sleeps
+around modifying commands.
+
+"batch", "heartbeat" and "parameter_handles" advertise commands (the batch
+envelope in handlers/batch.py, heartbeat below, and the numeric parameter
+handles in handlers/realtime.py); they change nothing on the TCP wire.
+
+With "length_prefixed" negotiated, every message after the negotiation
+response is framed as a 5-byte header (flags byte, big-endian uint32 payload
+length) followed by the UTF-8 JSON payload, in both directions.  Large
+responses are then read in one pass instead of being scanned for newlines.
+
+"zlib" (only together with "length_prefixed") compresses response payloads
+larger than the client's compression threshold and marks them with
+FRAME_FLAG_ZLIB in the frame header.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import json
+import struct
+import time
+import zlib
+
+PROTOCOL_VERSION = 2
+
+# Features this Remote Script can switch on for a connection, in the order
+# they were introduced.
+SUPPORTED_FEATURES = ("request_id", "pacing_hints", "batch", "length_prefixed", "zlib", "heartbeat",
+                      "parameter_handles")
+
+FRAME_HEADER = struct.Struct(">BI")
+FRAME_FLAG_ZLIB = 0x01
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+# Payloads below this many bytes are sent uncompressed (client may override)
+COMPRESSION_THRESHOLD = 4096
+COMPRESSION_LEVEL = 1  # JSON shrinks well even at the fastest level
+
+# Totals since the script loaded, reported by get_protocol_stats
+_compression_stats = {"frames": 0, "raw_bytes": 0, "wire_bytes": 0, "compress_ms": 0.0}
+
+
+def negotiate_protocol(song, features=None, compression_threshold=None, ctrl=None):
+    """Accept the subset of client-requested features this script supports.
+
+    Returns:
+        {"protocol_version": int, "features": [accepted feature names],
+         "compression_threshold": int}
+    """
+    requested = features or []
+    accepted = [f for f in requested if f in SUPPORTED_FEATURES]
+    if "zlib" in accepted and "length_prefixed" not in accepted:
+        accepted.remove("zlib")  # compressed payloads need binary framing
+    threshold = COMPRESSION_THRESHOLD if compression_threshold is None else max(0, int(compression_threshold))
+    if ctrl:
+        ctrl.log_message("Protocol negotiated: " + (", ".join(accepted) or "lockstep"))
+    return {"protocol_version": PROTOCOL_VERSION, "features": accepted,
+            "compression_threshold": threshold}
+
+
+def heartbeat(song, ctrl=None):
+    """Liveness probe for the client's connection monitor; touches no Live state."""
+    return {"protocol_version": PROTOCOL_VERSION}
+
+
+def tag_response(response, command, features):
+    """Copy the command's request id onto its response when negotiated.
+
+    Args:
+        response: The response dict about to be sent.
+        command: The parsed command dict it answers.
+        features: Features negotiated for this connection.
+
+    Returns:
+        The same response dict.
+    """
+    if "request_id" in features and isinstance(command, dict) and "id" in command:
+        response["id"] = command["id"]
+    return response
+
+
+def annotate_pacing(response, queue_depth, features):
+    """Attach the main-thread queue depth to a response when negotiated.
+
+    Args:
+        response: The response dict about to be sent.
+        queue_depth: Commands still waiting for a main-thread tick.
+        features: Features negotiated for this connection.
+
+    Returns:
+        The same response dict, with "queue_depth" and "settled" added.
+    """
+    if "pacing_hints" in features:
+        response["queue_depth"] = queue_depth
+        response["settled"] = queue_depth == 0
+    return response
+
+
+def encode_message(message, features, compression_threshold=COMPRESSION_THRESHOLD):
+    """Serialise a response dict in the connection's framing.
+
+    Args:
+        message: The response dict.
+        features: Features negotiated for this connection.
+        compression_threshold: Threshold returned by negotiate_protocol.
+
+    Returns:
+        bytes ready for sendall().
+    """
+    payload = json.dumps(message).encode("utf-8")
+    if "length_prefixed" not in features:
+        return payload + b"\n"
+    flags = 0
+    if "zlib" in features and len(payload) > compression_threshold:
+        start = time.time()
+        compressed = zlib.compress(payload, COMPRESSION_LEVEL)
+        _compression_stats["compress_ms"] += (time.time() - start) * 1000
+        _compression_stats["frames"] += 1
+        _compression_stats["raw_bytes"] += len(payload)
+        if len(compressed) < len(payload):
+            payload = compressed
+            flags |= FRAME_FLAG_ZLIB
+        _compression_stats["wire_bytes"] += len(payload)
+    return FRAME_HEADER.pack(flags, len(payload)) + payload
+
+
+def get_protocol_stats(song, ctrl=None):
+    """Compression counters since the Remote Script loaded."""
+    stats = dict(_compression_stats)
+    stats["bytes_saved"] = stats["raw_bytes"] - stats["wire_bytes"]
+    stats["compress_ms"] = round(stats["compress_ms"], 2)
+    return stats
+
+
+def decode_messages(buffer, features):
+    """Parse every complete command at the front of a receive buffer.
+
+    Args:
+        buffer: bytearray of received bytes; consumed bytes are removed from it.
+        features: Features negotiated for this connection.
+
+    Returns:
+        List of parsed command dicts (possibly empty if a message is incomplete).
+    """
+    messages = []
+    if "length_prefixed" in features:
+        while len(buffer) >= FRAME_HEADER.size:
+            flags, length = FRAME_HEADER.unpack_from(buffer)
+            if length > MAX_FRAME_SIZE:
+                raise ValueError("Frame of {0} bytes exceeds the limit".format(length))
+            end = FRAME_HEADER.size + length
+            if len(buffer) < end:
+                break
+            payload = bytes(buffer[FRAME_HEADER.size:end])
+            if flags & FRAME_FLAG_ZLIB:
+                payload = zlib.decompress(payload)
+            messages.append(json.loads(payload.decode("utf-8")))
+            del buffer[:end]
+        return messages
+    while True:
+        newline = buffer.find(b"\n")
+        if newline < 0:
+            break
+        line = bytes(buffer[:newline]).strip()
+        del buffer[:newline + 1]
+        if line:
+            messages.append(json.loads(line.decode("utf-8")))
+    return messages
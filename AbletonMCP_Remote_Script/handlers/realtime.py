@@ -0,0 +1,307 @@
+"""Realtime: numeric parameter handles and the coalescing UDP update queue.
+
+resolve_parameter_handle turns (track, device, parameter name) into a small
+integer once; after that the client streams binary handle packets that are
+applied without any track/device/parameter lookup:
+
+    header  ">BHHI" magic byte 0xA7, entry count, client session, sequence number
+    entry   ">If"   uint32 handle, float32 value   (repeated count times)
+
+JSON datagrams always start with "{", so the UDP listener tells the two
+formats apart by the first byte (see is_handle_packet).  Name-addressed JSON
+datagrams carry the same "session" and "seq" fields.
+
+The UDP listener does not touch Live.  It queues updates with
+queue_handle_packet / queue_parameter_command, and the main thread calls
+flush_pending once per tick.  Only the newest value per parameter survives
+until the flush (last write wins); a value whose sequence number is older
+than one already seen for that parameter arrived out of order and is
+dropped.  A new client session resets the sequence tracking.
+
+A handle is bound to one parameter object.  Any change that could make it
+point somewhere else invalidates it: the track list changing (indices
+shift), the track's device chain changing (devices moved, added, deleted)
+or the device's parameter list changing.  Packets for invalidated handles
+are dropped and counted, never applied to a different parameter; the
+client resolves again to get a fresh handle.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import struct
+import threading
+
+from .devices import resolve_track, set_device_parameters_batch
+
+PACKET_MAGIC = 0xA7
+PACKET_HEADER = struct.Struct(">BHHI")
+PACKET_ENTRY = struct.Struct(">If")
+
+_handles = {}      # handle -> {"param", "key", "listeners"}
+_by_key = {}       # (track_type, track_index, device_index, parameter_index) -> handle
+_listeners = {}    # listener key -> (remove function, callback)
+_next_handle = [1]
+
+# Written by the UDP listener, drained by the main thread
+_pending = {}      # update key -> handle value, or {"name", "value"} entry for JSON updates
+_last_seq = {}     # update key -> newest sequence number accepted
+_session = [None]
+_pending_lock = threading.Lock()
+
+_stats = {"packets": 0, "received": 0, "dropped": 0, "coalesced": 0, "applied": 0,
+          "stale": 0, "invalidated": 0}
+
+
+def _listen(key, obj, add, remove, callback):
+    """Attach a listener once per key; remembered so it can be removed."""
+    if key in _listeners:
+        return
+    getattr(obj, add)(callback)
+    _listeners[key] = (getattr(obj, remove), callback)
+
+
+def _drop(handles):
+    for handle in handles:
+        entry = _handles.pop(handle, None)
+        if entry is not None:
+            _by_key.pop(entry["key"], None)
+            _stats["invalidated"] += 1
+    # Detach listeners no remaining handle depends on
+    in_use = set()
+    for entry in _handles.values():
+        in_use.update(entry["listeners"])
+    for key in [k for k in _listeners if k not in in_use]:
+        remove, callback = _listeners.pop(key)
+        try:
+            remove(callback)
+        except Exception:
+            pass  # object already deleted from the set
+
+
+def _invalidate_all():
+    _drop(list(_handles))
+
+
+def _invalidate_prefix(prefix):
+    """Drop handles whose (track_type, track_index, device_index, ...) key starts with prefix."""
+    _drop([h for h, entry in _handles.items() if entry["key"][:len(prefix)] == prefix])
+
+
+def resolve_parameter_handle(song, track_index, device_index, parameter_name=None,
+                             parameter_index=None, track_type="track", ctrl=None):
+    """Return a numeric handle for a device parameter (by name or index).
+
+    Resolving the same parameter again returns the same handle while it is
+    still valid.
+
+    Returns:
+        {"handle": int, "parameter_name", "parameter_index", "value", "min",
+         "max", "is_quantized"}
+    """
+    try:
+        track = resolve_track(song, track_index, track_type)
+        device_list = list(track.devices)
+        if device_index < 0 or device_index >= len(device_list):
+            raise IndexError("Device index out of range")
+        device = device_list[device_index]
+        params = list(device.parameters)
+
+        if parameter_index is None:
+            if parameter_name is None:
+                raise ValueError("parameter_name or parameter_index is required")
+            for i, param in enumerate(params):
+                if param.name == parameter_name:
+                    parameter_index = i
+                    break
+            else:
+                raise ValueError("Parameter '{0}' not found on device '{1}'".format(
+                    parameter_name, device.name
+                ))
+        elif parameter_index < 0 or parameter_index >= len(params):
+            raise IndexError("Parameter index out of range")
+        param = params[parameter_index]
+
+        key = (track_type, track_index, device_index, parameter_index)
+        handle = _by_key.get(key)
+        if handle is None:
+            handle = _next_handle[0]
+            _next_handle[0] += 1
+            track_key = key[:2]
+            device_key = key[:3]
+            _listen("tracks", song, "add_tracks_listener", "remove_tracks_listener", _invalidate_all)
+            _listen("return_tracks", song, "add_return_tracks_listener", "remove_return_tracks_listener",
+                    _invalidate_all)
+            _listen(track_key, track, "add_devices_listener", "remove_devices_listener",
+                    lambda: _invalidate_prefix(track_key))
+            _listen(device_key, device, "add_parameters_listener", "remove_parameters_listener",
+                    lambda: _invalidate_prefix(device_key))
+            _handles[handle] = {
+                "param": param,
+                "key": key,
+                "listeners": ("tracks", "return_tracks", track_key, device_key),
+            }
+            _by_key[key] = handle
+
+        return {
+            "handle": handle,
+            "parameter_name": param.name,
+            "parameter_index": parameter_index,
+            "value": param.value,
+            "min": param.min,
+            "max": param.max,
+            "is_quantized": param.is_quantized,
+        }
+    except Exception as e:
+        if ctrl:
+            ctrl.log_message("Error resolving parameter handle: " + str(e))
+        raise
+
+
+def release_parameter_handles(song, handles=None, ctrl=None):
+    """Forget the given handles (or all of them) and detach unused listeners."""
+    before = len(_handles)
+    if handles is None:
+        _invalidate_all()
+    else:
+        _drop([int(h) for h in handles])
+    return {"released": before - len(_handles), "active": len(_handles)}
+
+
+def is_handle_packet(data):
+    """True if a UDP datagram is a binary handle packet rather than JSON."""
+    return len(data) >= PACKET_HEADER.size and bytearray(data[:1])[0] == PACKET_MAGIC
+
+
+def _is_newer(seq, last):
+    """Sequence comparison that survives 32-bit wrap-around."""
+    return 0 < ((seq - last) & 0xFFFFFFFF) < 0x80000000
+
+
+def _offer(key, value, session, seq):
+    """Queue one update unless a newer one was already seen (lock held by caller)."""
+    _stats["received"] += 1
+    if session != _session[0]:
+        _session[0] = session
+        _last_seq.clear()  # client restarted; its sequence numbers start over
+    if seq is not None:
+        last = _last_seq.get(key)
+        if last is not None and not _is_newer(seq, last):
+            _stats["dropped"] += 1
+            return
+        _last_seq[key] = seq
+    if key in _pending:
+        _stats["coalesced"] += 1
+    _pending[key] = value
+
+
+def queue_handle_packet(song, data, ctrl=None):
+    """Queue every (handle, value) entry of a binary packet for the next flush.
+
+    Returns:
+        {"queued": int} — entries in the packet
+    """
+    magic, count, session, seq = PACKET_HEADER.unpack_from(data)
+    if magic != PACKET_MAGIC:
+        raise ValueError("Not a parameter handle packet")
+    if len(data) < PACKET_HEADER.size + count * PACKET_ENTRY.size:
+        raise ValueError("Truncated parameter handle packet")
+
+    with _pending_lock:
+        _stats["packets"] += 1
+        for i in range(count):
+            handle, value = PACKET_ENTRY.unpack_from(data, PACKET_HEADER.size + i * PACKET_ENTRY.size)
+            _offer(("handle", handle), value, session, seq)
+    return {"queued": count}
+
+
+def queue_parameter_command(song, command, ctrl=None):
+    """Queue a name-addressed set_device_parameter / batch_set_device_parameters datagram.
+
+    Returns:
+        {"queued": int}, or None for other command types (dispatch those as usual).
+    """
+    command_type = command.get("type")
+    params = command.get("params") or {}
+    if command_type == "set_device_parameter":
+        entry = {"name": params.get("parameter_name")}
+        for key in ("value", "value_display"):
+            if key in params:
+                entry[key] = params[key]
+        entries = [entry]
+    elif command_type == "batch_set_device_parameters":
+        entries = params.get("parameters") or []
+    else:
+        return None
+
+    device_key = (params.get("track_type", "track"), params.get("track_index"), params.get("device_index"))
+    with _pending_lock:
+        _stats["packets"] += 1
+        for entry in entries:
+            _offer(device_key + (entry.get("name"),), entry, command.get("session"), command.get("seq"))
+    return {"queued": len(entries)}
+
+
+def flush_pending(song, ctrl=None):
+    """Apply the newest queued value per parameter; call once per main-thread tick.
+
+    Handle values are clamped and set directly; name-addressed values are
+    grouped per device into one set_device_parameters_batch call.
+
+    Returns:
+        {"applied": int, "stale": int}
+    """
+    with _pending_lock:
+        if not _pending:
+            return {"applied": 0, "stale": 0}
+        updates = _pending.copy()
+        _pending.clear()
+
+    applied = stale = 0
+    by_device = {}
+    for key, value in updates.items():
+        if key[0] != "handle":
+            by_device.setdefault(key[:3], []).append(value)
+            continue
+        entry = _handles.get(key[1])
+        if entry is None:
+            stale += 1
+            continue
+        param = entry["param"]
+        try:
+            param.value = max(param.min, min(param.max, value))
+            applied += 1
+        except Exception:
+            # Parameter vanished without a listener firing — never reuse it
+            _drop([key[1]])
+            stale += 1
+
+    for (track_type, track_index, device_index), entries in by_device.items():
+        try:
+            result = set_device_parameters_batch(song, track_index, device_index, entries,
+                                                 track_type=track_type, ctrl=ctrl)
+            errors = sum(1 for r in result["results"] if "error" in r)
+            applied += len(entries) - errors
+            stale += errors
+        except Exception:
+            stale += len(entries)  # device gone or moved; already logged
+
+    with _pending_lock:
+        _stats["applied"] += applied
+        _stats["stale"] += stale
+    if stale and ctrl:
+        ctrl.log_message("Dropped {0} realtime value(s) for missing parameters".format(stale))
+    return {"applied": applied, "stale": stale}
+
+
+def get_realtime_stats(song, ctrl=None):
+    """Realtime update counters since the Remote Script loaded.
+
+    received = updates read off UDP; dropped = arrived out of order;
+    coalesced = replaced by a newer value before the flush; applied = written
+    to Live; stale = target handle/parameter no longer exists.
+    """
+    with _pending_lock:
+        stats = dict(_stats)
+        stats["pending"] = len(_pending)
+    stats["active_handles"] = len(_handles)
+    return stats
@@ -2,7 +2,7 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
-from ._helpers import get_track, get_clip
+from ._helpers import get_track, get_clip, page_bounds
 
 
 def get_track_info(song, track_index, ctrl=None):
@@ -310,11 +310,14 @@ def group_tracks(song, track_indices, name, ctrl=None):
         raise
 
 
-def get_all_tracks_info(song, ctrl=None):
-    """Get summary info for all tracks at once."""
+def get_all_tracks_info(song, offset=0, limit=None, ctrl=None):
+    """Get summary info for all tracks at once (one page of them when limit is given)."""
     try:
+        tracks = song.tracks
+        start, end, page = page_bounds(len(tracks), offset, limit)
         tracks_list = []
-        for i, track in enumerate(song.tracks):
+        for i in range(start, end):
+            track = tracks[i]
             devices_list = []
             for d in track.devices:
                 devices_list.append({"name": d.name, "class_name": d.class_name})
@@ -339,7 +342,9 @@ def get_all_tracks_info(song, ctrl=None):
             except Exception:
                 track_info["is_group_track"] = False
             tracks_list.append(track_info)
-        return {"tracks": tracks_list, "count": len(tracks_list)}
+        result = {"tracks": tracks_list, "count": len(tracks_list)}
+        result.update(page)
+        return result
     except Exception as e:
         if ctrl:
             ctrl.log_message("Error getting all tracks info: " + str(e))
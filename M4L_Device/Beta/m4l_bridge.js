@@ -7,15 +7,18 @@
  * Communication uses native OSC messages via udpreceive/udpsend:
  *   - The MCP server sends OSC messages like /ping, /discover_params, etc.
  *   - Max's udpreceive parses OSC and sends the address + args to this [js]
- *   - Responses are base64-encoded JSON sent back via outlet → udpsend
+ *   - Responses are base64-encoded JSON sent back via outlet → udpsend, or
+ *     /r messages carrying plain JSON once the server selects raw mode
+ *   - Observed property changes are pushed as /ev messages (second outlet)
  *
  * The Max patch needs:
  *   [udpreceive 9878] → [js m4l_bridge.js] → [udpsend 127.0.0.1 9879]
+ *   and, for pushed events, the [js] right outlet → [udpsend 127.0.0.1 9883]
  */
 
 // Max [js] object configuration
 inlets  = 1;
-outlets = 1;
+outlets = 2;  // 0: responses → [udpsend 127.0.0.1 9879], 1: pushed events → [udpsend 127.0.0.1 9883]
 
 // ---------------------------------------------------------------------------
 // Initialization
@@ -26,6 +29,10 @@ function loadbang() {
     post("Dashboard: http://127.0.0.1:9880\n");
 }
 
+// Optional protocol features, reported by /ping so the server can tell
+// which fast paths this bridge understands.
+var BRIDGE_FEATURES = ["concurrent", "bundles", "uploads", "resend", "raw_responses", "param_values", "events"];
+
 // ---------------------------------------------------------------------------
 // OSC message routing
 //
@@ -50,6 +57,10 @@ function anything() {
             handlePing(args);
             break;
 
+        case "get_param_values":
+            handleGetParamValues(args);
+            break;
+
         case "discover_params":
             handleDiscoverParams(args);
             break;
@@ -62,6 +73,30 @@ function anything() {
             handleSetHiddenParam(args);
             break;
 
+        case "bundle_set_param":
+            handleBundleSetParam(args);
+            break;
+
+        case "bundle_commit":
+            handleBundleCommit(args);
+            break;
+
+        case "upload_chunk":
+            handleUploadChunk(args);
+            break;
+
+        case "upload_status":
+            handleUploadStatus(args);
+            break;
+
+        case "resend_chunks":
+            handleResendChunks(args);
+            break;
+
+        case "response_mode":
+            handleResponseMode(args);
+            break;
+
         case "batch_set_hidden_params":
             handleBatchSetHiddenParams(args);
             break;
@@ -154,6 +189,10 @@ function anything() {
             handleGetObservedChanges(args);
             break;
 
+        case "event_stream":
+            handleEventStream(args);
+            break;
+
         // --- Phase 9: Undo-Clean Parameter Control ---
         case "set_param_clean":
             handleSetParamClean(args);
@@ -239,10 +278,11 @@ function handlePing(args) {
     var requestId = (args.length > 0) ? args[0].toString() : "";
     var response = {
         status: "success",
-        result: { m4l_bridge: true, version: "3.6.0" },
+        result: { m4l_bridge: true, version: "3.6.0", features: BRIDGE_FEATURES,
+                  response_mode: _responseMode, event_mode: _eventMode },
         id: requestId
     };
-    sendResponse(JSON.stringify(response));
+    sendResponse(JSON.stringify(response), requestId);
 }
 
 // ---------------------------------------------------------------------------
@@ -379,6 +419,21 @@ function handleGetHiddenParams(args) {
     _startChunkedDiscover(trackIdx, deviceIdx, requestId);
 }
 
+function handleGetParamValues(args) {
+    // args: [track_index (int), device_index (int), request_id (string)]
+    // Names and current values only — the server keeps the rest of each
+    // device's parameter schema cached, so this is all a repeat snapshot needs.
+    if (args.length < 3) {
+        sendError("get_param_values requires track_index, device_index, request_id", "");
+        return;
+    }
+    var trackIdx  = parseInt(args[0]);
+    var deviceIdx = parseInt(args[1]);
+    var requestId = args[2].toString();
+
+    _startChunkedDiscover(trackIdx, deviceIdx, requestId, true);
+}
+
 function handleSetHiddenParam(args) {
     // args: [track_index (int), device_index (int), parameter_index (int), value (float), request_id (string)]
     if (args.length < 5) {
@@ -408,17 +463,28 @@ function handleSetHiddenParam(args) {
 // ---------------------------------------------------------------------------
 var DISCOVER_CHUNK_SIZE = 4;    // params per chunk (4 × 7 gets = 28 — well under limit)
 var DISCOVER_CHUNK_DELAY = 50;  // ms between chunks
+var VALUES_CHUNK_SIZE = 32;     // get_param_values: 32 × 2 gets = 64 per chunk
+var VALUES_CHUNK_DELAY = 10;
 
 var _discoverState = null;
 
-function _startChunkedDiscover(trackIdx, deviceIdx, requestId) {
+// Discoveries requested while one is running wait here instead of failing
+// with "busy", so the server can keep several requests in flight.
+var DISCOVER_QUEUE_MAX = 64;
+var _discoverQueue = [];
+
+function _startChunkedDiscover(trackIdx, deviceIdx, requestId, valuesOnly) {
     var devicePath = "live_set tracks " + trackIdx + " devices " + deviceIdx;
-    _startChunkedDiscoverAtPath(devicePath, requestId);
+    _startChunkedDiscoverAtPath(devicePath, requestId, valuesOnly);
 }
 
-function _startChunkedDiscoverAtPath(devicePath, requestId) {
+function _startChunkedDiscoverAtPath(devicePath, requestId, valuesOnly) {
     if (_discoverState) {
-        sendError("Discovery busy - try again shortly", requestId);
+        if (_discoverQueue.length >= DISCOVER_QUEUE_MAX) {
+            sendError("Discovery busy - try again shortly", requestId);
+            return;
+        }
+        _discoverQueue.push([devicePath, requestId, valuesOnly]);
         return;
     }
 
@@ -426,6 +492,7 @@ function _startChunkedDiscoverAtPath(devicePath, requestId) {
 
     if (!cursor || !cursor.id || parseInt(cursor.id) === 0) {
         sendError("No device found at path: " + devicePath, requestId);
+        _startNextQueuedDiscover();
         return;
     }
 
@@ -441,7 +508,10 @@ function _startChunkedDiscoverAtPath(devicePath, requestId) {
         cursor:      cursor,
         idx:         0,
         parameters:  [],
-        requestId:   requestId
+        requestId:   requestId,
+        valuesOnly:  !!valuesOnly,
+        names:       [],
+        values:      []
     };
 
     // Start processing the first chunk
@@ -453,12 +523,25 @@ function _discoverNextChunk() {
 
     var s = _discoverState;
     try {
-        var end = Math.min(s.idx + DISCOVER_CHUNK_SIZE, s.paramCount);
+        var end = Math.min(s.idx + (s.valuesOnly ? VALUES_CHUNK_SIZE : DISCOVER_CHUNK_SIZE), s.paramCount);
 
         for (var i = s.idx; i < end; i++) {
             s.cursor.goto(s.devicePath + " parameters " + i);
 
             if (!s.cursor.id || parseInt(s.cursor.id) === 0) {
+                if (s.valuesOnly) {
+                    s.names.push(null);
+                    s.values.push(null);
+                }
+                continue;
+            }
+
+            if (s.valuesOnly) {
+                var name = null, value = null;
+                try { name  = s.cursor.get("name").toString(); } catch (e) {}
+                try { value = parseFloat(s.cursor.get("value")); } catch (e) {}
+                s.names.push(name);
+                s.values.push(value);
                 continue;
             }
 
@@ -472,26 +555,50 @@ function _discoverNextChunk() {
             // All chunks done — clean up cursor and send response
             s.cursor.goto(s.devicePath);
 
-            sendResult({
-                device_name:     s.deviceName,
-                device_class:    s.deviceClass,
-                parameter_count: s.parameters.length,
-                parameters:      s.parameters
-            }, s.requestId);
+            if (s.valuesOnly) {
+                // names/values are indexed by parameter index (null = unreadable)
+                sendResult({
+                    device_name:     s.deviceName,
+                    device_class:    s.deviceClass,
+                    parameter_count: s.paramCount,
+                    names:           s.names,
+                    values:          s.values
+                }, s.requestId);
+            } else {
+                sendResult({
+                    device_name:     s.deviceName,
+                    device_class:    s.deviceClass,
+                    parameter_count: s.parameters.length,
+                    parameters:      s.parameters
+                }, s.requestId);
+            }
             _discoverState = null;
+            _startNextQueuedDiscover();
         } else {
             // Schedule the next chunk after a short delay
             var t = new Task(_discoverNextChunk);
-            t.schedule(DISCOVER_CHUNK_DELAY);
+            t.schedule(s.valuesOnly ? VALUES_CHUNK_DELAY : DISCOVER_CHUNK_DELAY);
         }
     } catch (e) {
         var rid = s.requestId;
         try { s.cursor.goto(s.devicePath); } catch (ignore) {}
         _discoverState = null;
         sendError("Discovery failed at param " + s.idx + ": " + safeErrorMessage(e), rid);
+        _startNextQueuedDiscover();
     }
 }
 
+function _startNextQueuedDiscover() {
+    if (_discoverQueue.length === 0) return;
+    // Deferred, like the chunks themselves — never chain discoveries synchronously
+    var t = new Task(function () {
+        if (_discoverState || _discoverQueue.length === 0) return;
+        var next = _discoverQueue.shift();
+        _startChunkedDiscoverAtPath(next[0], next[1], next[2]);
+    });
+    t.schedule(DISCOVER_CHUNK_DELAY);
+}
+
 // ---------------------------------------------------------------------------
 // Batch set: chunked processing to avoid freezing Ableton
 //
@@ -669,6 +776,174 @@ function _batchProcessNextChunk() {
     }
 }
 
+// ---------------------------------------------------------------------------
+// Parameter bundles
+//
+// The server packs many parameter sets into OSC #bundle datagrams.
+// udpreceive unpacks a bundle into its messages, so each entry arrives as
+//   /bundle_set_param  bundle_id seq track_index device_index parameter_index value
+// and is only stored.  A final
+//   /bundle_commit     bundle_id expected_count request_id
+// applies the stored entries in bounded chunks (same deferred-Task pattern
+// as batch_set_hidden_params) and sends ONE aggregated reply, including the
+// seq numbers of entries that never arrived so the server can resend them.
+// ---------------------------------------------------------------------------
+var BUNDLE_CHUNK_SIZE  = 16;   // parameter sets per deferred chunk
+var BUNDLE_CHUNK_DELAY = 10;   // ms between chunks
+var BUNDLE_TTL_MS      = 10000; // uncommitted bundles are dropped after this
+var BUNDLE_RESULT_CACHE = 16;  // replies kept for duplicate (retried) commits
+
+var _bundles       = {};   // bundle_id -> {entries: {seq: entry}, count, created}
+var _bundleApply   = null; // commit currently being applied
+var _bundleQueue   = [];   // commits waiting for _bundleApply
+var _bundleResults = [];   // [[bundle_id, result], ...] most recent last
+
+function handleBundleSetParam(args) {
+    // args: [bundle_id (string), seq (int), track_index (int), device_index (int),
+    //        parameter_index (int), value (float)]
+    if (args.length < 6) return;
+    var bundleId = args[0].toString();
+    var b = _bundles[bundleId];
+    if (!b) {
+        b = _bundles[bundleId] = { entries: {}, count: 0, created: Date.now() };
+    }
+    var seq = parseInt(args[1]);
+    if (!b.entries.hasOwnProperty(seq)) b.count++;
+    b.entries[seq] = {
+        track:  parseInt(args[2]),
+        device: parseInt(args[3]),
+        index:  parseInt(args[4]),
+        value:  parseFloat(args[5])
+    };
+}
+
+function handleBundleCommit(args) {
+    // args: [bundle_id (string), expected_count (int), request_id (string)]
+    if (args.length < 3) {
+        sendError("bundle_commit requires bundle_id, expected_count, request_id", "");
+        return;
+    }
+    var bundleId  = args[0].toString();
+    var expected  = parseInt(args[1]);
+    var requestId = args[2].toString();
+
+    // A retried commit whose first reply was lost: answer from the cache
+    for (var r = 0; r < _bundleResults.length; r++) {
+        if (_bundleResults[r][0] === bundleId) {
+            sendResult(_bundleResults[r][1], requestId);
+            return;
+        }
+    }
+    if (_bundleApply) {
+        // A retry of a commit that is already running or queued gets the
+        // same reply once the apply finishes
+        if (_bundleApply.bundleId === bundleId) {
+            _bundleApply.requestIds.push(requestId);
+            return;
+        }
+        for (var q = 0; q < _bundleQueue.length; q++) {
+            if (_bundleQueue[q][0] === bundleId) {
+                _bundleQueue[q][2].push(requestId);
+                return;
+            }
+        }
+        _bundleQueue.push([bundleId, expected, [requestId]]);
+        return;
+    }
+    _startBundleApply(bundleId, expected, [requestId]);
+}
+
+function _startBundleApply(bundleId, expected, requestIds) {
+    // Forget bundles whose commit never arrived
+    var now = Date.now();
+    for (var id in _bundles) {
+        if (_bundles.hasOwnProperty(id) && id !== bundleId && now - _bundles[id].created > BUNDLE_TTL_MS) {
+            delete _bundles[id];
+        }
+    }
+
+    var b = _bundles[bundleId] || { entries: {}, count: 0 };
+    delete _bundles[bundleId];
+
+    var list = [];
+    var missing = [];
+    for (var seq = 0; seq < expected; seq++) {
+        if (b.entries.hasOwnProperty(seq)) list.push(b.entries[seq]);
+        else missing.push(seq);
+    }
+
+    _bundleApply = {
+        bundleId:   bundleId,
+        requestIds: requestIds,
+        list:       list,
+        missing:    missing,
+        expected:   expected,
+        cursor:     0,
+        okCount:    0,
+        failCount:  0,
+        errors:     [],
+        api:        new LiveAPI(null, "live_set")
+    };
+    _bundleApplyNextChunk();
+}
+
+function _bundleApplyNextChunk() {
+    if (!_bundleApply) return;
+    var s = _bundleApply;
+
+    var end = Math.min(s.cursor + BUNDLE_CHUNK_SIZE, s.list.length);
+    for (var i = s.cursor; i < end; i++) {
+        var e = s.list[i];
+        try {
+            // Reuse one LiveAPI cursor via goto() instead of new LiveAPI() per param
+            s.api.goto("live_set tracks " + e.track + " devices " + e.device + " parameters " + e.index);
+            if (!s.api.id || parseInt(s.api.id) === 0) {
+                s.errors.push({ track: e.track, device: e.device, index: e.index, error: "not found" });
+                s.failCount++;
+                continue;
+            }
+            var minVal = parseFloat(s.api.get("min"));
+            var maxVal = parseFloat(s.api.get("max"));
+            s.api.set("value", Math.max(minVal, Math.min(maxVal, e.value)));
+            s.okCount++;
+        } catch (err) {
+            s.errors.push({ track: e.track, device: e.device, index: e.index, error: safeErrorMessage(err) });
+            s.failCount++;
+        }
+    }
+    s.cursor = end;
+
+    if (s.cursor < s.list.length) {
+        var t = new Task(_bundleApplyNextChunk);
+        t.schedule(BUNDLE_CHUNK_DELAY);
+        return;
+    }
+
+    var result = {
+        bundle_id:     s.bundleId,
+        params_set:    s.okCount,
+        params_failed: s.failCount,
+        expected:      s.expected,
+        received:      s.list.length
+    };
+    if (s.missing.length > 0) result.missing = s.missing;
+    if (s.errors.length > 0) result.errors = s.errors;
+
+    _bundleResults.push([s.bundleId, result]);
+    if (_bundleResults.length > BUNDLE_RESULT_CACHE) _bundleResults.shift();
+    _bundleApply = null;
+    for (var k = 0; k < s.requestIds.length; k++) sendResult(result, s.requestIds[k]);
+
+    if (_bundleQueue.length > 0) {
+        var next = _bundleQueue.shift();
+        var nt = new Task(function () {
+            if (!_bundleApply) _startBundleApply(next[0], next[1], next[2]);
+            else _bundleQueue.unshift(next);
+        });
+        nt.schedule(BUNDLE_CHUNK_DELAY);
+    }
+}
+
 function handleCheckDashboard(args) {
     var requestId = (args.length > 0) ? args[0].toString() : "";
     var response = {
@@ -680,7 +955,7 @@ function handleCheckDashboard(args) {
         },
         id: requestId
     };
-    sendResponse(JSON.stringify(response));
+    sendResponse(JSON.stringify(response), requestId);
 }
 
 // ---------------------------------------------------------------------------
@@ -1749,8 +2024,8 @@ function handleModifyClipNotes(args) {
     }
     var trackIdx  = parseInt(args[0]);
     var clipIdx   = parseInt(args[1]);
-    var modsB64   = args[2].toString();
-    var requestId = args[3].toString();
+    var modsB64   = _reassembleB64(args, 2);
+    var requestId = args[args.length - 1].toString();
 
     var clipApi = _getClipApi(trackIdx, clipIdx);
     if (!clipApi) {
@@ -1796,8 +2071,8 @@ function handleRemoveClipNotesById(args) {
     }
     var trackIdx  = parseInt(args[0]);
     var clipIdx   = parseInt(args[1]);
-    var idsB64    = args[2].toString();
-    var requestId = args[3].toString();
+    var idsB64    = _reassembleB64(args, 2);
+    var requestId = args[args.length - 1].toString();
 
     var clipApi = _getClipApi(trackIdx, clipIdx);
     if (!clipApi) {
@@ -2232,7 +2507,92 @@ function _reassembleB64(args, startIdx) {
     for (var a = startIdx; a < args.length - 1; a++) {
         parts.push(args[a].toString());
     }
-    return parts.length > 0 ? parts.join("") : null;
+    if (parts.length === 0) return null;
+    var joined = parts.join("");
+    // Large payloads arrive beforehand via /upload_chunk and are referenced here
+    if (joined.indexOf(UPLOAD_REF_PREFIX) === 0) {
+        return _takeUpload(joined.substring(UPLOAD_REF_PREFIX.length));
+    }
+    return joined;
+}
+
+// ---------------------------------------------------------------------------
+// Windowed payload upload
+//
+// Long base64 payloads (batch_set_hidden_params, modify_clip_notes, ...)
+// fail as single OSC symbols, so the server uploads them first:
+//   /upload_chunk   upload_id chunk_index total_chunks piece
+// is stored without a reply; the server sends a window of chunks, then
+//   /upload_status  upload_id request_id
+// which replies with the received chunk ranges so only the gaps are resent.
+// The command itself then carries "UPLOAD.<upload_id>" in place of the
+// payload ("." is not a base64url character, so it can't be mistaken for
+// one) and _reassembleB64 swaps the uploaded payload in.
+// ---------------------------------------------------------------------------
+var UPLOAD_REF_PREFIX = "UPLOAD.";
+var UPLOAD_TTL_MS     = 30000;  // uploads are kept this long (a retried command may reuse one)
+
+var _uploads = {};  // upload_id -> {total, pieces: {idx: piece}, count, created}
+
+function handleUploadChunk(args) {
+    // args: [upload_id (string), chunk_index (int), total_chunks (int), piece (string, may be split)]
+    if (args.length < 4) return;
+    var uploadId = args[0].toString();
+    var now = Date.now();
+    var u = _uploads[uploadId];
+    if (!u) {
+        for (var id in _uploads) {
+            if (_uploads.hasOwnProperty(id) && now - _uploads[id].created > UPLOAD_TTL_MS) {
+                delete _uploads[id];
+            }
+        }
+        u = _uploads[uploadId] = { total: parseInt(args[2]), pieces: {}, count: 0, created: now };
+    }
+    var idx = parseInt(args[1]);
+    var parts = [];
+    for (var a = 3; a < args.length; a++) parts.push(args[a].toString());
+    if (!u.pieces.hasOwnProperty(idx)) u.count++;
+    u.pieces[idx] = parts.join("");
+}
+
+function handleUploadStatus(args) {
+    // args: [upload_id (string), request_id (string)]
+    if (args.length < 2) {
+        sendError("upload_status requires upload_id, request_id", "");
+        return;
+    }
+    var uploadId  = args[0].toString();
+    var requestId = args[1].toString();
+    var u = _uploads[uploadId];
+    if (!u) {
+        sendResult({ upload_id: uploadId, received: [], count: 0, complete: false }, requestId);
+        return;
+    }
+    // Received chunks as [first, last] ranges
+    var ranges = [];
+    for (var i = 0; i < u.total; i++) {
+        if (!u.pieces.hasOwnProperty(i)) continue;
+        if (ranges.length > 0 && ranges[ranges.length - 1][1] === i - 1) {
+            ranges[ranges.length - 1][1] = i;
+        } else {
+            ranges.push([i, i]);
+        }
+    }
+    sendResult({
+        upload_id: uploadId,
+        total:     u.total,
+        count:     u.count,
+        received:  ranges,
+        complete:  u.count >= u.total
+    }, requestId);
+}
+
+function _takeUpload(uploadId) {
+    var u = _uploads[uploadId];
+    if (!u || u.count < u.total) return null;
+    var parts = [];
+    for (var i = 0; i < u.total; i++) parts.push(u.pieces[i]);
+    return parts.join("");
 }
 
 // ---------------------------------------------------------------------------
@@ -2249,7 +2609,7 @@ function sendResult(result, requestId) {
         result: result,
         id: requestId
     };
-    sendResponse(JSON.stringify(response));
+    sendResponse(JSON.stringify(response), requestId);
 }
 
 function safeErrorMessage(e) {
@@ -2267,7 +2627,7 @@ function sendError(message, requestId) {
         message: message,
         id: requestId
     };
-    sendResponse(JSON.stringify(response));
+    sendResponse(JSON.stringify(response), requestId);
 }
 
 // ---------------------------------------------------------------------------
@@ -2289,51 +2649,83 @@ function sendError(message, requestId) {
 //   3. Each piece: base64 → URL-safe → wrap in envelope → base64 → URL-safe
 //   4. ALL chunks deferred via Task.schedule() (not synchronous)
 //   5. Each outlet() sends ~3.6KB — well under 8KB limit
+//   6. Envelopes carry the request id ("_i") so the server's receiver
+//      thread can route chunks while other requests are outstanding
 //
 // Key safety properties:
 //   - Never creates the full base64 string in memory
 //   - .replace() for URL-safe conversion is O(n) native, not O(n^2) loop
 //   - Each operation works on ≤ ~3.6KB strings — no memory pressure
 //   - First chunk is deferred (not synchronous from discovery callback)
+//
+// Raw mode (opted into by the server with /response_mode raw):
+//   Responses are proper OSC messages instead of base64 in the address:
+//     /r  request_id (s)  chunk_index (i)  total_chunks (i)  json_piece (s)
+//   The JSON travels as a typed string argument behind a real OSC address,
+//   so none of the base64 workarounds above apply: no encoding in JS, no
+//   33% inflation, 6000-char pieces (still under the ~8KB outlet limit)
+//   and only RAW_CHUNK_DELAY between them.  Max messages carry ints,
+//   floats and symbols only, so [js] cannot emit OSC blobs; the server
+//   accepts 'b' blob pieces as well should another sender provide them.
 // ---------------------------------------------------------------------------
 var RESPONSE_PIECE_SIZE  = 2000;  // chars of RAW JSON per chunk (conservative)
 var RESPONSE_CHUNK_DELAY = 50;    // ms between outlet() calls
+var RAW_PIECE_SIZE       = 6000;  // chars of JSON per /r message
+var RAW_CHUNK_DELAY      = 5;     // ms between /r messages (localhost)
+var _responseMode        = "base64";  // "base64" (default, old servers) or "raw"
 var _responseSendState   = null;  // global state for deferred chunk sending
 var _responseSendQueue   = [];    // queued responses when send is busy
+var RESPONSE_BUFFER_MS   = 15000; // chunked responses stay resendable this long
+var RESPONSE_BUFFER_MAX  = 8;     // ...up to this many of the most recent ones
+var _sentResponses       = {};    // request_id -> {jsonStr, totalChunks, raw, created}
 
 function _toUrlSafe(b64) {
     // O(n) native .replace() — NOT char-by-char concatenation
     return b64.replace(/\+/g, "-").replace(/\//g, "_").replace(/=/g, "");
 }
 
-function sendResponse(jsonStr) {
+function sendResponse(jsonStr, requestId, indices, raw) {
+    // indices: chunk indices to (re)send; omitted = the whole response
+    // raw: resend in the mode the response was first sent in; omitted = current mode
     // If a chunked send is in progress, queue this response (regardless of size)
     if (_responseSendState) {
-        _responseSendQueue.push(jsonStr);
+        _responseSendQueue.push([jsonStr, requestId, indices, raw]);
         post("sendResponse: queued (send busy), queue depth=" + _responseSendQueue.length + "\n");
         return;
     }
 
-    // Small response — encode + send directly (backward compatible)
-    if (jsonStr.length <= 1500) {
-        outlet(0, _toUrlSafe(_base64encode(jsonStr)));
+    if (raw === undefined) raw = _responseMode === "raw";
+    var pieceSize = raw ? RAW_PIECE_SIZE : RESPONSE_PIECE_SIZE;
+
+    // Small response — send directly (base64 form is backward compatible)
+    if (!indices && jsonStr.length <= (raw ? RAW_PIECE_SIZE : 1500)) {
+        if (raw) outlet(0, "/r", requestId || "", 0, 1, jsonStr);
+        else outlet(0, _toUrlSafe(_base64encode(jsonStr)));
         return;
     }
 
     // Large response — store raw JSON, defer ALL chunk sending via Task
 
-    var totalChunks = Math.ceil(jsonStr.length / RESPONSE_PIECE_SIZE);
-    post("sendResponse: " + jsonStr.length + " chars JSON -> " + totalChunks + " chunks\n");
+    var totalChunks = Math.ceil(jsonStr.length / pieceSize);
+    if (!indices) {
+        post("sendResponse: " + jsonStr.length + " chars JSON -> " + totalChunks + " chunks\n");
+        indices = [];
+        for (var c = 0; c < totalChunks; c++) indices.push(c);
+        if (requestId) _bufferResponse(jsonStr, requestId, totalChunks, raw);
+    }
 
     _responseSendState = {
         jsonStr:     jsonStr,
         totalChunks: totalChunks,
-        idx:         0
+        requestId:   requestId || "",
+        indices:     indices,
+        pos:         0,
+        raw:         raw
     };
 
     // DEFER first chunk — don't send synchronously from discovery callback
     var t = new Task(_sendNextResponsePiece);
-    t.schedule(RESPONSE_CHUNK_DELAY);
+    t.schedule(raw ? RAW_CHUNK_DELAY : RESPONSE_CHUNK_DELAY);
 }
 
 function _sendNextResponsePiece() {
@@ -2342,18 +2734,26 @@ function _sendNextResponsePiece() {
 
     try {
         // Extract this piece of raw JSON
-        var start = s.idx * RESPONSE_PIECE_SIZE;
-        var end   = Math.min(start + RESPONSE_PIECE_SIZE, s.jsonStr.length);
+        var idx   = s.indices[s.pos];
+        var size  = s.raw ? RAW_PIECE_SIZE : RESPONSE_PIECE_SIZE;
+        var start = idx * size;
+        var end   = Math.min(start + size, s.jsonStr.length);
         var piece = s.jsonStr.substring(start, end);
 
-        // Encode piece independently → URL-safe base64 (O(n) via .replace())
-        var pieceB64 = _toUrlSafe(_base64encode(piece));
+        if (s.raw) {
+            outlet(0, "/r", s.requestId, idx, s.totalChunks, piece);
+        } else {
+            // Encode piece independently → URL-safe base64 (O(n) via .replace())
+            var pieceB64 = _toUrlSafe(_base64encode(piece));
 
-        // Wrap in chunk envelope, encode envelope, send
-        // pieceB64 is pure [A-Za-z0-9_-] — no escaping needed in the JSON string
-        var envelope = '{"_c":' + s.idx + ',"_t":' + s.totalChunks + ',"_d":"' + pieceB64 + '"}';
-        var envelopeB64 = _toUrlSafe(_base64encode(envelope));
-        outlet(0, envelopeB64);
+            // Wrap in chunk envelope, encode envelope, send
+            // pieceB64 is pure [A-Za-z0-9_-] — no escaping needed in the JSON string
+            var envelope = '{"_c":' + idx + ',"_t":' + s.totalChunks +
+                (s.requestId ? ',"_i":' + JSON.stringify(s.requestId) : '') +
+                ',"_d":"' + pieceB64 + '"}';
+            var envelopeB64 = _toUrlSafe(_base64encode(envelope));
+            outlet(0, envelopeB64);
+        }
     } catch (e) {
         post("_sendNextResponsePiece error: " + e.toString() + "\n");
         _responseSendState = null;
@@ -2361,10 +2761,10 @@ function _sendNextResponsePiece() {
         return;
     }
 
-    s.idx++;
-    if (s.idx < s.totalChunks) {
+    s.pos++;
+    if (s.pos < s.indices.length) {
         var t = new Task(_sendNextResponsePiece);
-        t.schedule(RESPONSE_CHUNK_DELAY);
+        t.schedule(s.raw ? RAW_CHUNK_DELAY : RESPONSE_CHUNK_DELAY);
     } else {
         _responseSendState = null;
         _drainResponseQueue();
@@ -2374,13 +2774,75 @@ function _sendNextResponsePiece() {
 function _drainResponseQueue() {
     while (_responseSendQueue.length > 0) {
         var next = _responseSendQueue.shift();
-        sendResponse(next);
+        sendResponse(next[0], next[1], next[2], next[3]);
         // If sendResponse started a chunked send, stop draining —
         // the next drain will happen when _sendNextResponsePiece completes
         if (_responseSendState) break;
     }
 }
 
+// ---------------------------------------------------------------------------
+// Chunk retransmission
+//
+// Chunked responses stay buffered for RESPONSE_BUFFER_MS.  When the server
+// notices gaps it sends
+//   /resend_chunks  request_id chunk_index...
+// and only those chunks go out again, so a lost datagram no longer costs a
+// full re-run of the command (e.g. walking the LOM again for discovery).
+// Unknown or expired request ids are ignored; the server then falls back to
+// retrying the command.
+// ---------------------------------------------------------------------------
+function _bufferResponse(jsonStr, requestId, totalChunks, raw) {
+    var now = Date.now();
+    var ids = [];
+    for (var id in _sentResponses) {
+        if (!_sentResponses.hasOwnProperty(id)) continue;
+        if (now - _sentResponses[id].created > RESPONSE_BUFFER_MS) delete _sentResponses[id];
+        else ids.push(id);
+    }
+    if (ids.length >= RESPONSE_BUFFER_MAX) {
+        ids.sort(function (a, b) { return _sentResponses[a].created - _sentResponses[b].created; });
+        for (var i = 0; i <= ids.length - RESPONSE_BUFFER_MAX; i++) delete _sentResponses[ids[i]];
+    }
+    _sentResponses[requestId] = { jsonStr: jsonStr, totalChunks: totalChunks, raw: raw, created: now };
+}
+
+function handleResendChunks(args) {
+    // args: [request_id (string), chunk_index (int)...]
+    if (args.length < 2) return;
+    var requestId = args[0].toString();
+    var buffered  = _sentResponses[requestId];
+    if (!buffered || Date.now() - buffered.created > RESPONSE_BUFFER_MS) {
+        post("resend_chunks: response " + requestId + " no longer buffered\n");
+        return;
+    }
+    var indices = [];
+    for (var a = 1; a < args.length; a++) {
+        var idx = parseInt(args[a]);
+        if (idx >= 0 && idx < buffered.totalChunks) indices.push(idx);
+    }
+    if (indices.length === 0) return;
+    post("resend_chunks: " + requestId + " -> " + indices.length + " chunk(s)\n");
+    sendResponse(buffered.jsonStr, requestId, indices, buffered.raw);
+}
+
+function handleResponseMode(args) {
+    // args: [mode ("raw" | "base64"), request_id (string)]
+    if (args.length < 2) {
+        sendError("response_mode requires mode, request_id", "");
+        return;
+    }
+    var mode      = args[0].toString();
+    var requestId = args[1].toString();
+    if (mode !== "raw" && mode !== "base64") {
+        sendError("Unknown response mode: " + mode, requestId);
+        return;
+    }
+    _responseMode = mode;
+    post("response_mode: " + mode + "\n");
+    sendResult({ response_mode: mode }, requestId);  // already in the new mode
+}
+
 // ---------------------------------------------------------------------------
 // Base64 encode — Max's JS engine doesn't have btoa
 // ---------------------------------------------------------------------------
@@ -2774,9 +3236,91 @@ function handleSetGrooveProperties(args) {
 // Max's LiveAPI in [js] supports callbacks via the second constructor arg.
 // When a property changes, the callback fires with the new value.
 // We store changes in a ring buffer and return them on demand.
+//
+// Push mode (/event_stream port|inline): changes are no longer buffered
+// here.  Each observer's latest change waits in _eventOutbox (a newer change
+// replaces it and is counted as coalesced) and every EVENT_FLUSH_MS the
+// outbox goes out as
+//   /ev  seq (i)  {"events": [{key, property, value, time, coalesced}, ...]} (s)
+// on the right outlet ("port", [udpsend 127.0.0.1 9883]) or on the response
+// outlet ("inline", for patches without the second udpsend).  "port" mode
+// first sends a hello event so the server can tell whether it arrives.
 // ---------------------------------------------------------------------------
 var _observers = {};       // key = "path:property", value = {api, changes[]}
 var MAX_OBSERVER_CHANGES = 200;  // ring buffer cap per observer
+var EVENT_FLUSH_MS       = 20;   // push coalescing window
+var EVENT_MAX_MESSAGE    = 4000; // chars of JSON per /ev message (outlet symbol limit ~8KB)
+var _eventMode           = "off";  // "off" (poll), "port" or "inline"
+var _eventOutbox         = {};     // key -> pending event
+var _eventSeq            = 0;
+var _eventFlushPending   = false;
+
+function _pushEvent(key, entry) {
+    var pending = _eventOutbox[key];
+    entry.key = key;
+    entry.coalesced = pending ? pending.coalesced + 1 : 0;
+    _eventOutbox[key] = entry;
+    if (!_eventFlushPending) {
+        _eventFlushPending = true;
+        var t = new Task(_flushEvents);
+        t.schedule(EVENT_FLUSH_MS);
+    }
+}
+
+function _flushEvents() {
+    _eventFlushPending = false;
+    if (_eventMode === "off") {
+        _eventOutbox = {};
+        return;
+    }
+    var batch = [];
+    var size = 0;
+    for (var key in _eventOutbox) {
+        if (!_eventOutbox.hasOwnProperty(key)) continue;
+        var json = JSON.stringify(_eventOutbox[key]);
+        if (batch.length > 0 && size + json.length > EVENT_MAX_MESSAGE) {
+            _sendEvents(batch);
+            batch = [];
+            size = 0;
+        }
+        batch.push(json);
+        size += json.length + 1;
+    }
+    _eventOutbox = {};
+    if (batch.length > 0) _sendEvents(batch);
+}
+
+function _sendEvents(jsonEvents) {
+    _eventSeq++;
+    outlet(_eventMode === "port" ? 1 : 0, "/ev", _eventSeq, '{"events":[' + jsonEvents.join(",") + ']}');
+}
+
+function handleEventStream(args) {
+    // args: [mode ("port" | "inline" | "off"), request_id (string)]
+    if (args.length < 2) {
+        sendError("event_stream requires mode, request_id", "");
+        return;
+    }
+    var mode      = args[0].toString();
+    var requestId = args[1].toString();
+    if (mode !== "port" && mode !== "inline" && mode !== "off") {
+        sendError("Unknown event mode: " + mode, requestId);
+        return;
+    }
+    _eventMode = mode;
+    _eventOutbox = {};
+    var keys = [];
+    for (var key in _observers) {
+        if (!_observers.hasOwnProperty(key)) continue;
+        keys.push(key);
+        _observers[key].changes = [];  // pushed from now on, nothing left to poll
+        _observers[key].dropped = 0;
+    }
+    sendResult({ event_mode: mode, observers: keys }, requestId);
+    if (mode === "port") {
+        outlet(1, "/ev", 0, '{"hello":true,"events":[]}');
+    }
+}
 
 function handleObserveProperty(args) {
     // args: [lom_path (string), property_name (string), request_id (string)]
@@ -2814,6 +3358,10 @@ function handleObserveProperty(args) {
                     value: args[1],
                     time: Date.now()
                 };
+                if (_eventMode !== "off") {
+                    _pushEvent(key, entry);
+                    return;
+                }
                 if (obs.changes.length >= MAX_OBSERVER_CHANGES) {
                     obs.changes.shift();
                     obs.dropped++;
@@ -2869,6 +3417,7 @@ function handleStopObserving(args) {
 
     var changeCount = _observers[key].changes.length;
     delete _observers[key];
+    delete _eventOutbox[key];
 
     sendResult({
         stopped: true,
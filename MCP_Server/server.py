@@ -4,8 +4,8 @@ import socket
 import json
 import logging
 import time
-from dataclasses import dataclass
-from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from contextlib import asynccontextmanager, contextmanager
 from typing import AsyncIterator, Dict, Any, List, Optional, Union
 import uuid
 import base64
@@ -13,9 +13,17 @@ import struct
 import math
 import os
 import gzip
+import hashlib
+import zlib
 import threading
 import functools
+import asyncio
+import itertools
+import operator
+import random
+import select
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime, timezone
 
 # Configure logging
@@ -23,6 +31,161 @@ logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("AbletonMCP-Beta")
 
+# Pipelined TCP protocol: every command carries a request id so many commands
+# can be in flight on one socket and responses are matched back by id.
+# Negotiated on connect — older Remote Scripts fall back to lockstep mode.
+PIPELINE_ENABLED = os.environ.get("ABLETON_MCP_PIPELINE", "1") != "0"
+
+# Pacing around modifying commands:
+#   "ack"          — trust the Remote Script's response as the acknowledgement;
+#                    only back off when it reports queued main-thread work
+#                    (Remote Scripts that don't negotiate "pacing_hints" keep
+#                    the conservative delays)
+#   "conservative" — legacy fixed 100 ms sleeps before and after every
+#                    modifying command (fallback for unstable setups)
+PACING_MODE = os.environ.get("ABLETON_MCP_PACING", "ack")
+_CONSERVATIVE_PACING_DELAY = 0.1
+_PACING_DELAY_PER_QUEUED = 0.005  # back-off per command still queued in Live
+_PACING_MAX_DELAY = 0.1
+
+# Response framing, negotiated on connect:
+#   "length_prefixed" — 5-byte header (flags, big-endian uint32 length) + JSON
+#                       payload, read with recv_into() and parsed once
+#   "newline"         — legacy newline-delimited JSON
+FRAMING_MODE = os.environ.get("ABLETON_MCP_FRAMING", "length_prefixed")
+_FRAME_HEADER = struct.Struct(">BI")
+_FRAME_FLAG_ZLIB = 0x01
+_MAX_FRAME_SIZE = 256 * 1024 * 1024
+
+# Binary UDP packets of (parameter handle, float32 value) pairs; handles come
+# from the Remote Script's resolve_parameter_handle command.
+_HANDLE_PACKET_MAGIC = 0xA7
+_HANDLE_PACKET_HEADER = struct.Struct(">BHHI")  # magic, count, session, sequence number
+_HANDLE_PACKET_ENTRY = struct.Struct(">If")
+_HANDLE_PACKET_MAX_ENTRIES = 160  # keeps datagrams under a typical 1500-byte MTU
+
+# Realtime UDP updates per parameter per second; faster updates are held and
+# superseded so only the newest value goes out (0 disables the limit).
+REALTIME_MAX_RATE = float(os.environ.get("ABLETON_MCP_REALTIME_RATE", "200"))
+_REALTIME_KEY_LIMIT = 1024  # send times kept before stale ones are evicted
+
+# zlib compression of large responses (requires length-prefixed framing).
+# The Remote Script compresses payloads above the threshold we send it.
+COMPRESSION_ENABLED = os.environ.get("ABLETON_MCP_COMPRESSION", "1") != "0"
+COMPRESSION_THRESHOLD = int(os.environ.get("ABLETON_MCP_COMPRESSION_THRESHOLD", "4096"))
+
+# Client-side totals across all connections, shown on the dashboard
+_compression_stats = {"frames": 0, "wire_bytes": 0, "raw_bytes": 0, "decompress_ms": 0.0}
+_compression_stats_lock = threading.Lock()
+
+# Connection pool to the Remote Script: concurrent tool calls each get their
+# own socket.  Idle connections are re-validated with a round trip after
+# _POOL_HEALTH_CHECK_IDLE seconds.
+POOL_SIZE = int(os.environ.get("ABLETON_MCP_POOL_SIZE", "4"))
+_POOL_CHECKOUT_TIMEOUT = 30.0
+_POOL_HEALTH_CHECK_IDLE = 30.0
+
+# Heartbeat / connection state machine (see AbletonConnectionMonitor)
+_HEARTBEAT_INTERVAL = 2.0
+_HEARTBEAT_TIMEOUT = 2.0
+_HEARTBEAT_SLOW = 1.0               # slower round trips mark the link degraded
+_HEARTBEAT_FAILURE_THRESHOLD = 3    # failures before reconnecting / attempts before down
+_HEARTBEAT_BACKOFF_BASE = 0.5
+_HEARTBEAT_BACKOFF_MAX = 30.0
+_HEARTBEAT_TRANSITION_LOG = 50
+# Remote Scripts without the "heartbeat" command only get a socket check,
+# plus a get_session_info round trip after this long without any response
+_HEARTBEAT_LEGACY_PROBE_IDLE = 30.0
+
+# Items per page when a client-side loop walks a paginated command
+_PAGE_SIZE = 2000
+
+# Adaptive timeouts: once a command has _LATENCY_MIN_SAMPLES measurements its
+# timeout is p99 x _LATENCY_MARGIN + _LATENCY_SLACK, clamped to the bounds
+# below.  Modifying Remote Script commands keep their hand-tuned default as
+# the floor (it can only widen): most of them are not idempotent, and one slow
+# load_instrument_or_effect must not time out early.
+ADAPTIVE_TIMEOUTS = os.environ.get("ABLETON_MCP_ADAPTIVE_TIMEOUTS", "1") != "0"
+ADAPTIVE_TIMEOUT_MIN = float(os.environ.get("ABLETON_MCP_TIMEOUT_MIN", "0.5"))
+ADAPTIVE_TIMEOUT_MAX = float(os.environ.get("ABLETON_MCP_TIMEOUT_MAX", "60"))
+_ADAPTIVE_TIMEOUT_MIN_MODIFYING = 15.0
+_LATENCY_WINDOW = 200
+_LATENCY_MIN_SAMPLES = 20
+_LATENCY_MARGIN = 3.0
+_LATENCY_SLACK = 0.25
+
+
+class LatencyTracker:
+    """Rolling per-command latency samples and the timeouts derived from them.
+
+    Once a command has enough samples its timeout becomes
+    p99 × margin + slack, clamped to [floor, ADAPTIVE_TIMEOUT_MAX]; until
+    then the caller's hand-tuned default applies.  Latencies can be recorded
+    per unit (e.g. per parameter of a batch) and scaled back up by the
+    caller's unit count.
+    """
+
+    def __init__(self, window: int = _LATENCY_WINDOW):
+        self.window = window
+        self._samples: Dict[str, deque] = {}
+        self._timeouts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float, units: int = 1):
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(seconds / max(1, units))
+
+    def record_timeout(self, key: str, timeout: float, units: int = 1):
+        """A timeout counts as a (censored) sample so the estimate grows when Live slows down."""
+        self.record(key, timeout, units)
+        with self._lock:
+            self._timeouts[key] = self._timeouts.get(key, 0) + 1
+
+    @staticmethod
+    def _percentile(ordered: List[float], pct: float) -> float:
+        return ordered[min(len(ordered) - 1, int(pct * len(ordered)))]
+
+    def timeout_for(self, key: str, default: float, units: int = 1,
+                    floor: float = ADAPTIVE_TIMEOUT_MIN) -> float:
+        """Timeout for the next ``key`` command covering ``units`` units of work."""
+        if not ADAPTIVE_TIMEOUTS:
+            return default
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None or len(samples) < _LATENCY_MIN_SAMPLES:
+                return default
+            p99 = self._percentile(sorted(samples), 0.99)
+        estimate = p99 * max(1, units) * _LATENCY_MARGIN + _LATENCY_SLACK
+        return min(ADAPTIVE_TIMEOUT_MAX, max(floor, estimate))
+
+    def metrics(self) -> List[Dict[str, Any]]:
+        """Per-command histogram summary (ms), busiest commands first."""
+        with self._lock:
+            snapshot = {key: sorted(samples) for key, samples in self._samples.items()}
+            timeouts = dict(self._timeouts)
+        rows = []
+        for key, ordered in snapshot.items():
+            rows.append({
+                "command": key,
+                "samples": len(ordered),
+                "p50_ms": round(self._percentile(ordered, 0.50) * 1000, 1),
+                "p95_ms": round(self._percentile(ordered, 0.95) * 1000, 1),
+                "p99_ms": round(self._percentile(ordered, 0.99) * 1000, 1),
+                "max_ms": round(ordered[-1] * 1000, 1),
+                "timeouts": timeouts.get(key, 0),
+            })
+        rows.sort(key=lambda r: r["samples"], reverse=True)
+        return rows
+
+
+# Shared by every pooled Remote Script connection / the M4L bridge
+_ableton_latency = LatencyTracker()
+_m4l_latency = LatencyTracker()
+
+
 @dataclass
 class AbletonConnection:
     host: str
@@ -30,6 +193,10 @@ class AbletonConnection:
     sock: socket.socket = None
     _udp_sock: socket.socket = None
     _udp_port: int = 9882
+    pipelined: bool = PIPELINE_ENABLED
+    pacing: str = PACING_MODE
+    framing: str = FRAMING_MODE
+    compression: bool = COMPRESSION_ENABLED
     
     def connect(self) -> bool:
         """Connect to the Ableton Remote Script socket server"""
@@ -40,8 +207,11 @@ class AbletonConnection:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.sock.settimeout(5.0)
             self.sock.connect((self.host, self.port))
-            self._recv_buffer = ""  # Clear buffer on new connection
+            self._recv_buffer = bytearray()  # Clear buffer on new connection
+            self._protocol_features = set()  # negotiation itself is newline-framed
             logger.info("Connected to Ableton at %s:%s", self.host, self.port)
+            if self._requested_features() and not self._negotiate_protocol():
+                raise ConnectionError("Protocol negotiation failed")
             return True
         except Exception as e:
             logger.error("Failed to connect to Ableton: %s", e)
@@ -55,7 +225,13 @@ class AbletonConnection:
     
     def disconnect(self):
         """Disconnect from the Ableton Remote Script"""
+        self._pipeline_active = False
         if self.sock:
+            try:
+                # shutdown() wakes the pipeline reader thread blocked in recv()
+                self.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
             try:
                 self.sock.close()
             except Exception as e:
@@ -70,8 +246,250 @@ class AbletonConnection:
             finally:
                 self._udp_sock = None
 
+        self._fail_pending(ConnectionError("Disconnected from Ableton"))
+
     def __post_init__(self):
-        self._recv_buffer = ""
+        self._recv_buffer = bytearray()
+        self._pipeline_active = False
+        self._reader_stopped = False
+        self._protocol_features: set = set()
+        self._pending: Dict[str, Future] = {}
+        self._pending_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._request_ids = itertools.count(1)
+        self._lock = threading.RLock()  # one lockstep request/response at a time
+        # Realtime datagrams carry (session, seq) so the Remote Script can drop
+        # reordered values; a new session tells it this client restarted.
+        self._udp_session = random.getrandbits(16)
+        self._udp_seq = itertools.count(1)
+        self.last_response_at = 0.0  # any response (tool traffic or heartbeat) proves liveness
+
+    def _requested_features(self) -> List[str]:
+        """Protocol features to ask the Remote Script for on connect."""
+        features = []
+        if self.pipelined:
+            features.append("request_id")
+        if self.pacing == "ack":
+            features.append("pacing_hints")
+        features.extend(("batch", "heartbeat", "parameter_handles"))
+        if self.framing == "length_prefixed":
+            features.append("length_prefixed")
+            if self.compression:
+                features.append("zlib")
+        return features
+
+    def _negotiate_protocol(self):
+        """Ask the Remote Script for optional protocol features.
+
+        Uses one lockstep round trip.  An error response (e.g. "Unknown command"
+        from an older Remote Script) leaves the connection in lockstep mode.
+        Returns False if no response arrived — a late reply would otherwise be
+        read as the answer to the next command, so the socket must be dropped.
+        """
+        try:
+            hello = {"type": "negotiate_protocol", "params": {
+                "features": self._requested_features(),
+                "compression_threshold": COMPRESSION_THRESHOLD,
+            }}
+            self.sock.sendall((json.dumps(hello) + '\n').encode('utf-8'))
+            response = self.receive_full_response(self.sock, timeout=5.0)
+        except Exception as e:
+            logger.warning("Protocol negotiation failed: %s", e)
+            return False
+        features = response.get("result", {}).get("features", []) if response.get("status") == "success" else []
+        self._protocol_features = set(features)
+        if "request_id" not in features:
+            logger.info("Remote Script does not support pipelining, using lockstep mode")
+            return True
+
+        self.sock.settimeout(None)  # reader thread blocks until data or shutdown()
+        self._pipeline_active = True
+        self._reader_stopped = False
+        threading.Thread(
+            target=self._reader_loop, args=(self.sock,), daemon=True, name="ableton-pipeline-reader"
+        ).start()
+        logger.info("Pipelined protocol enabled (request-id tagged commands)")
+        return True
+
+    def _reader_loop(self, sock):
+        """Background thread: route tagged responses to their pending futures."""
+        try:
+            while True:
+                response = self.receive_full_response(sock, timeout=None)
+                request_id = response.pop("id", None)
+                with self._pending_lock:
+                    future = self._pending.pop(request_id, None)
+                if future is None:
+                    logger.warning("Dropping response for unknown request id %r", request_id)
+                    continue
+                future.set_result(response)
+        except Exception as e:
+            if self._pipeline_active and self.sock is sock:
+                self._reader_stopped = True
+                logger.warning("Pipeline reader stopped: %s", e)
+            self._fail_pending(ConnectionError(f"Connection to Ableton lost: {e}"))
+
+    def _drop_if_reader_stopped(self):
+        """Close a pipelined socket whose reader thread died so the next send reconnects."""
+        if self._pipeline_active and self._reader_stopped:
+            logger.info("Pipeline reader is gone, reconnecting")
+            self.disconnect()
+
+    def _fail_pending(self, error: Exception):
+        """Fail every in-flight pipelined command with the given error."""
+        with self._pending_lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for future in pending:
+            if not future.done():
+                future.set_exception(error)
+
+    def submit_command(self, command_type: str, params: Dict[str, Any] = None) -> Future:
+        """Write a request-id tagged command without waiting for its response.
+
+        Returns a Future resolving to the raw response dict (status/result/message).
+        Only available once pipelining has been negotiated.
+        """
+        if not self._pipeline_active:
+            raise ConnectionError("Pipelined protocol is not active")
+        if self._reader_stopped:
+            # Nothing would read the response; the caller must reconnect
+            raise ConnectionError("Pipeline reader stopped")
+        request_id = str(next(self._request_ids))
+        future: Future = Future()
+        future.request_id = request_id
+        with self._pending_lock:
+            self._pending[request_id] = future
+        command = {"type": command_type, "params": params or {}, "id": request_id}
+        try:
+            with self._send_lock:
+                self.sock.sendall(self._encode_command(command))
+        except Exception:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            raise
+        return future
+
+    def send_commands(self, commands: List[tuple], timeout: float = None) -> List[Dict[str, Any]]:
+        """Send many (command_type, params) pairs and return their raw responses in order.
+
+        With pipelining every command is written before any response is read,
+        so N commands cost one round trip instead of N.  Falls back to
+        sequential send_command() calls in lockstep mode.
+        """
+        self._drop_if_reader_stopped()
+        if not self.sock and not self.connect():
+            raise ConnectionError("Not connected to Ableton")
+        if not self._pipeline_active:
+            responses = []
+            for command_type, params in commands:
+                try:
+                    responses.append({"status": "success", "result": self.send_command(command_type, params, timeout=timeout)})
+                except Exception as e:
+                    responses.append({"status": "error", "message": str(e)})
+            return responses
+
+        futures = [self.submit_command(command_type, params) for command_type, params in commands]
+        deadline = time.time() + (timeout if timeout is not None else 15.0)
+        responses = []
+        for future in futures:
+            try:
+                responses.append(future.result(timeout=max(0.0, deadline - time.time())))
+            except FutureTimeoutError:
+                with self._pending_lock:
+                    self._pending.pop(future.request_id, None)
+                responses.append({"status": "error", "message": "Timeout waiting for response"})
+            except Exception as e:
+                responses.append({"status": "error", "message": str(e)})
+        return responses
+
+    def heartbeat(self, timeout: float = 2.0) -> Optional[float]:
+        """Liveness probe; returns the round-trip latency in seconds, or None if none was needed.
+
+        Remote Scripts with the "heartbeat" feature answer a no-op command.
+        Older ones get a socket-level check only, plus a get_session_info
+        round trip once nothing has been heard for _HEARTBEAT_LEGACY_PROBE_IDLE.
+        Probes bypass send_command: no retry/reconnect and no latency samples.
+        """
+        if not self.sock and not self.connect():
+            raise ConnectionError("Not connected to Ableton")
+        if "heartbeat" in self._protocol_features:
+            return self._probe("heartbeat", timeout)
+        if time.time() - self.last_response_at > _HEARTBEAT_LEGACY_PROBE_IDLE:
+            return self._probe("get_session_info", timeout)
+        self._check_socket()
+        return None
+
+    def _check_socket(self):
+        """Raise if the peer has closed the socket (without sending anything)."""
+        sock = self.sock
+        if sock is None or (self._pipeline_active and self._reader_stopped):
+            raise ConnectionError("Connection to Ableton lost")
+        sock.getpeername()
+        if not self._pipeline_active:  # the pipeline reader notices EOF by itself
+            with self._lock:
+                readable, _, _ = select.select([sock], [], [], 0)
+                if readable and not sock.recv(1, socket.MSG_PEEK):
+                    raise ConnectionError("Ableton closed the connection")
+
+    def _probe(self, command_type: str, timeout: float) -> float:
+        """One round trip outside the retry path; a failed probe drops the socket."""
+        start = time.time()
+        try:
+            if self._pipeline_active:
+                future = self.submit_command(command_type)
+                try:
+                    response = future.result(timeout=timeout)
+                except FutureTimeoutError:
+                    with self._pending_lock:
+                        self._pending.pop(future.request_id, None)
+                    raise socket.timeout(f"No response to '{command_type}' within {timeout:.2f}s")
+            else:
+                with self._lock:
+                    self.sock.sendall(self._encode_command({"type": command_type, "params": {}}))
+                    response = self.receive_full_response(self.sock, timeout=timeout)
+        except Exception:
+            self.disconnect()  # a late reply would be read as the answer to the next command
+            raise
+        if response.get("status") == "error":
+            raise Exception(response.get("message", "Unknown error from Ableton"))
+        return time.time() - start
+
+    def send_batch(self, commands: List[Dict[str, Any]], stop_on_error: bool = True,
+                   timeout: float = None) -> Dict[str, Any]:
+        """Run a list of {"type", "params"} commands as one "batch" command.
+
+        The Remote Script executes every item back to back in a single
+        main-thread tick and returns per-item results.  Item params may
+        reference earlier results with {"$ref": "<item index>.<result key>"}.
+        """
+        if not self.sock and not self.connect():
+            raise ConnectionError("Not connected to Ableton")
+        if "batch" not in self._protocol_features:
+            raise Exception("Remote Script does not support batch commands — update the AbletonMCP Remote Script")
+        if timeout is None:
+            timeout = 15.0 + 0.05 * len(commands)
+        return self.send_command(
+            "batch", {"commands": commands, "stop_on_error": stop_on_error}, timeout=timeout
+        )
+
+    def resolve_parameter_handle(self, track_index: int, device_index: int, parameter_name: str,
+                                 track_type: str = "track") -> Optional[Dict[str, Any]]:
+        """Resolve a device parameter to a numeric handle for send_udp_parameter_values.
+
+        Returns None if the Remote Script does not support handles (the
+        caller falls back to name-addressed UDP commands).
+        """
+        if not self.sock and not self.connect():
+            raise ConnectionError("Not connected to Ableton")
+        if "parameter_handles" not in self._protocol_features:
+            return None
+        return self.send_command("resolve_parameter_handle", {
+            "track_index": track_index,
+            "device_index": device_index,
+            "parameter_name": parameter_name,
+            "track_type": track_type,
+        })
 
     def _ensure_udp_socket(self):
         """Create a UDP socket for real-time parameter sending if not already open."""
@@ -87,53 +505,126 @@ class AbletonConnection:
         sock = self._ensure_udp_socket()
         command = {
             "type": command_type,
-            "params": params or {}
+            "params": params or {},
+            "session": self._udp_session,
+            "seq": next(self._udp_seq),
         }
         payload = json.dumps(command).encode("utf-8")
         sock.sendto(payload, (self.host, self._udp_port))
         logger.debug("Sent UDP command: %s", command_type)
 
+    def send_udp_parameter_values(self, values: List[tuple]) -> int:
+        """Send (handle, value) pairs as binary UDP packets (fire-and-forget).
+
+        Many pairs share one datagram; the Remote Script applies them without
+        any name lookup and drops values for handles it has invalidated.
+        Returns the number of datagrams sent.
+        """
+        sock = self._ensure_udp_socket()
+        datagrams = 0
+        for start in range(0, len(values), _HANDLE_PACKET_MAX_ENTRIES):
+            chunk = values[start:start + _HANDLE_PACKET_MAX_ENTRIES]
+            packet = bytearray(_HANDLE_PACKET_HEADER.pack(
+                _HANDLE_PACKET_MAGIC, len(chunk), self._udp_session, next(self._udp_seq) & 0xFFFFFFFF))
+            for handle, value in chunk:
+                packet += _HANDLE_PACKET_ENTRY.pack(handle, value)
+            sock.sendto(packet, (self.host, self._udp_port))
+            datagrams += 1
+        return datagrams
+
+    def _encode_command(self, command: Dict[str, Any]) -> bytes:
+        """Serialise a command for the wire in the negotiated framing."""
+        payload = json.dumps(command).encode('utf-8')
+        if "length_prefixed" in self._protocol_features:
+            return _FRAME_HEADER.pack(0, len(payload)) + payload
+        return payload + b'\n'
+
     def receive_full_response(self, sock, buffer_size=8192, timeout=15.0):
-        """Receive a complete newline-delimited JSON response and return the parsed object"""
+        """Receive one complete response (framed or newline-delimited) and return the parsed object"""
         sock.settimeout(timeout)
 
         try:
-            while True:
-                # Check if we already have a complete line in the buffer
-                if '\n' in self._recv_buffer:
-                    line, self._recv_buffer = self._recv_buffer.split('\n', 1)
-                    line = line.strip()
-                    if line:
-                        result = json.loads(line)
-                        logger.debug("Received complete response (%d chars)", len(line))
-                        return result
-
-                try:
-                    chunk = sock.recv(buffer_size)
-                    if not chunk:
-                        raise Exception("Connection closed before receiving any data")
-
-                    self._recv_buffer += chunk.decode('utf-8')
-                except socket.timeout:
-                    logger.warning("Socket timeout during receive")
-                    raise
-                except (ConnectionError, BrokenPipeError, ConnectionResetError) as e:
-                    logger.error("Socket connection error during receive: %s", e)
-                    raise
+            try:
+                if "length_prefixed" in self._protocol_features:
+                    response = self._receive_frame(sock)
+                else:
+                    response = self._receive_line(sock, buffer_size)
+                self.last_response_at = time.time()
+                return response
+            except socket.timeout:
+                logger.warning("Socket timeout during receive")
+                raise
+            except (ConnectionError, BrokenPipeError, ConnectionResetError) as e:
+                logger.error("Socket connection error during receive: %s", e)
+                raise
         except (socket.timeout, json.JSONDecodeError):
             raise
         except Exception as e:
             logger.error("Error during receive: %s", e)
             raise
 
+    def _receive_line(self, sock, buffer_size: int) -> Dict[str, Any]:
+        """Newline protocol: accumulate bytes until a newline, decode and parse once."""
+        buf = self._recv_buffer
+        scan_from = 0  # bytes before this were already searched for a newline
+        while True:
+            newline = buf.find(b'\n', scan_from)
+            if newline >= 0:
+                line = bytes(buf[:newline])
+                del buf[:newline + 1]
+                scan_from = 0
+                if line.strip():
+                    logger.debug("Received complete response (%d bytes)", len(line))
+                    return json.loads(line)
+                continue
+            scan_from = len(buf)
+            chunk = sock.recv(buffer_size)
+            if not chunk:
+                raise Exception("Connection closed before receiving any data")
+            buf += chunk
+
+    def _receive_frame(self, sock) -> Dict[str, Any]:
+        """Length-prefixed protocol: read the header, then exactly that many bytes."""
+        flags, length = _FRAME_HEADER.unpack(self._recv_exact(sock, _FRAME_HEADER.size))
+        if length > _MAX_FRAME_SIZE:
+            raise ConnectionError(f"Frame of {length} bytes exceeds the {_MAX_FRAME_SIZE} byte limit")
+        payload = self._recv_exact(sock, length)
+        if flags & _FRAME_FLAG_ZLIB:
+            start = time.perf_counter()
+            payload = zlib.decompress(payload)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with _compression_stats_lock:
+                _compression_stats["frames"] += 1
+                _compression_stats["wire_bytes"] += length
+                _compression_stats["raw_bytes"] += len(payload)
+                _compression_stats["decompress_ms"] += elapsed_ms
+        logger.debug("Received complete response (%d bytes, %d on the wire)", len(payload), length)
+        return json.loads(payload)
+
+    def _recv_exact(self, sock, size: int) -> bytearray:
+        """Fill a preallocated buffer with exactly ``size`` bytes via recv_into()."""
+        out = bytearray(size)
+        view = memoryview(out)
+        # Bytes read past the previous message (e.g. right after negotiation)
+        pos = min(size, len(self._recv_buffer))
+        if pos:
+            view[:pos] = self._recv_buffer[:pos]
+            del self._recv_buffer[:pos]
+        while pos < size:
+            received = sock.recv_into(view[pos:])
+            if not received:
+                raise Exception("Connection closed before receiving any data")
+            pos += received
+        return out
+
     def _reconnect(self) -> bool:
         """Force a fresh reconnection, clearing all state."""
         logger.info("Forcing reconnection to Ableton...")
         self.disconnect()
-        self._recv_buffer = ""
+        self._recv_buffer = bytearray()
         return self.connect()
 
-    # Commands that modify Ableton state (need extra delays for stability)
+    # Commands that modify Ableton state (longer timeout; paced in conservative mode)
     _MODIFYING_COMMANDS = frozenset([
         "create_midi_track", "create_audio_track", "set_track_name",
         "create_clip", "add_notes_to_clip", "set_clip_name",
@@ -173,22 +664,55 @@ class AbletonConnection:
         "set_track_fold", "set_crossfade_assign",
         "duplicate_clip_region", "move_clip_playing_pos", "set_clip_grid",
         "set_simpler_properties", "simpler_sample_action", "manage_sample_slices",
-        "preview_browser_item",
+        "preview_browser_item", "batch",
     ])
 
+    # Never re-sent once they went out: a retry could apply the same edits twice
+    _NO_RETRY_AFTER_SEND = frozenset(["batch"])
+
+    def _paces_conservatively(self) -> bool:
+        """Fixed delays apply unless "ack" pacing was chosen and negotiated."""
+        return self.pacing == "conservative" or "pacing_hints" not in self._protocol_features
+
+    def _pace_after_response(self, response: Dict[str, Any], is_modifying: bool):
+        """Wait (if needed) after a response before the next command goes out.
+
+        In "ack" mode the response itself proves Live executed the command, so
+        the only back-off comes from the Remote Script's queue-depth hint.
+        Without negotiated pacing hints the fixed delays stay as the fallback.
+        """
+        if self._paces_conservatively():
+            if is_modifying:
+                time.sleep(_CONSERVATIVE_PACING_DELAY)
+            return
+        queued = response.get("queue_depth", 0)
+        if queued and not response.get("settled", False):
+            time.sleep(min(_PACING_MAX_DELAY, queued * _PACING_DELAY_PER_QUEUED))
+
     def send_command(self, command_type: str, params: Dict[str, Any] = None, timeout: float = None) -> Dict[str, Any]:
         """Send a command to Ableton and return the response.
 
         Includes automatic retry: if the first attempt fails due to a
         socket error, the connection is reset and the command is retried once.
-        Adds small delays around modifying commands for stability.
+        Pacing around modifying commands follows the connection's pacing
+        mode (acknowledgement-driven by default, fixed delays when conservative).
         """
+        # Pipelined sockets match responses by id and can be shared freely;
+        # a lockstep socket must not interleave two request/response pairs.
+        if self._pipeline_active:
+            return self._send_command(command_type, params, timeout)
+        with self._lock:
+            return self._send_command(command_type, params, timeout)
+
+    def _send_command(self, command_type: str, params: Dict[str, Any], timeout: Optional[float]) -> Dict[str, Any]:
         max_attempts = 2
         is_modifying = command_type in self._MODIFYING_COMMANDS
 
         for attempt in range(1, max_attempts + 1):
+            self._drop_if_reader_stopped()
             if not self.sock and not self.connect():
                 raise ConnectionError("Not connected to Ableton")
+            sent = False
 
             command = {
                 "type": command_type,
@@ -198,29 +722,50 @@ class AbletonConnection:
             try:
                 logger.debug("Sending command: %s (attempt %d)", command_type, attempt)
 
-                # Send the command as newline-delimited JSON
-                self.sock.sendall((json.dumps(command) + '\n').encode('utf-8'))
+                # Set timeout based on measured latency (caller override takes priority)
+                if timeout is None:
+                    timeout = _ableton_latency.timeout_for(
+                        command_type, 15.0 if is_modifying else 10.0,
+                        floor=_ADAPTIVE_TIMEOUT_MIN_MODIFYING if is_modifying else ADAPTIVE_TIMEOUT_MIN,
+                    )
+                sent_at = time.time()
+
+                # Send the command as newline-delimited JSON (request-id tagged
+                # when pipelined, so other threads can share the socket)
+                if self._pipeline_active:
+                    future = self.submit_command(command_type, params)
+                else:
+                    self.sock.sendall(self._encode_command(command))
+                sent = True
 
-                # Add a small delay after sending modifying commands
-                # to give Ableton time to process before we read the response
-                if is_modifying:
-                    time.sleep(0.1)
+                # Conservative pacing: give Ableton time to process before
+                # we read the response
+                if is_modifying and self._paces_conservatively():
+                    time.sleep(_CONSERVATIVE_PACING_DELAY)
 
-                # Set timeout based on command type (caller override takes priority)
-                if timeout is None:
-                    timeout = 15.0 if is_modifying else 10.0
                 # Receive the response (already parsed by receive_full_response)
-                response = self.receive_full_response(self.sock, timeout=timeout)
+                try:
+                    if self._pipeline_active:
+                        try:
+                            response = future.result(timeout=timeout)
+                        except FutureTimeoutError:
+                            with self._pending_lock:
+                                self._pending.pop(future.request_id, None)
+                            raise socket.timeout(f"No response to '{command_type}' within {timeout:.2f}s")
+                    else:
+                        response = self.receive_full_response(self.sock, timeout=timeout)
+                except socket.timeout:
+                    _ableton_latency.record_timeout(command_type, timeout)
+                    raise
+                _ableton_latency.record(command_type, time.time() - sent_at)
                 logger.debug("Response status: %s", response.get('status', 'unknown'))
 
                 if response.get("status") == "error":
                     logger.error("Ableton error: %s", response.get('message'))
                     raise Exception(response.get("message", "Unknown error from Ableton"))
 
-                # Add a small delay after modifying commands complete
-                # to let Ableton settle before the next command
-                if is_modifying:
-                    time.sleep(0.1)
+                # Let Ableton settle before the next command
+                self._pace_after_response(response, is_modifying)
 
                 return response.get("result", {})
 
@@ -228,8 +773,15 @@ class AbletonConnection:
                 logger.error("Command '%s' attempt %d failed: %s", command_type, attempt, e)
                 # Close the broken socket and clear buffer
                 self.disconnect()
-                self._recv_buffer = ""
-
+                self._recv_buffer = bytearray()
+
+                if sent and command_type in self._NO_RETRY_AFTER_SEND:
+                    raise Exception(f"Command '{command_type}' failed after it was sent and was not retried "
+                                    f"(it may have been partly applied): {e}")
+                if sent and is_modifying and isinstance(e, socket.timeout):
+                    # Live may still be executing it; a resend could run it twice
+                    raise Exception(f"Command '{command_type}' timed out and was not retried "
+                                    f"(it may still complete in Live): {e}")
                 if attempt < max_attempts:
                     # Wait briefly then retry with a fresh connection
                     time.sleep(0.3)
@@ -240,6 +792,445 @@ class AbletonConnection:
                     raise Exception(f"Command '{command_type}' failed after {max_attempts} attempts: {e}")
 
 
+class RealtimeStream:
+    """Per-parameter rate limiter in front of the realtime UDP channel.
+
+    Each parameter gets at most one datagram entry per ``1 / max_rate``
+    seconds.  An update arriving sooner is held back; a newer update for the
+    same parameter replaces the held one (superseded values are never sent),
+    and the flusher thread sends whatever is held once the interval elapses,
+    so the last value always lands.
+    """
+
+    def __init__(self, conn: "AbletonConnection", max_rate: float = REALTIME_MAX_RATE):
+        self.conn = conn
+        self.interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        self._last_sent: Dict[tuple, float] = {}
+        self._held: Dict[tuple, tuple] = {}   # key -> ("handle", handle, value) | ("json", type, params)
+        self._cond = threading.Condition()
+        self._flusher: Optional[threading.Thread] = None
+        self._stats = {"updates": 0, "sent": 0, "held": 0, "superseded": 0, "datagrams": 0}
+
+    @staticmethod
+    def _command_key(command_type: str, params: Dict[str, Any]) -> tuple:
+        """Rate-limit key for a name-addressed UDP command: its type and target, never its values."""
+        target = (command_type, params.get("track_type", "track"), params.get("track_index"),
+                  params.get("device_index"))
+        if command_type == "set_device_parameter":
+            return target + (params.get("parameter_name"),)
+        if command_type == "batch_set_device_parameters":
+            return target + tuple(sorted(str(p.get("name")) for p in params.get("parameters", [])))
+        return target + tuple(sorted(
+            (k, str(v)) for k, v in params.items() if k.endswith(("_index", "_id", "_name"))
+        ))
+
+    def _evict_stale(self, now: float):
+        """Forget send times old enough that they no longer hold anything back (lock held by caller)."""
+        stale = [k for k, t in self._last_sent.items() if now - t >= self.interval and k not in self._held]
+        for k in stale:
+            del self._last_sent[k]
+
+    def _admit(self, key: tuple, item: tuple, now: float) -> bool:
+        """True if the update may go out now; otherwise it is held (lock held by caller)."""
+        self._stats["updates"] += 1
+        if len(self._last_sent) > _REALTIME_KEY_LIMIT:
+            self._evict_stale(now)
+        if key not in self._held and now - self._last_sent.get(key, 0.0) >= self.interval:
+            self._last_sent[key] = now
+            return True
+        if key in self._held:
+            self._stats["superseded"] += 1
+        else:
+            self._stats["held"] += 1
+        self._held[key] = item
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._flush_loop, daemon=True, name="realtime-flush")
+            self._flusher.start()
+        self._cond.notify()
+        return False
+
+    def send_command(self, command_type: str, params: Dict[str, Any]):
+        with self._cond:
+            admitted = self._admit(self._command_key(command_type, params),
+                                   ("json", command_type, params), time.perf_counter())
+        if admitted:
+            self._send([], [(command_type, params)])
+
+    def send_values(self, values: List[tuple]):
+        now = time.perf_counter()
+        with self._cond:
+            admitted = [(h, v) for h, v in values if self._admit(("handle", h), ("handle", h, v), now)]
+        if admitted:
+            self._send(admitted, [])
+
+    def _send(self, values: List[tuple], commands: List[tuple]):
+        datagrams = self.conn.send_udp_parameter_values(values) if values else 0
+        for command_type, params in commands:
+            self.conn.send_udp_command(command_type, params)
+            datagrams += 1
+        with self._cond:
+            self._stats["datagrams"] += datagrams
+            self._stats["sent"] += len(values) + len(commands)
+
+    def _flush_loop(self):
+        while True:
+            with self._cond:
+                while True:
+                    now = time.perf_counter()
+                    due = [k for k in self._held if now - self._last_sent.get(k, 0.0) >= self.interval]
+                    if due:
+                        break
+                    wait = (min(self._last_sent.get(k, 0.0) for k in self._held) + self.interval - now
+                            if self._held else None)
+                    self._cond.wait(wait)
+                items = [self._held.pop(k) for k in due]
+                for k in due:
+                    self._last_sent[k] = now
+            try:
+                self._send([(i[1], i[2]) for i in items if i[0] == "handle"],
+                           [(i[1], i[2]) for i in items if i[0] == "json"])
+            except Exception as e:
+                logger.debug("Realtime flush failed: %s", e)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            stats = dict(self._stats, pending=len(self._held))
+        stats["max_rate_hz"] = round(1.0 / self.interval, 1) if self.interval else None
+        return stats
+
+
+class AbletonConnectionPool:
+    """Small pool of connections to the Remote Script (port 9877).
+
+    Each tool call checks out its own connection, so independent tools run
+    concurrently instead of interleaving bytes on one shared socket.
+    Connections are opened lazily up to ``size``; idle ones are
+    health-checked on checkout and replaced when dead.
+    """
+
+    def __init__(self, host: str = "localhost", port: int = 9877, size: int = POOL_SIZE):
+        self.host = host
+        self.port = port
+        self.size = max(1, size)
+        self._idle: List[AbletonConnection] = []
+        self._last_used: Dict[int, float] = {}
+        self._open = 0
+        self._in_use = 0
+        self._cond = threading.Condition()
+        self.last_activity = 0.0  # newest response seen on any returned connection
+        self._udp = AbletonConnection(host=host, port=port)  # UDP-only, never connect()ed
+        self._stream = RealtimeStream(self._udp)
+        self._stats = {
+            "checkouts": 0, "waits": 0, "wait_ms_total": 0.0, "wait_ms_max": 0.0,
+            "timeouts": 0, "opened": 0, "health_failures": 0,
+        }
+
+    def _new_connection(self) -> AbletonConnection:
+        """Open a fresh connection (raises on failure)."""
+        conn = AbletonConnection(host=self.host, port=self.port)
+        # connect() already did a protocol-negotiation round trip
+        if not conn.connect():
+            raise Exception("Could not connect to Ableton. Make sure the Remote Script is running.")
+        with self._cond:
+            self._stats["opened"] += 1
+        return conn
+
+    def _is_healthy(self, conn: AbletonConnection) -> bool:
+        """Cheap socket check, plus a round trip for long-idle connections."""
+        try:
+            if conn.sock is None:
+                return False
+            conn.sock.getpeername()  # raises if disconnected
+            if time.time() - self._last_used.get(id(conn), 0.0) > _POOL_HEALTH_CHECK_IDLE:
+                conn.heartbeat(timeout=5.0)
+            return True
+        except Exception as e:
+            logger.warning("Pooled Ableton connection failed health check: %s", e)
+            return False
+
+    def checkout(self, timeout: float = _POOL_CHECKOUT_TIMEOUT) -> AbletonConnection:
+        """Take exclusive use of a connection; blocks while all are busy."""
+        start = time.time()
+        waited = False
+        with self._cond:
+            while not self._idle and self._open >= self.size:
+                remaining = timeout - (time.time() - start)
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise TimeoutError(f"All {self.size} Ableton connections busy for {timeout}s")
+                waited = True
+                self._cond.wait(remaining)
+            conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                self._open += 1  # reserve the slot before connecting outside the lock
+            self._in_use += 1
+            self._stats["checkouts"] += 1
+            if waited:
+                wait_ms = (time.time() - start) * 1000
+                self._stats["waits"] += 1
+                self._stats["wait_ms_total"] += wait_ms
+                self._stats["wait_ms_max"] = max(self._stats["wait_ms_max"], wait_ms)
+
+        try:
+            if conn is not None and not self._is_healthy(conn):
+                with self._cond:
+                    self._stats["health_failures"] += 1
+                conn.disconnect()
+                conn = None
+            if conn is None:
+                conn = self._new_connection()
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+        return conn
+
+    def checkin(self, conn: AbletonConnection):
+        """Return a connection; dead ones are dropped and reopened on demand."""
+        with self._cond:
+            self._in_use -= 1
+            self.last_activity = max(self.last_activity, conn.last_response_at)
+            if conn.sock is not None:
+                self._last_used[id(conn)] = time.time()
+                self._idle.append(conn)
+            else:
+                self._last_used.pop(id(conn), None)
+                self._open -= 1
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self, timeout: float = _POOL_CHECKOUT_TIMEOUT):
+        """``with pool.connection() as conn:`` — checkout/checkin around a block."""
+        conn = self.checkout(timeout)
+        try:
+            yield conn
+        finally:
+            self.checkin(conn)
+
+    # Same interface as AbletonConnection, one checkout per call
+    def send_command(self, command_type: str, params: Dict[str, Any] = None, timeout: float = None) -> Dict[str, Any]:
+        _note_command_write(command_type, params)
+        with self.connection() as conn:
+            return conn.send_command(command_type, params, timeout=timeout)
+
+    def send_commands(self, commands: List[tuple], timeout: float = None) -> List[Dict[str, Any]]:
+        with self.connection() as conn:
+            return conn.send_commands(commands, timeout=timeout)
+
+    def send_batch(self, commands: List[Dict[str, Any]], stop_on_error: bool = True,
+                   timeout: float = None) -> Dict[str, Any]:
+        with self.connection() as conn:
+            return conn.send_batch(commands, stop_on_error=stop_on_error, timeout=timeout)
+
+    def resolve_parameter_handle(self, track_index: int, device_index: int, parameter_name: str,
+                                 track_type: str = "track") -> Optional[Dict[str, Any]]:
+        with self.connection() as conn:
+            return conn.resolve_parameter_handle(track_index, device_index, parameter_name, track_type)
+
+    def send_udp_command(self, command_type: str, params: Dict[str, Any] = None):
+        _note_command_write(command_type, params)
+        self._stream.send_command(command_type, params or {})
+
+    def send_udp_parameter_values(self, values: List[tuple]):
+        self._stream.send_values(values)
+
+    def realtime_stats(self) -> Dict[str, Any]:
+        """Client-side realtime stream counters (sent / held / superseded)."""
+        return self._stream.stats()
+
+    def close(self):
+        """Disconnect all idle connections (in-use ones close on checkin)."""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+            self._last_used.clear()
+        for conn in idle:
+            conn.disconnect()
+        self._udp.disconnect()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Pool counters for the dashboard."""
+        with self._cond:
+            stats = dict(self._stats)
+            stats.update(size=self.size, open=self._open, idle=len(self._idle), in_use=self._in_use)
+        stats["wait_ms_avg"] = round(stats["wait_ms_total"] / stats["waits"], 1) if stats["waits"] else 0.0
+        stats["wait_ms_total"] = round(stats["wait_ms_total"], 1)
+        stats["wait_ms_max"] = round(stats["wait_ms_max"], 1)
+        return stats
+
+
+class AbletonConnectionMonitor:
+    """Background heartbeat that tracks whether the Remote Script is reachable.
+
+    States:
+      - connected:    heartbeats answered promptly
+      - degraded:     slow heartbeats or a failure below the reconnect threshold
+      - reconnecting: heartbeats keep failing; reconnect attempts with
+                      exponential backoff + jitter
+      - down:         reconnecting has failed repeatedly; tool calls fail fast
+                      while the monitor keeps retrying in the background
+    """
+
+    STATES = ("connected", "degraded", "reconnecting", "down")
+
+    def __init__(self, pool: "AbletonConnectionPool"):
+        self.pool = pool
+        self.state = "reconnecting"
+        self.state_since = time.time()
+        self.last_latency_ms: Optional[float] = None
+        self.next_attempt_at = 0.0
+        self._failures = 0
+        self._reconnect_attempts = 0
+        self._transitions: deque = deque(maxlen=_HEARTBEAT_TRANSITION_LOG)
+        self._lock = threading.Lock()
+        self._reconnect_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Probe once right away (so the first tool call sees a real state), then beat in the background."""
+        if self._thread is not None:
+            return
+        self._tick()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="ableton-heartbeat")
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _set_state(self, state: str, reason: str):
+        with self._lock:
+            if state == self.state:
+                return
+            now = time.time()
+            self._transitions.append({
+                "ts": datetime.fromtimestamp(now).strftime("%H:%M:%S"),
+                "from": self.state, "to": state, "reason": reason,
+            })
+            self.state, self.state_since = state, now
+        level = logging.INFO if state in ("connected", "degraded") else logging.WARNING
+        logger.log(level, "Ableton connection %s (%s)", state, reason)
+
+    def _backoff(self) -> float:
+        """Exponential backoff with jitter for the next reconnect attempt."""
+        delay = min(_HEARTBEAT_BACKOFF_MAX, _HEARTBEAT_BACKOFF_BASE * (2 ** self._reconnect_attempts))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _tick(self) -> float:
+        """Run one heartbeat or reconnect attempt; returns seconds until the next one."""
+        if self.state in ("connected", "degraded"):
+            if time.time() - self.pool.last_activity < _HEARTBEAT_INTERVAL:
+                # Tool calls are getting answers; no probe needed
+                self._failures = 0
+                if self.last_latency_ms is None or self.last_latency_ms <= _HEARTBEAT_SLOW * 1000:
+                    self._set_state("connected", "responses flowing")
+                return _HEARTBEAT_INTERVAL
+            try:
+                with self.pool.connection(timeout=_HEARTBEAT_INTERVAL) as conn:
+                    latency = conn.heartbeat(timeout=_HEARTBEAT_TIMEOUT)
+            except TimeoutError:
+                return _HEARTBEAT_INTERVAL  # every connection busy with tool calls — clearly alive
+            except Exception as e:
+                self._failures += 1
+                if self._failures >= _HEARTBEAT_FAILURE_THRESHOLD:
+                    self._reconnect_attempts = 0
+                    self._set_state("reconnecting", f"{self._failures} heartbeats failed: {e}")
+                    return 0.0
+                self._set_state("degraded", f"heartbeat failed: {e}")
+                return _HEARTBEAT_INTERVAL
+            self._failures = 0
+            if latency is None:  # socket check only
+                if self.state == "degraded" and (self.last_latency_ms or 0) <= _HEARTBEAT_SLOW * 1000:
+                    self._set_state("connected", "socket alive")
+                return _HEARTBEAT_INTERVAL
+            self.last_latency_ms = round(latency * 1000, 1)
+            if latency > _HEARTBEAT_SLOW:
+                self._set_state("degraded", f"heartbeat took {self.last_latency_ms}ms")
+            else:
+                self._set_state("connected", f"heartbeat {self.last_latency_ms}ms")
+            return _HEARTBEAT_INTERVAL
+
+        return self._attempt_reconnect()
+
+    def _attempt_reconnect(self) -> float:
+        """reconnecting / down: one connection attempt, then back off; returns the delay."""
+        with self._reconnect_lock:
+            if self.state in ("connected", "degraded"):
+                return _HEARTBEAT_INTERVAL  # another thread got there first
+            try:
+                with self.pool.connection(timeout=_HEARTBEAT_INTERVAL):
+                    pass
+            except Exception as e:
+                self._reconnect_attempts += 1
+                if self._reconnect_attempts >= _HEARTBEAT_FAILURE_THRESHOLD:
+                    self._set_state("down", f"{self._reconnect_attempts} reconnect attempts failed: {e}")
+                delay = self._backoff()
+                self.next_attempt_at = time.time() + delay
+                return delay
+            self._failures = 0
+            self._reconnect_attempts = 0
+            self.next_attempt_at = 0.0
+            self._set_state("connected", "reconnected")
+            return _HEARTBEAT_INTERVAL
+
+    def try_reconnect(self) -> bool:
+        """One immediate connection attempt on behalf of a tool call; True if Ableton is back."""
+        self._attempt_reconnect()
+        return self.state not in ("reconnecting", "down")
+
+    def _run(self):
+        delay = _HEARTBEAT_INTERVAL
+        while not self._stop.wait(delay):
+            try:
+                delay = self._tick()
+            except Exception as e:
+                logger.warning("Heartbeat error: %s", e)
+                delay = _HEARTBEAT_INTERVAL
+
+    def status(self) -> Dict[str, Any]:
+        """State, latency and recent transitions for the dashboard."""
+        with self._lock:
+            transitions = list(self._transitions)
+        return {
+            "state": self.state,
+            "since": datetime.fromtimestamp(self.state_since).strftime("%H:%M:%S"),
+            "last_latency_ms": self.last_latency_ms,
+            "next_attempt_in": round(max(0.0, self.next_attempt_at - time.time()), 1) if self.next_attempt_at else None,
+            "transitions": transitions,
+        }
+
+
+# M4L request multiplexing
+M4L_MAX_IN_FLIGHT = int(os.environ.get("ABLETON_MCP_M4L_IN_FLIGHT", "8"))
+# Ask bridges that support it for plain-JSON /r responses instead of base64 in the OSC address
+M4L_RAW_RESPONSES = os.environ.get("ABLETON_MCP_M4L_RAW_RESPONSES", "1") != "0"
+_M4L_RECEIVER_POLL = 0.5  # receiver wake-up interval (notices reconnects, expires stale chunks)
+_M4L_CHUNK_GAP = 5.0      # max seconds between chunks of one response
+_M4L_NACK_IDLE = 0.3      # a chunk set this quiet has lost its tail; ask for the rest
+_M4L_MAX_NACK_ROUNDS = 3  # resend requests per response before waiting for a full retry
+_OSC_BUNDLE_MAX_BYTES = 4096  # per #bundle datagram; well inside what udpreceive accepts
+_OSC_BUNDLE_TIMETAG = struct.pack(">Q", 1)  # OSC "immediately"
+# Windowed payload uploads (bridges advertising "uploads")
+_M4L_PAYLOAD_KEYS = {  # commands carrying a base64 JSON payload -> the param it encodes
+    "batch_set_hidden_params": "parameters",
+    "set_groove_properties": "properties",
+    "modify_clip_notes": "modifications",
+    "remove_clip_notes_by_id": "note_ids",
+    "set_chain_mixing": "properties",
+}
+_UPLOAD_THRESHOLD = 1024  # base64 chars; longer payloads are uploaded before the command
+_UPLOAD_CHUNK_CHARS = 1024
+_UPLOAD_WINDOW = 16       # chunks sent per acknowledgement round
+_UPLOAD_MAX_STALLS = 3    # rounds in a row without progress before giving up
+_UPLOAD_REF_PREFIX = "UPLOAD."  # "." never occurs in base64url
+# Pushed property-change events (bridges advertising "events")
+M4L_EVENT_PORT = int(os.environ.get("ABLETON_MCP_M4L_EVENT_PORT", "9883"))
+_M4L_EVENT_RING = 1000         # events kept per observed property
+_M4L_EVENT_HELLO_TIMEOUT = 1.0  # wait this long for the bridge's hello on the event port
+
+
 @dataclass
 class M4LConnection:
     """UDP connection to the Max for Live bridge device.
@@ -255,36 +1246,74 @@ class M4LConnection:
     send_sock: socket.socket = None
     recv_sock: socket.socket = None
     _connected: bool = False
+    # Guards socket setup/teardown; requests themselves run concurrently
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+    # Request multiplexing: the receiver thread reassembles chunked responses
+    # and completes the Future registered under each request id.
+    _pending: Dict[str, Future] = field(default_factory=dict, repr=False)
+    _chunks: Dict[str, Dict[str, Any]] = field(default_factory=dict, repr=False)
+    _pending_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _receiver: threading.Thread = field(default=None, repr=False)
+    # Passive liveness: time of the last datagram the bridge sent us
+    last_seen: float = 0.0
+    # Optional fast paths the bridge reported in its last ping ("bundles", ...)
+    bridge_features: set = field(default_factory=set, repr=False)
+    # Receives the args of /ev messages pushed inline on the response port
+    on_event: Any = field(default=None, repr=False)
+    # Event mode the bridge reported in its last ping ("off" after a reload)
+    bridge_event_mode: Optional[str] = None
+    # Counters are bumped from the receiver, request and upload threads
+    _stats_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _stats: Dict[str, int] = field(default_factory=lambda: {
+        "sent": 0, "completed": 0, "retries": 0, "timeouts": 0,
+        "chunked": 0, "unmatched": 0, "bad_datagrams": 0, "bundles": 0,
+        "uploads": 0, "upload_chunks": 0, "upload_resent": 0,
+        "nacks": 0, "chunks_recovered": 0, "raw_datagrams": 0,
+    }, repr=False)
 
     def connect(self) -> bool:
-        """Set up UDP sockets for M4L communication."""
-        try:
-            self.send_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.recv_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            # Use exclusive binding — prevents a second instance from sharing this port
-            if hasattr(socket, "SO_EXCLUSIVEADDRUSE"):
-                self.recv_sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
-            self.recv_sock.bind(("127.0.0.1", self.recv_port))
-            self.recv_sock.settimeout(5.0)
-            self._connected = True
-            logger.info("M4L UDP sockets ready (send→:%d, recv←:%d)", self.send_port, self.recv_port)
-            return True
-        except Exception as e:
-            logger.error("Failed to set up M4L UDP connection: %s", e)
-            self.disconnect()
-            return False
+        """Set up UDP sockets for M4L communication and start the receiver thread."""
+        with self._lock:
+            if self._connected:
+                return True
+            try:
+                self.send_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                self.recv_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                # Use exclusive binding — prevents a second instance from sharing this port
+                if hasattr(socket, "SO_EXCLUSIVEADDRUSE"):
+                    self.recv_sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+                self.recv_sock.bind(("127.0.0.1", self.recv_port))
+                self.recv_sock.settimeout(_M4L_RECEIVER_POLL)
+                self._connected = True
+                self._receiver = threading.Thread(
+                    target=self._receive_loop, args=(self.recv_sock,), daemon=True, name="m4l-receiver"
+                )
+                self._receiver.start()
+                logger.info("M4L UDP sockets ready (send→:%d, recv←:%d)", self.send_port, self.recv_port)
+                return True
+            except Exception as e:
+                logger.error("Failed to set up M4L UDP connection: %s", e)
+                self.disconnect()
+                return False
 
     def disconnect(self):
-        """Close UDP sockets."""
-        for s in (self.send_sock, self.recv_sock):
-            if s:
-                try:
-                    s.close()
-                except Exception:
-                    pass
-        self.send_sock = None
-        self.recv_sock = None
-        self._connected = False
+        """Close UDP sockets and fail every outstanding request."""
+        with self._lock:
+            for s in (self.send_sock, self.recv_sock):
+                if s:
+                    try:
+                        s.close()
+                    except Exception:
+                        pass
+            self.send_sock = None
+            self.recv_sock = None
+            self._connected = False
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+            self._chunks.clear()
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("M4L connection closed"))
 
     @staticmethod
     def _build_osc_message(address: str, osc_args: list = None) -> bytes:
@@ -313,10 +1342,29 @@ class M4LConnection:
                 msg += struct.pack(">f", float(v))
         return msg
 
+    @staticmethod
+    def _encode_payload(value: Any) -> str:
+        """Compact JSON as URL-safe base64 without padding.
+
+        Max's OSC/symbol handling mangles +, /, and = characters.
+        """
+        payload_json = json.dumps(value, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload_json.encode("utf-8")).decode("ascii").rstrip("=")
+
+    def _payload_arg(self, params: Dict[str, Any], key: str) -> str:
+        """The payload argument: an upload reference if send_command uploaded it."""
+        return params.get("_payload_ref") or self._encode_payload(params[key])
+
     def _build_osc_packet(self, command_type: str, params: Dict[str, Any], request_id: str) -> bytes:
         """Build the OSC packet for a given command type."""
         if command_type == "ping":
             return self._build_osc_message("/ping", [("s", request_id)])
+        elif command_type == "get_param_values":
+            return self._build_osc_message("/get_param_values", [
+                ("i", params["track_index"]),
+                ("i", params["device_index"]),
+                ("s", request_id),
+            ])
         elif command_type == "discover_params":
             return self._build_osc_message("/discover_params", [
                 ("i", params["track_index"]),
@@ -353,14 +1401,10 @@ class M4LConnection:
                 ("s", request_id),
             ])
         elif command_type == "batch_set_hidden_params":
-            # Use compact JSON (no spaces) + URL-safe base64 without padding.
-            # Max's OSC/symbol handling mangles +, /, and = characters.
-            params_json = json.dumps(params["parameters"], separators=(",", ":"))
-            params_b64 = base64.urlsafe_b64encode(params_json.encode("utf-8")).decode("ascii").rstrip("=")
             return self._build_osc_message("/batch_set_hidden_params", [
                 ("i", params["track_index"]),
                 ("i", params["device_index"]),
-                ("s", params_b64),
+                ("s", self._payload_arg(params, "parameters")),
                 ("s", request_id),
             ])
         # --- Phase 7: Cue Points ---
@@ -379,11 +1423,9 @@ class M4LConnection:
                 ("s", request_id),
             ])
         elif command_type == "set_groove_properties":
-            props_json = json.dumps(params["properties"], separators=(",", ":"))
-            props_b64 = base64.urlsafe_b64encode(props_json.encode("utf-8")).decode("ascii").rstrip("=")
             return self._build_osc_message("/set_groove_properties", [
                 ("i", params["groove_index"]),
-                ("s", props_b64),
+                ("s", self._payload_arg(params, "properties")),
                 ("s", request_id),
             ])
         # --- Phase 6: Event Monitoring ---
@@ -399,6 +1441,11 @@ class M4LConnection:
                 ("s", params["property_name"]),
                 ("s", request_id),
             ])
+        elif command_type == "event_stream":
+            return self._build_osc_message("/event_stream", [
+                ("s", params["mode"]),
+                ("s", request_id),
+            ])
         elif command_type == "get_observed_changes":
             return self._build_osc_message("/get_observed_changes", [
                 ("s", request_id),
@@ -474,21 +1521,17 @@ class M4LConnection:
                 ("s", request_id),
             ])
         elif command_type == "modify_clip_notes":
-            mods_json = json.dumps(params["modifications"], separators=(",", ":"))
-            mods_b64 = base64.urlsafe_b64encode(mods_json.encode("utf-8")).decode("ascii").rstrip("=")
             return self._build_osc_message("/modify_clip_notes", [
                 ("i", params["track_index"]),
                 ("i", params["clip_index"]),
-                ("s", mods_b64),
+                ("s", self._payload_arg(params, "modifications")),
                 ("s", request_id),
             ])
         elif command_type == "remove_clip_notes_by_id":
-            ids_json = json.dumps(params["note_ids"], separators=(",", ":"))
-            ids_b64 = base64.urlsafe_b64encode(ids_json.encode("utf-8")).decode("ascii").rstrip("=")
             return self._build_osc_message("/remove_clip_notes_by_id", [
                 ("i", params["track_index"]),
                 ("i", params["clip_index"]),
-                ("s", ids_b64),
+                ("s", self._payload_arg(params, "note_ids")),
                 ("s", request_id),
             ])
         # --- Phase 13: Chain-Level Mixing ---
@@ -500,13 +1543,11 @@ class M4LConnection:
                 ("s", request_id),
             ])
         elif command_type == "set_chain_mixing":
-            props_json = json.dumps(params["properties"], separators=(",", ":"))
-            props_b64 = base64.urlsafe_b64encode(props_json.encode("utf-8")).decode("ascii").rstrip("=")
             return self._build_osc_message("/set_chain_mixing", [
                 ("i", params["track_index"]),
                 ("i", params["device_index"]),
                 ("i", params["chain_index"]),
-                ("s", props_b64),
+                ("s", self._payload_arg(params, "properties")),
                 ("s", request_id),
             ])
         # --- Phase 14: Device AB Comparison ---
@@ -526,6 +1567,24 @@ class M4LConnection:
                 ("f", params.get("beat_time", 0.0)),
                 ("s", request_id),
             ])
+        # --- Parameter bundles (entries are sent by send_param_bundle) ---
+        elif command_type == "bundle_commit":
+            return self._build_osc_message("/bundle_commit", [
+                ("s", params["bundle_id"]),
+                ("i", params["expected"]),
+                ("s", request_id),
+            ])
+        elif command_type == "response_mode":
+            return self._build_osc_message("/response_mode", [
+                ("s", params["mode"]),
+                ("s", request_id),
+            ])
+        # --- Windowed uploads (chunks are sent by upload_payload) ---
+        elif command_type == "upload_status":
+            return self._build_osc_message("/upload_status", [
+                ("s", params["upload_id"]),
+                ("s", request_id),
+            ])
         # --- Phase 16: Split Stereo Panning ---
         elif command_type == "get_split_stereo":
             return self._build_osc_message("/get_split_stereo", [
@@ -542,33 +1601,133 @@ class M4LConnection:
         else:
             raise ValueError(f"Unknown M4L command: {command_type}")
 
-    def _drain_recv_socket(self):
-        """Drain any stale data from the receive socket."""
-        self.recv_sock.setblocking(False)
+    def _receive_loop(self, sock: socket.socket):
+        """Receiver thread: parse every datagram and route it to its request."""
+        last_sweep = time.time()
+        while True:
+            if time.time() - last_sweep >= _M4L_RECEIVER_POLL:
+                last_sweep = time.time()
+                self._expire_chunks()
+            try:
+                data, _addr = sock.recvfrom(65535)
+            except socket.timeout:
+                if sock is not self.recv_sock:
+                    return  # reconnected; a new receiver owns the new socket
+                continue
+            except OSError:
+                return  # socket closed by disconnect()
+            try:
+                if data.startswith(b"/ev\x00"):
+                    self.last_seen = time.time()
+                    if self.on_event:
+                        self.on_event(self._parse_osc_message(data)[1])
+                    continue
+                if data.startswith(b"/r\x00"):
+                    self._count("raw_datagrams")
+                self._route(self._parse_m4l_response(data))
+            except Exception as e:
+                self._count("bad_datagrams")
+                logger.warning("M4L receiver: dropped unparseable datagram: %s", e)
+
+    def _route(self, message: Dict[str, Any]):
+        """Complete the Future waiting for ``message`` (reassembling chunks first)."""
+        # Large responses arrive as {"_c": idx, "_t": total, "_i": request_id,
+        # "_d": "url_safe_base64_piece"} envelopes; older bridges omit "_i".
+        if "_c" in message and "_t" in message:
+            key = message.get("_i", "")
+            index = message["_c"]
+            gaps = []
+            with self._pending_lock:
+                entry = self._chunks.setdefault(key, {
+                    "total": message["_t"], "parts": {}, "nacked": set(), "nack_rounds": 0,
+                    "raw": message.get("_raw", False),
+                })
+                if index in entry["nacked"] and index not in entry["parts"]:
+                    self._count("chunks_recovered")
+                entry["parts"][index] = message["_d"]
+                entry["updated"] = time.time()
+                if len(entry["parts"]) < entry["total"]:
+                    # Chunks are sent in order, so a hole below this index is a lost datagram
+                    gaps = [i for i in range(index) if i not in entry["parts"] and i not in entry["nacked"]]
+                    entry["nacked"].update(gaps)
+                else:
+                    del self._chunks[key]
+            if gaps:
+                self._request_chunks(key, gaps)
+            if len(entry["parts"]) < entry["total"]:
+                return
+            self._count("chunked")
+            message = self._reassemble_chunks(entry["parts"], entry["total"], entry["raw"])
+
+        self.last_seen = time.time()
+        request_id = message.get("id", "")
+        with self._pending_lock:
+            future = self._pending.pop(request_id, None)
+        if future is None or future.done():
+            # Late reply to a request that already timed out (or an unsolicited one)
+            self._count("unmatched")
+            logger.debug("M4L response for unknown request id %r dropped", request_id)
+            return
+        self._count("completed")
+        future.set_result(message)
+
+    def _expire_chunks(self):
+        """Ask again for the missing tail of quiet chunk sets; forget abandoned ones."""
+        now = time.time()
+        cutoff = now - _M4L_CHUNK_GAP * 2
+        resend = []
+        with self._pending_lock:
+            for key in [k for k, e in self._chunks.items() if e["updated"] < cutoff]:
+                logger.error("M4L chunk reassembly: gave up after %d/%d chunks",
+                             len(self._chunks[key]["parts"]), self._chunks[key]["total"])
+                del self._chunks[key]
+            for key, entry in self._chunks.items():
+                if (now - entry["updated"] >= _M4L_NACK_IDLE
+                        and entry["nack_rounds"] < _M4L_MAX_NACK_ROUNDS):
+                    entry["nack_rounds"] += 1
+                    entry["updated"] = now  # give the resend a full idle window
+                    missing = [i for i in range(entry["total"]) if i not in entry["parts"]]
+                    entry["nacked"].update(missing)
+                    resend.append((key, missing))
+        for key, missing in resend:
+            self._request_chunks(key, missing)
+
+    def _request_chunks(self, request_id: str, indices: List[int]):
+        """Send /resend_chunks for chunk indices of a response that never arrived."""
+        # Envelopes from older bridges carry no request id and can't be asked for again
+        if not request_id or not self.supports("resend") or self.send_sock is None:
+            return
         try:
-            for _ in range(100):
-                self.recv_sock.recvfrom(65535)
-        except (BlockingIOError, OSError):
-            pass
-        self.recv_sock.setblocking(True)
-
-    def send_command(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Send a command to the M4L bridge using native OSC messages.
-
-        Includes automatic reconnect: if the send or receive fails, the
-        UDP sockets are recreated and the command is retried once.
-        """
-        params = params or {}
-        request_id = str(uuid.uuid4())[:8]
-        osc = self._build_osc_packet(command_type, params, request_id)
-
+            self.send_sock.sendto(self._build_osc_message(
+                "/resend_chunks", [("s", request_id)] + [("i", i) for i in indices]
+            ), (self.send_host, self.send_port))
+            self._count("nacks")
+            logger.info("M4L response %s: requested %d missing chunk(s)", request_id, len(indices))
+        except OSError as e:
+            logger.warning("M4L resend request failed: %s", e)
+
+    def _chunk_activity(self, request_id: str) -> Optional[float]:
+        """When the last chunk of ``request_id``'s response arrived, if one is in progress."""
+        with self._pending_lock:
+            entry = self._chunks.get(request_id) or self._chunks.get("")
+            return entry["updated"] if entry else None
+
+    def _timeout_for(self, command_type: str, params: Dict[str, Any]) -> tuple:
+        """(timeout, latency units, adaptive) for one command."""
         # Commands that use chunked async processing in the M4L bridge
         # need longer timeouts to account for discovery + response delays.
+        # These are the defaults until enough latency samples exist; after
+        # that _m4l_latency derives the timeout (per parameter for batches).
+        units = 1
         if command_type == "batch_set_hidden_params":
-            param_count = len(params.get("parameters", []))
+            units = len(params.get("parameters", []))
             # ~150ms per param (chunk delay + LOM overhead), minimum 10s
-            timeout = max(10.0, param_count * 0.15)
-        elif command_type in ("discover_params", "get_hidden_params"):
+            timeout = max(10.0, units * 0.15)
+        elif command_type == "bundle_commit":
+            units = params["expected"]
+            # 16 params per 10ms chunk — LOM set() time dominates
+            timeout = max(5.0, units * 0.02)
+        elif command_type in ("discover_params", "get_hidden_params", "get_param_values"):
             # Chunked discovery: ~50ms per 4 params + chunked response sending
             timeout = 15.0
         elif command_type == "analyze_cross_track":
@@ -577,73 +1736,179 @@ class M4LConnection:
             timeout = max(3.0, (wait_ms / 1000.0) + 1.5)
         else:
             timeout = 5.0
+        # Cross-track timing is dominated by the caller's wait_ms, not by latency
+        adaptive = command_type != "analyze_cross_track"
+        if adaptive:
+            timeout = _m4l_latency.timeout_for(command_type, timeout, units)
+        return timeout, units, adaptive
+
+    def send_command(self, command_type: str, params: Dict[str, Any] = None,
+                     timeout: float = None) -> Dict[str, Any]:
+        """Send a command to the M4L bridge using native OSC messages.
+
+        Safe to call from many threads at once: each request waits on its
+        own Future, completed by the receiver thread when the response with
+        its request id arrives.  A timed-out request is resent once with the
+        same id, so a slow first reply still completes it.
+        """
+        params = params or {}
+        _note_command_write(command_type, params)
+        request_id = str(uuid.uuid4())[:8]
+        payload_key = _M4L_PAYLOAD_KEYS.get(command_type)
+        if payload_key and self.supports("uploads") and "_payload_ref" not in params:
+            encoded = self._encode_payload(params[payload_key])
+            if len(encoded) > _UPLOAD_THRESHOLD:
+                # Long OSC symbols break inside Max; ship the payload in acknowledged chunks
+                params = dict(params, _payload_ref=_UPLOAD_REF_PREFIX + self.upload_payload(encoded))
+        osc = self._build_osc_packet(command_type, params, request_id)
+        default_timeout, units, adaptive = self._timeout_for(command_type, params)
+        if timeout is None:
+            timeout = default_timeout
 
         max_attempts = 2
-        for attempt in range(1, max_attempts + 1):
-            if not self._connected:
-                if not self.connect():
-                    raise ConnectionError("Could not establish M4L UDP connection.")
+        try:
+            for attempt in range(1, max_attempts + 1):
+                if not self._connected:
+                    if not self.connect():
+                        raise ConnectionError("Could not establish M4L UDP connection.")
 
-            # Drain any stale data in the recv socket before sending
-            self._drain_recv_socket()
-            self.recv_sock.settimeout(timeout)
+                future: Future = Future()
+                with self._pending_lock:
+                    self._pending[request_id] = future
+                try:
+                    sent_at = time.time()
+                    self.send_sock.sendto(osc, (self.send_host, self.send_port))
+                    self._count("sent")
+                except Exception as e:
+                    logger.error("Failed to send UDP command to M4L (attempt %d): %s", attempt, e)
+                    if attempt < max_attempts:
+                        self.disconnect()
+                        time.sleep(0.2)
+                        continue
+                    raise ConnectionError("Failed to send command to M4L bridge.")
 
+                try:
+                    result = self._wait(future, request_id, timeout)
+                    if adaptive:
+                        _m4l_latency.record(command_type, time.time() - sent_at, units)
+                    return result
+                except FutureTimeoutError:
+                    self._count("timeouts")
+                    if adaptive:
+                        _m4l_latency.record_timeout(command_type, timeout, units)
+                    logger.warning("M4L response timeout (attempt %d)", attempt)
+                    if attempt < max_attempts:
+                        self._count("retries")
+                        continue
+                    self.last_seen = 0.0  # next get_m4l_connection() pings before trusting the bridge
+                    raise Exception("Timeout waiting for M4L bridge response. Is the M4L device loaded?")
+        finally:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+
+    def _wait(self, future: Future, request_id: str, timeout: float) -> Dict[str, Any]:
+        """Wait for a response; chunks still arriving extend the deadline."""
+        deadline = time.time() + timeout
+        while True:
             try:
-                self.send_sock.sendto(osc, (self.send_host, self.send_port))
-            except Exception as e:
-                logger.error("Failed to send UDP command to M4L (attempt %d): %s", attempt, e)
-                if attempt < max_attempts:
-                    self.disconnect()
-                    time.sleep(0.2)
-                    continue
-                raise ConnectionError("Failed to send command to M4L bridge.")
+                return future.result(timeout=max(0.0, deadline - time.time()))
+            except FutureTimeoutError:
+                last_chunk = self._chunk_activity(request_id)
+                if last_chunk is None or time.time() - last_chunk > _M4L_CHUNK_GAP:
+                    raise
+                deadline = last_chunk + _M4L_CHUNK_GAP
 
+    def send_commands(self, commands: List[tuple], max_in_flight: int = None) -> List[Dict[str, Any]]:
+        """Send many (command_type, params) pairs concurrently; raw responses in order.
+
+        Up to ``max_in_flight`` requests are outstanding at once (one at a time
+        unless the bridge reports "concurrent"), so a run of commands costs
+        roughly the bridge's processing time rather than one round trip each.  Failures come back as {"status": "error"} entries.
+        """
+        in_flight = max(1, min(len(commands), max_in_flight or M4L_MAX_IN_FLIGHT))
+        if not self.supports("concurrent"):
+            # Older bridges answer overlapping requests with "Discovery busy"
+            # and don't tag chunks with their request id, so go one at a time
+            in_flight = 1
+
+        def _one(command: tuple) -> Dict[str, Any]:
+            command_type, params = command
+            params = params or {}
+            # The bridge works through requests in order, so a request may
+            # queue behind the others in flight
+            timeout = self._timeout_for(command_type, params)[0] * in_flight
             try:
-                data, _addr = self.recv_sock.recvfrom(65535)
-                result = self._parse_m4l_response(data)
-
-                # Handle chunked responses from the M4L bridge.
-                # Large responses (>1500 chars JSON) are split into multiple
-                # UDP packets, each wrapped in an envelope: {"_c":idx,"_t":total,"_d":"base64piece"}
-                if "_c" in result and "_t" in result:
-                    result = self._reassemble_chunked_response(result)
-
-                # Verify request_id matches — drain stale responses if mismatch
-                resp_id = result.get("id", "")
-                if resp_id and resp_id != request_id:
-                    for _drain in range(5):
-                        logger.warning("M4L response id mismatch: expected %s, got %s — draining", request_id, resp_id)
-                        try:
-                            data, _addr = self.recv_sock.recvfrom(65535)
-                            result = self._parse_m4l_response(data)
-                            if "_c" in result and "_t" in result:
-                                result = self._reassemble_chunked_response(result)
-                            resp_id = result.get("id", "")
-                            if not resp_id or resp_id == request_id:
-                                break
-                        except socket.timeout:
-                            raise Exception(f"Timeout waiting for correct M4L response (expected {request_id})")
-                    else:
-                        logger.error("Could not find matching M4L response after 5 drains (expected %s)", request_id)
-                return result
-            except socket.timeout:
-                logger.warning("M4L response timeout (attempt %d)", attempt)
-                if attempt < max_attempts:
-                    self.disconnect()
-                    time.sleep(0.2)
-                    continue
-                raise Exception("Timeout waiting for M4L bridge response. Is the M4L device loaded?")
+                return self.send_command(command_type, params, timeout=timeout)
+            except Exception as e:
+                return {"status": "error", "message": str(e)}
+
+        if in_flight == 1:
+            return [_one(c) for c in commands]
+        with ThreadPoolExecutor(max_workers=in_flight, thread_name_prefix="m4l-request") as executor:
+            return list(executor.map(_one, commands))
+
+    def metrics(self) -> Dict[str, Any]:
+        """Request multiplexer counters for the dashboard."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        with self._pending_lock:
+            return dict(stats, in_flight=len(self._pending), partial_chunk_sets=len(self._chunks))
+
+    def _count(self, key: str, n: int = 1):
+        with self._stats_lock:
+            self._stats[key] += n
 
     @staticmethod
-    def _parse_m4l_response(data: bytes) -> Dict[str, Any]:
+    def _parse_osc_message(data: bytes) -> tuple:
+        """Split an OSC message into (address, [args]); handles s, i, f and b arguments."""
+        def _osc_string(offset: int) -> tuple:
+            end = data.index(b"\x00", offset)
+            return data[offset:end].decode("utf-8"), end + 1 + (-(end + 1) % 4)
+
+        address, offset = _osc_string(0)
+        type_tags, offset = _osc_string(offset)
+        args = []
+        for tag in type_tags.lstrip(","):
+            if tag == "s":
+                value, offset = _osc_string(offset)
+            elif tag == "i":
+                value = struct.unpack_from(">i", data, offset)[0]
+                offset += 4
+            elif tag == "f":
+                value = struct.unpack_from(">f", data, offset)[0]
+                offset += 4
+            elif tag == "b":
+                size = struct.unpack_from(">i", data, offset)[0]
+                value = data[offset + 4:offset + 4 + size]
+                offset += 4 + size + (-size % 4)
+            else:
+                raise ValueError(f"Unsupported OSC type tag {tag!r}")
+            args.append(value)
+        return address, args
+
+    @classmethod
+    def _parse_m4l_response(cls, data: bytes) -> Dict[str, Any]:
         """Parse the response from the M4L bridge.
 
-        Max's udpsend wraps the base64 string as an OSC message:
+        In raw mode the bridge sends a real OSC message
+          /r  request_id  chunk_index  total_chunks  json_piece
+        where json_piece is a string (or blob) of plain JSON.
+
+        Otherwise Max's udpsend wraps the base64 string as an OSC message:
           [base64_string\\0...padding][,\\0\\0\\0]
         The OSC address (first null-terminated string) contains our
         base64-encoded JSON response.  The bridge uses URL-safe base64
-        (- instead of +, _ instead of /, no = padding).
+        (- instead of +, _ instead of /, no = padding).  The fallbacks
+        below only matter for old bridges.
         """
+        if data.startswith(b"/r\x00"):
+            _address, (request_id, index, total, piece) = cls._parse_osc_message(data)
+            if isinstance(piece, bytes):
+                piece = piece.decode("utf-8")
+            if total == 1:
+                return json.loads(piece)
+            return {"_c": index, "_t": total, "_i": request_id, "_d": piece, "_raw": True}
+
         # Extract the OSC address = first null-terminated string in the packet
         null_pos = data.find(b"\x00")
         if null_pos > 0:
@@ -693,41 +1958,19 @@ class M4LConnection:
 
         raise json.JSONDecodeError("Could not parse M4L response", text, 0)
 
-    def _reassemble_chunked_response(self, first_chunk: Dict[str, Any]) -> Dict[str, Any]:
-        """Reassemble a chunked response from the M4L bridge.
+    @staticmethod
+    def _reassemble_chunks(chunks: Dict[int, str], total: int, raw: bool = False) -> Dict[str, Any]:
+        """Join the pieces of a chunked response from the M4L bridge.
 
-        Large responses are split into multiple UDP packets, each containing:
-          {"_c": chunk_index, "_t": total_chunks, "_d": "url_safe_base64_piece"}
-        Each _d piece decodes to a fragment of the original JSON string.
-        We collect all chunks, decode each _d, concatenate, and parse.
+        Each {"_c": chunk_index, "_t": total_chunks, "_d": "url_safe_base64_piece"}
+        envelope's _d decodes to a fragment of the original JSON string;
+        raw-mode pieces are already plain JSON.
         """
-        total = first_chunk["_t"]
-        logger.info("M4L chunked response: %d total chunks", total)
-
-        # Store chunks by index
-        chunks: Dict[int, str] = {first_chunk["_c"]: first_chunk["_d"]}
-
-        # Collect remaining chunks
-        # Give extra time: 100ms per chunk + 5s base
-        chunk_timeout = max(5.0, total * 0.1 + 5.0)
-        self.recv_sock.settimeout(chunk_timeout)
-
-        while len(chunks) < total:
-            try:
-                data, _ = self.recv_sock.recvfrom(65535)
-                parsed = self._parse_m4l_response(data)
-                if "_c" in parsed and "_t" in parsed:
-                    chunks[parsed["_c"]] = parsed["_d"]
-                else:
-                    # Got a non-chunk response (maybe from another command?)
-                    logger.warning("M4L chunk reassembly: got non-chunk packet, ignoring")
-            except socket.timeout:
-                logger.error("M4L chunk reassembly: timeout after %d/%d chunks", len(chunks), total)
-                raise Exception(f"Timeout receiving chunked M4L response ({len(chunks)}/{total} chunks received)")
-
-        # Reassemble: decode each piece and concatenate
         json_parts = []
         for i in range(total):
+            if raw:
+                json_parts.append(chunks[i])
+                continue
             piece_b64 = chunks[i]
             padded = piece_b64 + "=" * (-len(piece_b64) % 4)
             piece_json = base64.urlsafe_b64decode(padded).decode("utf-8")
@@ -737,19 +1980,255 @@ class M4LConnection:
         logger.info("M4L chunked response reassembled: %d chars from %d chunks", len(full_json), total)
         return json.loads(full_json)
 
-    def ping(self) -> bool:
+    @staticmethod
+    def _build_osc_bundle(messages: List[bytes]) -> bytes:
+        """Wrap already-encoded OSC messages in one #bundle packet."""
+        packet = bytearray(b"#bundle\x00" + _OSC_BUNDLE_TIMETAG)
+        for msg in messages:
+            packet += struct.pack(">i", len(msg)) + msg
+        return bytes(packet)
+
+    def send_param_bundle(self, entries: List[tuple]) -> Dict[str, Any]:
+        """Set many (track_index, device_index, parameter_index, value) entries at once.
+
+        Entries travel as /bundle_set_param messages packed into as few
+        #bundle datagrams as fit _OSC_BUNDLE_MAX_BYTES; a /bundle_commit then
+        has the bridge apply them and send one aggregated reply:
+        {"params_set", "params_failed", "expected", "received",
+         "missing": [entry seqs that never arrived], "errors": [...]}.
+        """
+        if not self._connected and not self.connect():
+            raise ConnectionError("Could not establish M4L UDP connection.")
+        for track_index, device_index in {(e[0], e[1]) for e in entries}:
+            _note_device_write(track_index, device_index)
+        bundle_id = str(uuid.uuid4())[:8]
+        header = 16  # "#bundle\0" + timetag
+        datagrams: List[List[bytes]] = [[]]
+        size = header
+        for seq, (track_index, device_index, parameter_index, value) in enumerate(entries):
+            msg = self._build_osc_message("/bundle_set_param", [
+                ("s", bundle_id),
+                ("i", seq),
+                ("i", track_index),
+                ("i", device_index),
+                ("i", parameter_index),
+                ("f", value),
+            ])
+            if datagrams[-1] and size + 4 + len(msg) > _OSC_BUNDLE_MAX_BYTES:
+                datagrams.append([])
+                size = header
+            datagrams[-1].append(msg)
+            size += 4 + len(msg)
+        for messages in datagrams:
+            self.send_sock.sendto(self._build_osc_bundle(messages), (self.send_host, self.send_port))
+        self._count("bundles", len(datagrams))
+        return self.send_command("bundle_commit", {"bundle_id": bundle_id, "expected": len(entries)})
+
+    def upload_payload(self, encoded: str) -> str:
+        """Upload a long base64 payload in numbered chunks; returns the upload id.
+
+        Up to _UPLOAD_WINDOW unacknowledged chunks go out per round, then
+        /upload_status reports the chunk ranges the bridge holds and only the
+        gaps are resent.  Commands then reference the payload as
+        "UPLOAD.<upload_id>" instead of carrying it.
+        """
+        if not self._connected and not self.connect():
+            raise ConnectionError("Could not establish M4L UDP connection.")
+        upload_id = str(uuid.uuid4())[:8]
+        pieces = [encoded[i:i + _UPLOAD_CHUNK_CHARS] for i in range(0, len(encoded), _UPLOAD_CHUNK_CHARS)]
+        missing = list(range(len(pieces)))
+        sent = set()
+        stalls = 0
+        while missing:
+            for index in missing[:_UPLOAD_WINDOW]:
+                self.send_sock.sendto(self._build_osc_message("/upload_chunk", [
+                    ("s", upload_id),
+                    ("i", index),
+                    ("i", len(pieces)),
+                    ("s", pieces[index]),
+                ]), (self.send_host, self.send_port))
+                self._count("upload_chunks")
+                if index in sent:
+                    self._count("upload_resent")
+                sent.add(index)
+            status = _m4l_result(self.send_command("upload_status", {"upload_id": upload_id}))
+            received = set()
+            for first, last in status.get("received", []):
+                received.update(range(first, last + 1))
+            still_missing = [i for i in missing if i not in received]
+            progressed = len(still_missing) < len(missing)
+            missing = still_missing
+            stalls = 0 if progressed else stalls + 1
+            if missing and stalls >= _UPLOAD_MAX_STALLS:
+                raise Exception(
+                    f"Upload {upload_id} stalled: {len(missing)} of {len(pieces)} chunks never arrived."
+                )
+        self._count("uploads")
+        return upload_id
+
+    def supports(self, feature: str) -> bool:
+        """True if the bridge advertised ``feature`` in its ping reply."""
+        return feature in self.bridge_features
+
+    def is_fresh(self, ttl: float) -> bool:
+        """True if the bridge answered anything within the last ``ttl`` seconds."""
+        return self._connected and time.time() - self.last_seen < ttl
+
+    def ping(self, timeout: float = None) -> bool:
         """Check if the M4L bridge device is responding."""
         try:
-            result = self.send_command("ping")
-            return result.get("status") == "success"
+            result = self.send_command("ping", timeout=timeout)
+            if result.get("status") != "success":
+                return False
+            info = result.get("result", {})
+            self.bridge_features = set(info.get("features", []))
+            self.bridge_event_mode = info.get("event_mode")
+            if (M4L_RAW_RESPONSES and self.supports("raw_responses")
+                    and info.get("response_mode") != "raw"):
+                # A reloaded bridge starts in base64 mode again; switch it back
+                self.send_command("response_mode", {"mode": "raw"}, timeout=timeout)
+            return True
         except Exception:
             return False
 
 
+class M4LEventStream:
+    """Property-change events pushed by the M4L bridge, kept in per-key ring buffers.
+
+    The bridge coalesces each observer's changes over a short window and
+    pushes them as /ev messages, either to ``port`` (its second udpsend) or
+    inline on the response port when that udpsend is missing from the patch.
+    Every stored event gets a server-side sequence number; readers pass the
+    last one they saw (or use the per-key "since last read" cursors), so
+    get_property_changes is a local read instead of a bridge round trip.
+    """
+
+    def __init__(self, port: int):
+        self.port = port
+        self.mode = "off"  # "off" (bridge polled), "port" or "inline"
+        self._rings: Dict[str, deque] = {}
+        self._seq = 0
+        self._cursors: Dict[str, int] = {}  # per-key "since last read" positions
+        self._bridge_seq = 0
+        self._lock = threading.Lock()
+        self._hello = threading.Event()
+        self._sock: Optional[socket.socket] = None
+        self._stats = {"messages": 0, "events": 0, "coalesced": 0, "lost_messages": 0}
+
+    def _start_listener(self) -> bool:
+        if self._sock is not None:
+            return True
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            if hasattr(socket, "SO_EXCLUSIVEADDRUSE"):
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+            sock.bind(("127.0.0.1", self.port))
+        except OSError as e:
+            logger.warning("M4L event port %d unavailable: %s", self.port, e)
+            return False
+        self._sock = sock
+        threading.Thread(target=self._listen, args=(sock,), daemon=True, name="m4l-events").start()
+        return True
+
+    def _listen(self, sock: socket.socket):
+        while True:
+            try:
+                data, _addr = sock.recvfrom(65535)
+            except OSError:
+                return  # closed by stop()
+            try:
+                self.handle(M4LConnection._parse_osc_message(data)[1])
+            except Exception as e:
+                logger.warning("M4L event listener: dropped unparseable datagram: %s", e)
+
+    def handle(self, args: list):
+        """Store the events of one /ev message: [bridge_seq, json]."""
+        bridge_seq, payload = args[0], json.loads(args[1])
+        if payload.get("hello"):
+            self._hello.set()
+            return
+        with self._lock:
+            self._stats["messages"] += 1
+            if self._bridge_seq and bridge_seq > self._bridge_seq + 1:
+                self._stats["lost_messages"] += bridge_seq - self._bridge_seq - 1
+            self._bridge_seq = bridge_seq
+            for event in payload.get("events", []):
+                self._stats["events"] += 1
+                self._stats["coalesced"] += event.get("coalesced", 0)
+                self._store(event.pop("key", "?"), event)
+
+    def _store(self, key: str, event: Dict[str, Any]):
+        self._seq += 1
+        event["seq"] = self._seq
+        self._rings.setdefault(key, deque(maxlen=_M4L_EVENT_RING)).append(event)
+
+    def store_polled(self, changes: Dict[str, list]):
+        """Keep changes polled from the bridge (which clears them) until a read asks for their key."""
+        with self._lock:
+            for key, events in changes.items():
+                for event in events:
+                    self._store(key, dict(event))
+
+    def enable(self, m4l: M4LConnection) -> str:
+        """Switch the bridge to push mode; returns the mode now in effect."""
+        if not m4l.supports("events"):
+            return self.mode
+        m4l.on_event = self.handle
+        if self._start_listener():
+            self._hello.clear()
+            _m4l_result(m4l.send_command("event_stream", {"mode": "port"}))
+            if self._hello.wait(_M4L_EVENT_HELLO_TIMEOUT):
+                self.mode = "port"
+                self._bridge_seq = 0
+                return self.mode
+            logger.info("No hello on M4L event port %d; receiving events inline", self.port)
+        _m4l_result(m4l.send_command("event_stream", {"mode": "inline"}))
+        self.mode = "inline"
+        self._bridge_seq = 0
+        return self.mode
+
+    def read(self, since: Optional[int] = None, key_filter: str = "") -> tuple:
+        """Events newer than ``since`` (default: the shared cursor), grouped by key.
+
+        Returns ({key: [events]}, newest seq).  Reading with the cursors
+        advances only those of the keys that matched ``key_filter``, so a
+        filtered read never consumes other observers' changes.
+        """
+        with self._lock:
+            changes = {}
+            for key, ring in self._rings.items():
+                if key_filter and key_filter not in key:
+                    continue
+                start = self._cursors.get(key, 0) if since is None else since
+                events = [e for e in ring if e["seq"] > start]
+                if events:
+                    changes[key] = events
+                if since is None and ring:
+                    self._cursors[key] = ring[-1]["seq"]
+            return changes, self._seq
+
+    def forget(self, key: str):
+        with self._lock:
+            self._rings.pop(key, None)
+            self._cursors.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, mode=self.mode, keys=len(self._rings), seq=self._seq)
+
+    def stop(self):
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+
+
 @asynccontextmanager
 async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
     """Manage server startup and shutdown lifecycle"""
-    global _server_start_time, _singleton_lock_sock
+    global _server_start_time, _singleton_lock_sock, _tool_count
     try:
         # Singleton guard — prevent duplicate server instances
         try:
@@ -762,9 +2241,11 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
 
         logger.info("AbletonMCP Beta server starting up")
         _server_start_time = time.time()
+        _tool_count = len(await server.list_tools())  # every @mcp.tool() has registered by now
 
         try:
-            ableton = get_ableton_connection()
+            # Connection attempts sleep between retries — keep them off the event loop
+            await asyncio.get_running_loop().run_in_executor(_tool_executor, get_ableton_connection)
             logger.info("Successfully connected to Ableton on startup")
         except Exception as e:
             logger.warning("Could not connect to Ableton on startup: %s", e)
@@ -783,31 +2264,13 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
 
             _m4l_connection = conn
 
-            # Build a raw OSC ping packet
-            ping_id = "autocon"
-            ping_osc = M4LConnection._build_osc_message("/ping", [("s", ping_id)])
-
             for attempt in range(1, 16):  # 15 attempts, ~2s apart
-                try:
-                    # Drain stale data
-                    conn._drain_recv_socket()
-                    conn.recv_sock.settimeout(2.0)
-
-                    # Send ping
-                    conn.send_sock.sendto(ping_osc, (conn.send_host, conn.send_port))
-
-                    # Wait for response
-                    data, _addr = conn.recv_sock.recvfrom(65535)
-                    result = conn._parse_m4l_response(data)
-                    if result.get("status") == "success":
-                        logger.info("M4L bridge auto-connected on attempt %d", attempt)
-                        _m4l_ping_cache["result"] = True
-                        _m4l_ping_cache["timestamp"] = time.time()
-                        return
-                except socket.timeout:
-                    logger.info("M4L auto-connect %d/15: no response (timeout), retrying...", attempt)
-                except Exception as e:
-                    logger.info("M4L auto-connect %d/15: %s", attempt, e)
+                if conn.ping(timeout=2.0):
+                    logger.info("M4L bridge auto-connected on attempt %d", attempt)
+                    _m4l_ping_cache["result"] = True
+                    _m4l_ping_cache["timestamp"] = time.time()
+                    return
+                logger.info("M4L auto-connect %d/15: no response, retrying...", attempt)
                 time.sleep(2)
             logger.warning("M4L bridge not available after 15 attempts — will retry when needed")
 
@@ -835,7 +2298,7 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
             # Step 2: Wait for Ableton, then do a live scan to refresh
             time.sleep(5)  # let Ableton & Remote Script fully settle
             for _ in range(20):  # poll up to 10s more for Ableton connection
-                if _ableton_connection and _ableton_connection.sock:
+                if _ableton_monitor and _ableton_monitor.state in ("connected", "degraded"):
                     break
                 time.sleep(0.5)
             try:
@@ -848,15 +2311,19 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
         yield {}
     finally:
         _stop_dashboard_server()
-        global _ableton_connection, _m4l_connection
-        if _ableton_connection:
+        global _ableton_pool, _ableton_monitor, _m4l_connection
+        if _ableton_monitor:
+            _ableton_monitor.stop()
+            _ableton_monitor = None
+        if _ableton_pool:
             logger.info("Disconnecting from Ableton on shutdown")
-            _ableton_connection.disconnect()
-            _ableton_connection = None
+            _ableton_pool.close()
+            _ableton_pool = None
         if _m4l_connection:
             logger.info("Disconnecting M4L bridge on shutdown")
             _m4l_connection.disconnect()
             _m4l_connection = None
+        _m4l_events.stop()
         _release_singleton_lock(_singleton_lock_sock)
         _singleton_lock_sock = None
         logger.info("AbletonMCP Beta server shut down")
@@ -867,17 +2334,60 @@ mcp = FastMCP(
     lifespan=server_lifespan
 )
 
+# Tool bodies are blocking (socket I/O, sleeps) and run on this bounded pool
+# instead of the event loop; see _tool_handler.
+TOOL_WORKERS = int(os.environ.get("ABLETON_MCP_TOOL_WORKERS", "8"))
+_tool_executor = ThreadPoolExecutor(max_workers=TOOL_WORKERS, thread_name_prefix="mcp-tool")
+
 # Global connections
-_ableton_connection = None
+_ableton_pool: Optional[AbletonConnectionPool] = None
+_ableton_pool_lock = threading.Lock()
+_ableton_monitor: Optional[AbletonConnectionMonitor] = None
 _m4l_connection = None
+_m4l_connect_lock = threading.Lock()
+_m4l_events = M4LEventStream(M4L_EVENT_PORT)
 
 # v1.6.0 feature stores (in-memory, lost on restart)
 _snapshot_store: Dict[str, Dict[str, Any]] = {}
 _macro_store: Dict[str, Dict[str, Any]] = {}
 _param_map_store: Dict[str, Dict[str, Any]] = {}
+_morph_space_store: Dict[str, Dict[str, Any]] = {}
+
+# Parameter writes per (track_index, device_index), so delta caches (morph
+# spaces, compiled macros) notice when something else has set the device
+_device_write_gens: Dict[tuple, int] = {}
+_device_write_lock = threading.Lock()
+_DEVICE_WRITE_COMMANDS = frozenset([
+    "set_device_parameter", "batch_set_device_parameters", "set_device_parameters_batch",
+    "set_hidden_param", "batch_set_hidden_params", "set_param_clean",
+    "rack_variation_action", "device_ab_compare",
+])
+
+
+def _note_device_write(track_index: int, device_index: int) -> int:
+    """Count a parameter write to a device; returns its new write generation."""
+    key = (track_index, device_index)
+    with _device_write_lock:
+        gen = _device_write_gens.get(key, 0) + 1
+        _device_write_gens[key] = gen
+        return gen
+
+
+def _device_write_gen(track_index: int, device_index: int) -> int:
+    with _device_write_lock:
+        return _device_write_gens.get((track_index, device_index), 0)
+
+
+def _note_command_write(command_type: str, params: Optional[Dict[str, Any]]):
+    """_note_device_write for a command that sets a regular track's device parameters."""
+    if command_type not in _DEVICE_WRITE_COMMANDS or not params:
+        return
+    if params.get("track_type", "track") == "track" and "track_index" in params and "device_index" in params:
+        _note_device_write(params["track_index"], params["device_index"])
 
 # Web dashboard state
 _server_start_time: float = 0.0
+_tool_count: int = 0
 _tool_call_log: deque = deque(maxlen=50)
 _tool_call_counts: Dict[str, int] = {}
 _tool_call_lock = threading.Lock()
@@ -993,6 +2503,8 @@ logging.getLogger().addHandler(_dashboard_log_handler)
 # M4L ping cache (avoids 5s UDP timeout on every dashboard refresh)
 _m4l_ping_cache = {"result": False, "timestamp": 0.0}
 _M4L_PING_CACHE_TTL = 5.0
+# Any M4L response proves the bridge is alive; only ping after this much silence
+_M4L_LIVENESS_TTL = float(os.environ.get("ABLETON_MCP_M4L_LIVENESS_TTL", "15"))
 
 # Browser cache — scans Ableton's browser tree and caches all items for instant search
 _browser_cache_flat: List[Dict[str, Any]] = []  # flat list for fast substring search
@@ -1194,15 +2706,11 @@ def _populate_browser_cache(force: bool = False) -> bool:
             return True  # another thread is already scanning
         _browser_cache_populating = True
 
-    # Use a dedicated connection so rapid BFS commands don't corrupt the
-    # shared global socket (which other tools need concurrently).
-    ableton = AbletonConnection(host="localhost", port=9877)
-
+    # Each BFS step checks a connection out of the pool, so the scan never
+    # holds a socket other tools are waiting for.
     try:
         try:
-            if not ableton.connect():
-                logger.warning("Browser cache: cannot connect to Ableton")
-                return False
+            ableton = get_ableton_connection()
         except Exception as e:
             logger.warning("Browser cache: cannot connect to Ableton: %s", e)
             return False
@@ -1226,13 +2734,10 @@ def _populate_browser_cache(force: bool = False) -> bool:
                     result = ableton.send_command("get_browser_items_at_path", {"path": current_path}, timeout=60.0)
                 except Exception as e:
                     logger.warning("Browser cache: failed to read '%s': %s", current_path, e)
-                    # Try to re-establish connection before continuing
+                    # Give the pool a moment, then make sure Ableton is still reachable
                     time.sleep(2)
                     try:
-                        ableton.disconnect()
-                        if not ableton.connect():
-                            logger.warning("Browser cache: lost connection, skipping '%s'", display_name)
-                            break
+                        get_ableton_connection()
                     except Exception:
                         logger.warning("Browser cache: lost connection, skipping '%s'", display_name)
                         break
@@ -1290,11 +2795,6 @@ def _populate_browser_cache(force: bool = False) -> bool:
     finally:
         with _browser_cache_lock:
             _browser_cache_populating = False
-        # Always close the dedicated connection when done
-        try:
-            ableton.disconnect()
-        except Exception:
-            pass
 
 
 def _get_browser_cache() -> List[Dict[str, Any]]:
@@ -1304,7 +2804,7 @@ def _get_browser_cache() -> List[Dict[str, Any]]:
 
 
 # ---------------------------------------------------------------------------
-# Tool call instrumentation — captures all 131 tool calls for the dashboard
+# Tool call instrumentation — captures every tool call for the dashboard
 # ---------------------------------------------------------------------------
 _original_call_tool = mcp.call_tool
 
@@ -1431,6 +2931,14 @@ DASHBOARD_HTML = r"""<!DOCTYPE html>
   <div id="status-banner"></div>
   <div class="grid" id="cards"></div>
   <div class="section" id="top-tools-section"></div>
+  <div class="section">
+    <h2>Ableton Connection State</h2>
+    <div id="conn-state"></div>
+  </div>
+  <div class="section">
+    <h2>Command Latency</h2>
+    <div id="latency-area"></div>
+  </div>
   <div class="section">
     <h2>Recent Tool Calls</h2>
     <div id="log-area"></div>
@@ -1467,15 +2975,23 @@ async function refresh() {
     document.getElementById('cards').innerHTML = [
       card('Server Version', d.version, ''),
       card('Uptime', fmtUp(d.uptime_seconds), ''),
-      card('Ableton', d.ableton_connected?'Connected':'Disconnected',
-           d.ableton_connected?'status-ok':'status-err'),
+      card('Ableton', d.connection_state ? d.connection_state.state : 'Disconnected',
+           {connected:'status-ok',degraded:'status-warn'}[d.connection_state&&d.connection_state.state]||'status-err'),
       card('M4L Bridge',
            d.m4l_connected?'Connected':d.m4l_sockets_ready?'Sockets Ready':'Disconnected',
            d.m4l_connected?'status-ok':d.m4l_sockets_ready?'status-warn':'status-err'),
       card('Snapshots', d.store_counts.snapshots, ''),
       card('Macros', d.store_counts.macros, ''),
       card('Param Maps', d.store_counts.param_maps, ''),
+      card('Morph Spaces', d.store_counts.morph_spaces, ''),
       card('Total Tool Calls', d.total_tool_calls, ''),
+      d.connection_pool ? card('Connection Pool',
+           d.connection_pool.in_use+' busy / '+d.connection_pool.open+' open / '+d.connection_pool.size,
+           d.connection_pool.timeouts?'status-warn':'') : '',
+      d.connection_pool ? card('Pool Waits',
+           d.connection_pool.waits+' (avg '+d.connection_pool.wait_ms_avg+'ms)', '') : '',
+      card('Compression Saved',
+           (d.compression.bytes_saved/1024).toFixed(1)+' KB ('+d.compression.frames+' frames)', ''),
     ].join('');
     // Top tools
     const tt = document.getElementById('top-tools-section');
@@ -1487,6 +3003,26 @@ async function refresh() {
         '<span class="bar-count">'+c+'</span></div></div>'
       ).join('');
     } else { tt.innerHTML = '<h2>Most Used Tools</h2><p class="empty-msg">No tool calls yet</p>'; }
+    // Connection state transitions
+    const cs = document.getElementById('conn-state');
+    const st = d.connection_state;
+    if (st && st.transitions.length) {
+      cs.innerHTML = '<table><thead><tr><th>Time</th><th>From</th><th>To</th><th>Reason</th></tr></thead><tbody>'+
+        st.transitions.slice().reverse().map(t=>
+          '<tr><td>'+t.ts+'</td><td>'+t.from+'</td><td>'+t.to+'</td><td>'+escHtml(t.reason)+'</td></tr>'
+        ).join('')+'</tbody></table>';
+    } else { cs.innerHTML = '<p class="empty-msg">'+(st?'State: '+st.state+' since '+st.since:'Not started')+'</p>'; }
+    // Latency histograms
+    const lt = document.getElementById('latency-area');
+    const lrows = d.latency.ableton.map(r=>['Remote Script',r]).concat(d.latency.m4l.map(r=>['M4L',r]));
+    if (lrows.length) {
+      lt.innerHTML = '<table><thead><tr><th>Link</th><th>Command</th><th>Samples</th><th>p50</th><th>p95</th><th>p99</th><th>Max</th><th>Timeouts</th></tr></thead><tbody>'+
+        lrows.map(([link,r])=>
+          '<tr><td>'+link+'</td><td>'+r.command+'</td><td>'+r.samples+'</td><td>'+r.p50_ms+'ms</td><td>'+
+          r.p95_ms+'ms</td><td>'+r.p99_ms+'ms</td><td>'+r.max_ms+'ms</td>'+
+          '<td class="'+(r.timeouts?'error-cell':'')+'">'+r.timeouts+'</td></tr>'
+        ).join('')+'</tbody></table>';
+    } else { lt.innerHTML = '<p class="empty-msg">No commands yet</p>'; }
     // Log
     const la = document.getElementById('log-area');
     if (d.recent_calls.length) {
@@ -1543,6 +3079,8 @@ def _get_m4l_status() -> tuple:
     sockets_ready = bool(_m4l_connection and _m4l_connection._connected)
     if not sockets_ready:
         return False, False
+    if _m4l_connection.is_fresh(_M4L_PING_CACHE_TTL):
+        return True, True
 
     now = time.time()
     if now - _m4l_ping_cache["timestamp"] < _M4L_PING_CACHE_TTL:
@@ -1558,15 +3096,20 @@ def _get_m4l_status() -> tuple:
     return sockets_ready, result
 
 
+def _get_compression_stats() -> dict:
+    """Client-side compression totals (bytes saved, decompression time)."""
+    with _compression_stats_lock:
+        stats = dict(_compression_stats)
+    stats["bytes_saved"] = stats["raw_bytes"] - stats["wire_bytes"]
+    stats["decompress_ms"] = round(stats["decompress_ms"], 2)
+    return stats
+
+
 def _build_status_json() -> dict:
     """Collect all dashboard status data into a JSON-serializable dict."""
-    ableton_connected = False
-    if _ableton_connection and _ableton_connection.sock:
-        try:
-            _ableton_connection.sock.getpeername()
-            ableton_connected = True
-        except Exception:
-            pass
+    pool = _ableton_pool
+    monitor = _ableton_monitor
+    ableton_connected = monitor.state in ("connected", "degraded") if monitor else False
 
     m4l_sockets_ready, m4l_connected = _get_m4l_status()
 
@@ -1586,18 +3129,26 @@ def _build_status_json() -> dict:
         "version": _get_server_version(),
         "uptime_seconds": round(time.time() - _server_start_time, 1) if _server_start_time else 0,
         "ableton_connected": ableton_connected,
+        "connection_state": monitor.status() if monitor else None,
+        "connection_pool": pool.metrics() if pool else None,
+        "compression": _get_compression_stats(),
+        "latency": {"ableton": _ableton_latency.metrics()[:15], "m4l": _m4l_latency.metrics()[:15]},
         "m4l_connected": m4l_connected,
         "m4l_sockets_ready": m4l_sockets_ready,
+        "m4l_requests": _m4l_connection.metrics() if _m4l_connection else None,
+        "param_schemas": dict(_param_schema_stats, cached=len(_param_schemas)),
+        "m4l_events": _m4l_events.stats(),
         "store_counts": {
             "snapshots": len(_snapshot_store),
             "macros": len(_macro_store),
             "param_maps": len(_param_map_store),
+            "morph_spaces": len(_morph_space_store),
         },
         "total_tool_calls": total,
         "top_tools": top_tools,
         "recent_calls": recent,
         "server_logs": server_logs,
-        "tool_count": 131,
+        "tool_count": _tool_count,
     }
 
 
@@ -1649,77 +3200,91 @@ def _stop_dashboard_server():
         logger.info("Dashboard server stopped")
 
 
-def get_ableton_connection():
-    """Get or create a persistent Ableton connection"""
-    global _ableton_connection
-    
-    if _ableton_connection is not None:
-        try:
-            # Test if the socket is still connected
-            if _ableton_connection.sock is None:
-                raise ConnectionError("Socket is None")
-            _ableton_connection.sock.settimeout(1.0)
-            _ableton_connection.sock.getpeername()  # raises if disconnected
-            return _ableton_connection
-        except Exception as e:
-            logger.warning("Existing connection is no longer valid: %s", e)
-            try:
-                _ableton_connection.disconnect()
-            except Exception:
-                pass
-            _ableton_connection = None
-    
-    # Connection doesn't exist or is invalid, create a new one
-    if _ableton_connection is None:
-        # Try to connect up to 3 times with a short delay between attempts
-        max_attempts = 3
-        for attempt in range(1, max_attempts + 1):
-            try:
-                logger.info("Connecting to Ableton (attempt %d/%d)...", attempt, max_attempts)
-                _ableton_connection = AbletonConnection(host="localhost", port=9877)
-                if _ableton_connection.connect():
-                    logger.info("Created new persistent connection to Ableton")
-                    
-                    # Validate connection with a simple command
-                    try:
-                        # Get session info as a test
-                        _ableton_connection.send_command("get_session_info")
-                        logger.info("Connection validated successfully")
-                        return _ableton_connection
-                    except Exception as e:
-                        logger.error("Connection validation failed: %s", e)
-                        _ableton_connection.disconnect()
-                        _ableton_connection = None
-                        # Continue to next attempt
-                else:
-                    _ableton_connection = None
-            except Exception as e:
-                logger.error("Connection attempt %d failed: %s", attempt, e)
-                if _ableton_connection:
-                    _ableton_connection.disconnect()
-                    _ableton_connection = None
-            
-            # Wait before trying again, but only if we have more attempts left
-            if attempt < max_attempts:
-                time.sleep(1.0)
-        
-        # If we get here, all connection attempts failed
-        if _ableton_connection is None:
-            logger.error("Failed to connect to Ableton after multiple attempts")
-            raise Exception("Could not connect to Ableton. Make sure the Remote Script is running.")
-    
-    return _ableton_connection
+def iter_result_pages(ableton, command_type: str, params: Dict[str, Any], page_size: int = _PAGE_SIZE):
+    """Lazily yield the page responses of a paginated command.
+
+    Each page is a normal response dict (e.g. "notes" plus clip metadata)
+    carrying "total", "offset" and "next_offset"; only one page is held at a
+    time.  Older Remote Scripts ignore offset/limit and answer with a single
+    full response, which is yielded as the only page.
+
+    Paging bounds the size of each response, not Live's work: note commands
+    read the whole clip on every page.  Callers that need every item anyway
+    should send one unpaged command instead.
+    """
+    offset = 0
+    while True:
+        page = ableton.send_command(command_type, dict(params, offset=offset, limit=page_size))
+        yield page
+        next_offset = page.get("next_offset")
+        if next_offset is None or next_offset <= offset:
+            return
+        offset = next_offset
+
+
+def _page_params(offset: int, limit: Optional[int]) -> Dict[str, Any]:
+    """Validate tool-level offset/limit and return the params to forward."""
+    _validate_index(offset, "offset")
+    if limit is None:
+        return {"offset": offset} if offset else {}
+    _validate_range(limit, "limit", 1, 100000)
+    return {"offset": offset, "limit": limit}
+
+
+def get_ableton_connection() -> AbletonConnectionPool:
+    """Get the Ableton connection pool.
+
+    The pool has the same send_command / send_commands / send_batch /
+    send_udp_command interface as AbletonConnection; each call checks out
+    its own connection.  Reachability is tracked by the background
+    heartbeat — while it reports "down" a tool call makes one connection
+    attempt of its own (so it works as soon as Live is back, without
+    waiting for the backoff) and fails if that attempt does.
+    """
+    global _ableton_pool, _ableton_monitor
+
+    with _ableton_pool_lock:
+        if _ableton_pool is None:
+            _ableton_pool = AbletonConnectionPool(host="localhost", port=9877)
+        if _ableton_monitor is None:
+            _ableton_monitor = AbletonConnectionMonitor(_ableton_pool)
+            _ableton_monitor.start()
+        pool, monitor = _ableton_pool, _ableton_monitor
+
+    if monitor.state == "down" and not monitor.try_reconnect():
+        retry = monitor.next_attempt_at - time.time()
+        raise Exception(
+            f"Could not connect to Ableton (unreachable since {monitor.status()['since']}, "
+            f"next retry in {max(0.0, retry):.0f}s). Make sure the Remote Script is running."
+        )
+    return pool
 
 
 def get_m4l_connection() -> M4LConnection:
     """Get or create a connection to the M4L bridge device.
 
-    Always attempts a fresh connection if the existing one is dead.
-    Includes a ping to verify the M4L device is actually responding.
+    Liveness is tracked passively: if the bridge answered anything within
+    _M4L_LIVENESS_TTL the connection is returned as-is, and a dead bridge is
+    caught by the actual command's timeout.  Only an idle connection is
+    pinged first.  Always attempts a fresh connection if the existing one is dead.
     """
     global _m4l_connection
 
-    # If we have a connected instance, verify it still works with a ping
+    if _m4l_connection is not None and _m4l_connection.is_fresh(_M4L_LIVENESS_TTL):
+        return _m4l_connection
+
+    with _m4l_connect_lock:  # one ping / socket bind at a time
+        return _verify_m4l_connection()
+
+
+def _verify_m4l_connection() -> M4LConnection:
+    """Slow path of get_m4l_connection: ping an idle connection or open a new one."""
+    global _m4l_connection
+
+    if _m4l_connection is not None and _m4l_connection.is_fresh(_M4L_LIVENESS_TTL):
+        return _m4l_connection  # another caller verified it while we waited
+
+    # Idle for a while — verify it still works with a ping
     if _m4l_connection is not None and _m4l_connection._connected:
         if _m4l_connection.ping():
             return _m4l_connection
@@ -1757,34 +3322,65 @@ def _m4l_batch_set_params(
     device_index: int,
     parameters: List[Dict],
 ) -> Dict[str, Any]:
-    """Set multiple hidden parameters by sending individual set_hidden_param
-    commands sequentially.  More reliable than the base64-encoded batch OSC
-    approach which can fail with longer payloads in Max.
+    """Set multiple hidden parameters on one device.
+
+    Bridges that support OSC bundles get every value in a few datagrams and
+    answer once.  Entries lost in transit go out again as one
+    batch_set_hidden_params command whose payload is uploaded in
+    acknowledged chunks (see M4LConnection.upload_payload).  Older bridges
+    get individual set_hidden_param commands, several in flight at once,
+    since their single-symbol base64 batch can fail with longer payloads
+    in Max.
 
     Returns a dict with keys: params_set, params_failed, total_requested, errors.
     """
     ok = 0
     failed = 0
     errors: List[str] = []
-    for p in parameters:
-        try:
-            result = m4l.send_command("set_hidden_param", {
-                "track_index": track_index,
-                "device_index": device_index,
-                "parameter_index": int(p["index"]),
-                "value": float(p["value"]),
-            })
-            if result.get("status") == "success":
-                ok += 1
-            else:
-                failed += 1
-                errors.append(f"[{p['index']}]: {result.get('message', '?')}")
-        except Exception as e:
+    if m4l.supports("bundles"):
+        result = _m4l_result(m4l.send_param_bundle(
+            [(track_index, device_index, int(p["index"]), float(p["value"])) for p in parameters]
+        ))
+        ok = result.get("params_set", 0)
+        failed = result.get("params_failed", 0)
+        errors = [f"[{e.get('index')}]: {e.get('error', '?')}" for e in result.get("errors", [])]
+        missing = [parameters[seq] for seq in result.get("missing", [])]
+        if not missing:
+            return {"params_set": ok, "params_failed": failed, "total_requested": ok + failed, "errors": errors}
+        logger.warning("M4L bundle: %d of %d entries lost in transit, resending", len(missing), len(parameters))
+        parameters = missing
+        if m4l.supports("uploads") and len(parameters) > 1:
+            try:
+                result = _m4l_result(m4l.send_command("batch_set_hidden_params", {
+                    "track_index": track_index,
+                    "device_index": device_index,
+                    "parameters": [{"index": int(p["index"]), "value": float(p["value"])} for p in parameters],
+                }))
+                return {
+                    "params_set": ok + result.get("params_set", 0),
+                    "params_failed": failed + result.get("params_failed", 0),
+                    "total_requested": ok + failed + len(parameters),
+                    "errors": errors + [f"[{e.get('index')}]: {e.get('error', '?')}"
+                                        for e in result.get("errors", [])],
+                }
+            except Exception as e:
+                logger.warning("M4L batch resend failed (%s), falling back to single sets", e)
+
+    responses = m4l.send_commands([
+        ("set_hidden_param", {
+            "track_index": track_index,
+            "device_index": device_index,
+            "parameter_index": int(p["index"]),
+            "value": float(p["value"]),
+        })
+        for p in parameters
+    ])
+    for p, result in zip(parameters, responses):
+        if result.get("status") == "success":
+            ok += 1
+        else:
             failed += 1
-            errors.append(f"[{p['index']}]: {str(e)}")
-        # Small delay to let Ableton breathe when setting many params
-        if len(parameters) > 6:
-            time.sleep(0.05)
+            errors.append(f"[{p['index']}]: {result.get('message', '?')}")
     return {
         "params_set": ok,
         "params_failed": failed,
@@ -1793,6 +3389,204 @@ def _m4l_batch_set_params(
     }
 
 
+# --- Parameter schema cache ---
+# Names, ranges, quantization and value_items are fixed for a device class and
+# parameter layout, so full discover_params results are kept on disk keyed by
+# (device class, parameter count, name signature).  Later discoveries of the
+# same layout only read names and values (get_param_values) and merge them in.
+_PARAM_SCHEMA_CACHE_PATH = os.path.join(_BROWSER_DISK_CACHE_DIR, "param_schemas.json.gz")
+_PARAM_SCHEMA_CACHE_MAX = 500  # layouts kept; least recently stored are dropped
+_param_schemas: Dict[str, Dict[str, Any]] = {}
+_param_schemas_loaded = False
+_param_schema_lock = threading.Lock()
+_param_schema_stats = {"hits": 0, "misses": 0, "stored": 0}
+
+
+def _param_schema_key(device_class: str, names: List[Optional[str]]) -> str:
+    """Cache key for a parameter layout; ``names`` is indexed by parameter index."""
+    names = list(names)
+    while names and names[-1] is None:
+        names.pop()
+    signature = "\x1f".join(n if n is not None else "" for n in names)
+    digest = hashlib.sha1(signature.encode("utf-8")).hexdigest()[:16]
+    return f"{device_class}|{len(names)}|{digest}"
+
+
+def _load_param_schemas() -> None:
+    """Read the on-disk schema cache once per process."""
+    global _param_schemas_loaded
+    with _param_schema_lock:
+        if _param_schemas_loaded:
+            return
+        _param_schemas_loaded = True
+        try:
+            with gzip.open(_PARAM_SCHEMA_CACHE_PATH, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict) and data.get("version") == 1:
+                _param_schemas.update(data.get("schemas", {}))
+                logger.info("Loaded %d parameter schemas from disk", len(_param_schemas))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("Failed to load parameter schema cache: %s", e)
+
+
+def _save_param_schemas() -> None:
+    """Persist the schema cache (atomic replace, gzip like the browser cache)."""
+    try:
+        with _param_schema_lock:
+            data = {"version": 1, "schemas": dict(_param_schemas)}
+        os.makedirs(_BROWSER_DISK_CACHE_DIR, exist_ok=True)
+        tmp_path = _PARAM_SCHEMA_CACHE_PATH + ".tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, _PARAM_SCHEMA_CACHE_PATH)
+    except Exception as e:
+        logger.warning("Failed to save parameter schema cache: %s", e)
+
+
+def _store_param_schema(data: Dict[str, Any]) -> bool:
+    """Remember the static part of a discover_params result; True if it was new."""
+    parameters = data.get("parameters", [])
+    if not parameters:
+        return False
+    names: List[Optional[str]] = [None] * (max(p["index"] for p in parameters) + 1)
+    for p in parameters:
+        names[p["index"]] = p.get("name")
+    device_class = data.get("device_class", "Unknown")
+    key = _param_schema_key(device_class, names)
+    schema = [{k: v for k, v in p.items() if k != "value"} for p in parameters]
+    with _param_schema_lock:
+        known = _param_schemas.get(key)
+        _param_schemas[key] = {"device_class": device_class, "parameters": schema, "saved": time.time()}
+        if len(_param_schemas) > _PARAM_SCHEMA_CACHE_MAX:
+            oldest = min(_param_schemas, key=lambda k: _param_schemas[k]["saved"])
+            del _param_schemas[oldest]
+        if known is None or known["parameters"] != schema:
+            _param_schema_stats["stored"] += 1
+            return True
+    return False
+
+
+def _merge_param_schema(values: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build a discover_params result from a get_param_values reply, or None on a cache miss."""
+    device_class = values.get("device_class", "Unknown")
+    current = values.get("values", [])
+    key = _param_schema_key(device_class, values.get("names", []))
+    with _param_schema_lock:
+        schema = _param_schemas.get(key)
+        if schema is None:
+            _param_schema_stats["misses"] += 1
+            return None
+        _param_schema_stats["hits"] += 1
+    parameters = [
+        dict(p, value=current[p["index"]])
+        for p in schema["parameters"]
+        if p["index"] < len(current) and current[p["index"]] is not None
+    ]
+    return {
+        "device_name": values.get("device_name", "Unknown"),
+        "device_class": device_class,
+        "parameter_count": len(parameters),
+        "parameters": parameters,
+    }
+
+
+def _m4l_discover_params(m4l: M4LConnection, targets: List[tuple]) -> List[Dict[str, Any]]:
+    """discover_params for (track_index, device_index) pairs, using the schema cache.
+
+    Devices whose layout is cached cost one get_param_values read (names and
+    values only); the rest get a full discovery, which is then cached.
+
+    Returns raw bridge responses in target order, like M4LConnection.send_commands.
+    """
+    _load_param_schemas()
+    responses: List[Optional[Dict[str, Any]]] = [None] * len(targets)
+    if m4l.supports("param_values") and _param_schemas:
+        reads = m4l.send_commands([
+            ("get_param_values", {"track_index": ti, "device_index": di}) for ti, di in targets
+        ])
+        for i, read in enumerate(reads):
+            if read.get("status") == "success":
+                merged = _merge_param_schema(read.get("result", {}))
+                if merged is not None:
+                    responses[i] = {"status": "success", "result": merged}
+
+    missing = [i for i, response in enumerate(responses) if response is None]
+    if missing:
+        full = m4l.send_commands([
+            ("discover_params", {"track_index": targets[i][0], "device_index": targets[i][1]})
+            for i in missing
+        ])
+        stored = False
+        for i, response in zip(missing, full):
+            if response.get("status") == "success":
+                stored = _store_param_schema(response.get("result", {})) or stored
+            responses[i] = response
+        if stored:
+            _save_param_schemas()
+    return responses
+
+
+# Fraction of a parameter's range within which a restore treats it as already set
+_RESTORE_TOLERANCE = 1e-4
+
+
+def _m4l_restore_deltas(
+    m4l: M4LConnection,
+    restores: List[tuple],
+    tolerance: float = _RESTORE_TOLERANCE,
+) -> List[List[Dict]]:
+    """Trim (track_index, device_index, snapshot_parameters) restores to what differs.
+
+    Current values come from one get_param_values read per device (all in
+    flight together); a parameter is kept when its value is further than
+    ``tolerance`` × its range from the snapshot value.  Quantized
+    parameters, and snapshots without a min/max, are compared exactly.
+    Bridges without get_param_values, and devices whose read fails,
+    restore everything.
+
+    Returns one list of {"index", "value"} per restore, in order.
+    """
+    wanted = [[{"index": p["index"], "value": p["value"]} for p in params] for _, _, params in restores]
+    if not m4l.supports("param_values"):
+        return wanted
+    reads = m4l.send_commands([
+        ("get_param_values", {"track_index": ti, "device_index": di}) for ti, di, _ in restores
+    ])
+    deltas = []
+    for (_, _, params), read, everything in zip(restores, reads, wanted):
+        if read.get("status") != "success":
+            deltas.append(everything)
+            continue
+        current = read.get("result", {}).get("values", [])
+        changed = []
+        for p in params:
+            now = current[p["index"]] if p["index"] < len(current) else None
+            if p.get("is_quantized") or "min" not in p or "max" not in p:
+                slack = 0.0
+            else:
+                slack = abs(p["max"] - p["min"]) * tolerance
+            if now is None or abs(now - p["value"]) > slack:
+                changed.append({"index": p["index"], "value": p["value"]})
+        deltas.append(changed)
+    return deltas
+
+
+def _m4l_param_values(m4l: M4LConnection, track_index: int, device_index: int) -> Optional[List[float]]:
+    """Current values of a device's parameters (by index) via get_param_values, or None if unavailable."""
+    if not m4l.supports("param_values"):
+        return None
+    try:
+        result = m4l.send_command("get_param_values", {"track_index": track_index, "device_index": device_index})
+    except Exception as e:
+        logger.debug("get_param_values failed: %s", e)
+        return None
+    if result.get("status") != "success":
+        return None
+    return result.get("result", {}).get("values", [])
+
+
 # --- Input validation helpers ---
 
 def _validate_index(value: int, name: str) -> None:
@@ -2008,10 +3802,12 @@ def _tool_handler(error_prefix: str):
     Catches ValueError -> "Invalid input: ...",
     ConnectionError -> "M4L bridge not available: ...",
     Exception -> "Error {prefix}: ..."
+
+    The returned wrapper is async: the (blocking) tool body runs on
+    _tool_executor so a slow command never stalls the MCP event loop.
     """
     def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
+        def run(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except ValueError as e:
@@ -2021,6 +3817,11 @@ def _tool_handler(error_prefix: str):
             except Exception as e:
                 logger.error("Error %s: %s", error_prefix, e)
                 return f"Error {error_prefix}: {e}"
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_tool_executor, functools.partial(run, *args, **kwargs))
         return wrapper
     return decorator
 
@@ -2197,7 +3998,8 @@ def delete_clip(ctx: Context, track_index: int, clip_index: int) -> str:
 @_tool_handler("getting clip notes")
 def get_clip_notes(ctx: Context, track_index: int, clip_index: int,
                    start_time: float = 0.0, time_span: float = 0.0,
-                   start_pitch: int = 0, pitch_span: int = 128) -> str:
+                   start_pitch: int = 0, pitch_span: int = 128,
+                   offset: int = 0, limit: int = None) -> str:
     """
     Get MIDI notes from a clip.
 
@@ -2212,6 +4014,10 @@ def get_clip_notes(ctx: Context, track_index: int, clip_index: int,
     - time_span: Duration in beats to retrieve (default: 0.0 = entire clip)
     - start_pitch: Lowest MIDI pitch to retrieve (default: 0)
     - pitch_span: Range of pitches to retrieve (default: 128 = all pitches)
+    - offset: Index of the first note to return (default: 0)
+    - limit: Maximum notes to return (default: all). For dense clips, page through
+      with limit and the returned next_offset (null on the last page); total is the
+      full note count.
     """
     _validate_index(track_index, "track_index")
     _validate_index(clip_index, "clip_index")
@@ -2228,7 +4034,8 @@ def get_clip_notes(ctx: Context, track_index: int, clip_index: int,
         "start_time": start_time,
         "time_span": time_span,
         "start_pitch": start_pitch,
-        "pitch_span": pitch_span
+        "pitch_span": pitch_span,
+        **_page_params(offset, limit),
     })
     return json.dumps(result)
 @mcp.tool()
@@ -3129,35 +4936,394 @@ def realtime_set_parameter(ctx: Context, track_index: int, device_index: int,
 def realtime_batch_set_parameters(ctx: Context, track_index: int, device_index: int,
                                   parameters: str, track_type: str = "track") -> str:
     """
-    Set multiple device parameters at once via UDP for real-time control (fire-and-forget).
+    Set multiple device parameters at once via UDP for real-time control (fire-and-forget).
+
+    Use for rapid multi-param changes (e.g., morphing presets in real-time).
+    No response confirmation — fire-and-forget. For confirmed batch updates,
+    use set_device_parameters instead.
+
+    Parameters:
+    - track_index: The index of the track containing the device
+    - device_index: The index of the device on the track
+    - parameters: JSON string of parameter list, e.g. '[{"name": "Filter Freq", "value": 0.5}]'
+    - track_type: Type of track: "track" (default), "return", or "master"
+    """
+    _validate_index(track_index, "track_index")
+    _validate_index(device_index, "device_index")
+    if track_type not in ("track", "return", "master"):
+        return "Error: track_type must be 'track', 'return', or 'master'"
+
+    params_list = json.loads(parameters) if isinstance(parameters, str) else parameters
+    if not isinstance(params_list, list) or not params_list:
+        return "Error: parameters must be a non-empty JSON array of {name, value} objects"
+
+    ableton = get_ableton_connection()
+    ableton.send_udp_command("batch_set_device_parameters", {
+        "track_index": track_index,
+        "device_index": device_index,
+        "parameters": params_list,
+        "track_type": track_type,
+    })
+    return f"Sent real-time batch update for {len(params_list)} parameters (fire-and-forget via UDP)"
+# ======================================================================
+# Parameter Ramp Engine (UDP realtime channel)
+# ======================================================================
+
+RAMP_RATE_HZ = min(200.0, max(10.0, float(os.environ.get("ABLETON_MCP_RAMP_RATE", "100"))))
+_RAMP_CURVES = ("linear", "exponential", "s_curve", "lfo")
+_RAMP_EXP_K = 4.0          # steepness of the exponential curve
+_RAMP_MAX_DURATION = 600.0
+_RAMP_JITTER_WINDOW = 2000
+_RAMP_HANDLE_REFRESH = 1.0  # seconds between handle re-resolves (track list changes invalidate them)
+
+
+def _curve_shape(curve: str, p: float) -> float:
+    """Eased position (0..1) of a linear, exponential or s_curve ramp at progress ``p`` (0..1)."""
+    if curve == "exponential":
+        return (math.exp(_RAMP_EXP_K * p) - 1) / (math.exp(_RAMP_EXP_K) - 1)
+    if curve == "s_curve":
+        return 0.5 - 0.5 * math.cos(math.pi * p)
+    return p
+
+
+class _Ramp:
+    """One parameter moving from start_value to end_value over duration seconds."""
+
+    def __init__(self, ramp_id: str, target: Dict[str, Any], start_value: float, end_value: float,
+                 duration: float, curve: str, lfo_rate: float, handle: Optional[int] = None):
+        self.id = ramp_id
+        self.target = target  # track_index / device_index / parameter_name / track_type
+        self.handle = handle  # numeric parameter handle, when the Remote Script supports them
+        self.start_value = start_value
+        self.end_value = end_value
+        self.duration = duration
+        self.curve = curve
+        self.lfo_rate = lfo_rate
+        self.started = time.perf_counter()
+        self.resolved_at = self.started
+        self.last_sent: Optional[float] = None
+        self.updates_sent = 0
+
+    @property
+    def key(self) -> tuple:
+        t = self.target
+        return (t["track_type"], t["track_index"], t["device_index"], t["parameter_name"])
+
+    def shape(self, elapsed: float) -> float:
+        """Curve position (0 = start_value, 1 = end_value) after ``elapsed`` seconds."""
+        if self.curve == "lfo":
+            # Oscillates start → end → start at lfo_rate Hz for the whole duration
+            return 0.5 - 0.5 * math.cos(2 * math.pi * self.lfo_rate * elapsed)
+        p = min(1.0, elapsed / self.duration) if self.duration > 0 else 1.0
+        return _curve_shape(self.curve, p)
+
+    def value_at(self, now: float) -> tuple:
+        """(value, finished) at perf_counter time ``now``."""
+        elapsed = now - self.started
+        finished = elapsed >= self.duration
+        if finished:
+            # LFOs come back to where they started; ramps land exactly on the target
+            return (self.start_value if self.curve == "lfo" else self.end_value), True
+        return self.start_value + (self.end_value - self.start_value) * self.shape(elapsed), False
+
+    def describe(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self.started
+        return dict(self.target, ramp_id=self.id, curve=self.curve, start_value=self.start_value,
+                    end_value=self.end_value, duration=self.duration,
+                    progress=round(min(1.0, elapsed / self.duration) if self.duration else 1.0, 3),
+                    current_value=self.last_sent, updates_sent=self.updates_sent)
+
+
+class RampEngine:
+    """Streams interpolated parameter values over UDP from one scheduler thread.
+
+    The thread only runs while ramps are active.  Values are computed from
+    the actual wake-up time, so late ticks never distort a curve; how late
+    they were is kept as jitter statistics.  Starting a ramp on a parameter
+    that is already ramping replaces the old ramp.
+
+    Ramps carry a numeric parameter handle when the Remote Script supports
+    them, so each tick's values go out as one binary datagram with no name
+    lookups on the Live side.  The Remote Script invalidates handles when
+    tracks or devices change (and drops their values), so a helper thread
+    re-resolves each handle every ``_RAMP_HANDLE_REFRESH`` seconds; a ramp
+    whose handle can't be resolved again falls back to name-addressed UDP.
+    """
+
+    def __init__(self, rate_hz: float = RAMP_RATE_HZ):
+        self.rate_hz = rate_hz
+        self._ramps: Dict[str, _Ramp] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._ids = itertools.count(1)
+        self._jitter: deque = deque(maxlen=_RAMP_JITTER_WINDOW)
+        self._refreshing = False
+        self._stats = {"ticks": 0, "late_ticks": 0, "updates_sent": 0, "completed": 0, "cancelled": 0,
+                       "handles_refreshed": 0, "handle_fallbacks": 0}
+
+    def start_ramp(self, target: Dict[str, Any], start_value: float, end_value: float,
+                   duration: float, curve: str = "linear", lfo_rate: float = 1.0,
+                   handle: Optional[int] = None) -> str:
+        ramp = _Ramp(f"ramp-{next(self._ids)}", target, start_value, end_value, duration, curve,
+                     lfo_rate, handle)
+        with self._cond:
+            for other in [r for r in self._ramps.values() if r.key == ramp.key]:
+                del self._ramps[other.id]
+                self._stats["cancelled"] += 1
+            self._ramps[ramp.id] = ramp
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="ramp-scheduler")
+                self._thread.start()
+            self._cond.notify()
+        return ramp.id
+
+    def cancel(self, ramp_id: Optional[str] = None) -> int:
+        """Cancel one ramp (or all when ramp_id is None); parameters keep their current value."""
+        with self._cond:
+            ids = list(self._ramps) if ramp_id is None else [ramp_id] if ramp_id in self._ramps else []
+            for rid in ids:
+                del self._ramps[rid]
+            self._stats["cancelled"] += len(ids)
+        return len(ids)
+
+    def list_ramps(self) -> List[Dict[str, Any]]:
+        with self._cond:
+            ramps = list(self._ramps.values())
+        return [r.describe() for r in ramps]
+
+    def _send(self, updates: List[tuple]):
+        """Send one tick's (ramp, value) updates.
+
+        Handle-addressed ramps share binary datagrams; ramps without a
+        handle fall back to one name-addressed JSON datagram each.
+        """
+        updates = [(r, v) for r, v in updates
+                   if r.last_sent is None or abs(v - r.last_sent) >= 1e-9]  # skip unmoved values
+        if not updates:
+            return
+        try:
+            ableton = get_ableton_connection()
+            handled = [(r.handle, v) for r, v in updates if r.handle is not None]
+            if handled:
+                ableton.send_udp_parameter_values(handled)
+                for ramp, _ in updates:
+                    t = ramp.target
+                    if ramp.handle is not None and t["track_type"] == "track":
+                        _note_device_write(t["track_index"], t["device_index"])
+            for ramp, value in updates:
+                if ramp.handle is None:
+                    ableton.send_udp_command("set_device_parameter", dict(ramp.target, value=value))
+        except Exception as e:
+            logger.debug("Ramp send failed: %s", e)
+            return
+        for ramp, value in updates:
+            ramp.last_sent = value
+            ramp.updates_sent += 1
+        self._stats["updates_sent"] += len(updates)
+
+    def _run(self):
+        period = 1.0 / self.rate_hz
+        next_tick = time.perf_counter()
+        while True:
+            with self._cond:
+                while not self._ramps:
+                    self._cond.wait()
+                    next_tick = time.perf_counter()
+                ramps = list(self._ramps.values())
+
+            now = time.perf_counter()
+            self._jitter.append(now - next_tick)
+            self._stats["ticks"] += 1
+            updates = []
+            finished = []
+            for ramp in ramps:
+                value, done = ramp.value_at(now)
+                updates.append((ramp, value))
+                if done:
+                    finished.append(ramp.id)
+            self._send(updates)
+            if finished:
+                with self._cond:
+                    for ramp_id in finished:
+                        if self._ramps.pop(ramp_id, None) is not None:
+                            self._stats["completed"] += 1
+            self._schedule_refresh(ramps, now)
+
+            next_tick += period
+            if next_tick < time.perf_counter():
+                self._stats["late_ticks"] += 1
+                next_tick = time.perf_counter() + period
+            time.sleep(max(0.0, next_tick - time.perf_counter()))
+
+    def _schedule_refresh(self, ramps: List[_Ramp], now: float):
+        """Hand handle-addressed ramps that are due a re-resolve to the refresh thread."""
+        due = [r for r in ramps if r.handle is not None and now - r.resolved_at >= _RAMP_HANDLE_REFRESH]
+        if not due:
+            return
+        with self._cond:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._refresh_handles, args=(due,), daemon=True,
+                         name="ramp-handle-refresh").start()
+
+    def _refresh_handles(self, ramps: List[_Ramp]):
+        """Re-resolve ramp handles over TCP, off the scheduler thread."""
+        try:
+            for ramp in ramps:
+                t = ramp.target
+                try:
+                    resolved = get_ableton_connection().resolve_parameter_handle(
+                        t["track_index"], t["device_index"], t["parameter_name"], t["track_type"])
+                    handle = resolved["handle"] if resolved else None
+                except Exception as e:
+                    logger.debug("Ramp %s handle refresh failed: %s", ramp.id, e)
+                    handle = None
+                if handle != ramp.handle:
+                    if handle is None:
+                        logger.info("Ramp %s lost its parameter handle, using name-addressed UDP", ramp.id)
+                    with self._cond:
+                        self._stats["handles_refreshed" if handle is not None else "handle_fallbacks"] += 1
+                    ramp.handle = handle
+                    ramp.last_sent = None  # the value sent to the old handle was dropped
+                ramp.resolved_at = time.perf_counter()
+        finally:
+            with self._cond:
+                self._refreshing = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Scheduler counters plus tick jitter (how late each tick woke up), in ms."""
+        with self._cond:
+            active = len(self._ramps)
+        jitter = sorted(self._jitter)
+        stats = dict(self._stats, rate_hz=self.rate_hz, active_ramps=active)
+        if jitter:
+            stats["jitter_ms"] = {
+                "mean": round(sum(jitter) / len(jitter) * 1000, 3),
+                "p50": round(jitter[len(jitter) // 2] * 1000, 3),
+                "p99": round(jitter[min(len(jitter) - 1, int(0.99 * len(jitter)))] * 1000, 3),
+                "max": round(jitter[-1] * 1000, 3),
+            }
+        return stats
+
+
+_ramp_engine = RampEngine()
+
+
+def _current_parameter_value(ableton, track_index: int, device_index: int,
+                             parameter_name: str, track_type: str) -> float:
+    """Read a parameter's current value over TCP (start point for a ramp)."""
+    result = ableton.send_command("get_device_parameters", {
+        "track_index": track_index,
+        "device_index": device_index,
+        "track_type": track_type,
+    })
+    for param in result.get("parameters", []):
+        if param.get("name", "").lower() == parameter_name.lower():
+            return float(param["value"])
+    raise ValueError(f"Parameter '{parameter_name}' not found on device {device_index}")
+
+
+@mcp.tool()
+@_tool_handler("starting parameter ramp")
+def ramp_parameter(ctx: Context, track_index: int, device_index: int, parameter_name: str,
+                   end_value: float, duration: float, curve: str = "linear",
+                   start_value: float = None, lfo_rate: float = 1.0,
+                   track_type: str = "track") -> str:
+    """
+    Smoothly move a device parameter over time (filter sweeps, fades, LFO wobbles) in one call.
+
+    The server streams interpolated values over the real-time UDP channel
+    (ABLETON_MCP_RAMP_RATE updates per second, default 100) until the ramp finishes.
+    Returns immediately with a ramp ID; several ramps can run at once. Starting a
+    new ramp on the same parameter replaces the running one.
+
+    Parameters:
+    - track_index: The index of the track containing the device
+    - device_index: The index of the device on the track
+    - parameter_name: The name of the parameter to ramp
+    - end_value: Value to ramp to (for "lfo": the far end of the oscillation)
+    - duration: Ramp length in seconds (max 600)
+    - curve: "linear" (default), "exponential" (slow start, fast finish), "s_curve"
+      (eased in and out), or "lfo" (oscillates between start and end, then returns to start)
+    - start_value: Value to start from (default: the parameter's current value)
+    - lfo_rate: Oscillations per second for curve="lfo" (default: 1.0)
+    - track_type: Type of track: "track" (default), "return", or "master"
+    """
+    _validate_index(track_index, "track_index")
+    _validate_index(device_index, "device_index")
+    _validate_range(duration, "duration", 0.01, _RAMP_MAX_DURATION)
+    if curve not in _RAMP_CURVES:
+        raise ValueError(f"curve must be one of {', '.join(_RAMP_CURVES)}")
+    if track_type not in ("track", "return", "master"):
+        raise ValueError("track_type must be 'track', 'return', or 'master'")
+    if curve == "lfo":
+        _validate_range(lfo_rate, "lfo_rate", 0.01, 50.0)
+
+    ableton = get_ableton_connection()
+    resolved = ableton.resolve_parameter_handle(track_index, device_index, parameter_name, track_type)
+    handle = resolved["handle"] if resolved else None
+    if start_value is None:
+        if resolved:
+            start_value = resolved["value"]
+        else:
+            start_value = _current_parameter_value(ableton, track_index, device_index, parameter_name, track_type)
+    target = {
+        "track_index": track_index,
+        "device_index": device_index,
+        "parameter_name": parameter_name,
+        "track_type": track_type,
+    }
+    ramp_id = _ramp_engine.start_ramp(target, float(start_value), float(end_value), duration, curve,
+                                      lfo_rate, handle)
+    return (f"Started {curve} ramp {ramp_id}: '{parameter_name}' {start_value} → {end_value} "
+            f"over {duration}s at {_ramp_engine.rate_hz:g} Hz")
+
+
+@mcp.tool()
+@_tool_handler("cancelling parameter ramp")
+def cancel_ramp(ctx: Context, ramp_id: str = "all") -> str:
+    """
+    Stop a running parameter ramp; the parameter keeps the last value sent.
+
+    Parameters:
+    - ramp_id: ID returned by ramp_parameter, or "all" (default) to stop every ramp
+    """
+    count = _ramp_engine.cancel(None if ramp_id == "all" else ramp_id)
+    if not count and ramp_id != "all":
+        return f"Ramp '{ramp_id}' not found (it may have finished). Use list_ramps() to see active ramps."
+    return f"Cancelled {count} ramp(s)"
 
-    Use for rapid multi-param changes (e.g., morphing presets in real-time).
-    No response confirmation — fire-and-forget. For confirmed batch updates,
-    use set_device_parameters instead.
 
-    Parameters:
-    - track_index: The index of the track containing the device
-    - device_index: The index of the device on the track
-    - parameters: JSON string of parameter list, e.g. '[{"name": "Filter Freq", "value": 0.5}]'
-    - track_type: Type of track: "track" (default), "return", or "master"
+@mcp.tool()
+@_tool_handler("listing parameter ramps")
+def list_ramps(ctx: Context) -> str:
     """
-    _validate_index(track_index, "track_index")
-    _validate_index(device_index, "device_index")
-    if track_type not in ("track", "return", "master"):
-        return "Error: track_type must be 'track', 'return', or 'master'"
+    List active parameter ramps with their progress, plus scheduler statistics
+    (update rate, datagrams sent, late ticks and tick jitter).
+    """
+    return json.dumps({"ramps": _ramp_engine.list_ramps(), "scheduler": _ramp_engine.stats()})
 
-    params_list = json.loads(parameters) if isinstance(parameters, str) else parameters
-    if not isinstance(params_list, list) or not params_list:
-        return "Error: parameters must be a non-empty JSON array of {name, value} objects"
 
+@mcp.tool()
+@_tool_handler("getting realtime stats")
+def get_realtime_stats(ctx: Context) -> str:
+    """
+    Report how much work the realtime UDP channel saves.
+
+    Client side: updates requested, sent, held back by the per-parameter rate limit
+    (ABLETON_MCP_REALTIME_RATE, default 200/s) and superseded before sending.
+    Remote Script side: updates received, dropped as out-of-order, coalesced within
+    a tick, applied to Live, and stale (target no longer exists).
+    """
     ableton = get_ableton_connection()
-    ableton.send_udp_command("batch_set_device_parameters", {
-        "track_index": track_index,
-        "device_index": device_index,
-        "parameters": params_list,
-        "track_type": track_type,
-    })
-    return f"Sent real-time batch update for {len(params_list)} parameters (fire-and-forget via UDP)"
+    try:
+        remote = ableton.send_command("get_realtime_stats")
+    except Exception as e:
+        remote = {"error": str(e)}
+    return json.dumps({"client": ableton.realtime_stats(), "remote_script": remote})
+
+
 @mcp.tool()
 @_tool_handler("getting user library")
 def get_user_library(ctx: Context) -> str:
@@ -3335,6 +5501,63 @@ def create_clip_automation(ctx: Context, track_index: int, clip_index: int,
     pts = result.get("points_added", len(automation_points))
     return f"Created automation with {pts} points for parameter '{parameter_name}'"
 # ======================================================================
+# Batch Commands
+# ======================================================================
+
+@mcp.tool()
+@_tool_handler("running batch")
+def run_batch(ctx: Context, commands: str, stop_on_error: bool = True) -> str:
+    """
+    Run several commands in one round trip, executed back to back in a single Live update.
+
+    Use this for multi-step edits (create a track, name it, add a clip, fill it with
+    notes) instead of calling one tool per step.
+
+    Parameters:
+    - commands: JSON array of {"type": <command>, "params": {...}} objects, e.g.
+      '[{"type": "create_midi_track", "params": {"index": -1}},
+        {"type": "set_track_name", "params": {"track_index": {"$ref": "0.index"}, "name": "Bass"}}]'
+      A value of {"$ref": "<item>.<key>"} is replaced with a field from an earlier
+      item's result (dotted keys and list indices are allowed, e.g. "2.devices.0.name").
+    - stop_on_error: True (default) stops at the first failing item and skips the rest;
+      False runs every item and reports each failure.
+    """
+    commands_list = json.loads(commands) if isinstance(commands, str) else commands
+    if not isinstance(commands_list, list) or not commands_list:
+        return "Error: commands must be a non-empty JSON array of {type, params} objects"
+    for i, item in enumerate(commands_list):
+        if not isinstance(item, dict) or not isinstance(item.get("type"), str):
+            return f"Error: commands[{i}] must be an object with a string 'type'"
+        if item["type"] == "batch":
+            return f"Error: commands[{i}] — nested batches are not supported"
+        if not isinstance(item.get("params", {}), dict):
+            return f"Error: commands[{i}].params must be an object"
+
+    ableton = get_ableton_connection()
+    result = ableton.send_batch(commands_list, stop_on_error=stop_on_error)
+    return json.dumps(result)
+
+@mcp.tool()
+@_tool_handler("getting protocol stats")
+def get_protocol_stats(ctx: Context) -> str:
+    """
+    Report response-compression counters, for tuning ABLETON_MCP_COMPRESSION_THRESHOLD.
+
+    Returns the client side (frames decompressed, bytes on the wire vs. decoded,
+    bytes saved, decompression time) and the Remote Script side (time spent
+    compressing, bytes saved) since each process started.
+    """
+    ableton = get_ableton_connection()
+    try:
+        remote = ableton.send_command("get_protocol_stats")
+    except Exception as e:
+        remote = {"error": str(e)}
+    return json.dumps({
+        "compression_threshold": COMPRESSION_THRESHOLD,
+        "client": _get_compression_stats(),
+        "remote_script": remote,
+    })
+# ======================================================================
 # Arrangement View Workflow
 # ======================================================================
 
@@ -3527,7 +5750,8 @@ def add_notes_extended(ctx: Context, track_index: int, clip_index: int,
 @mcp.tool()
 @_tool_handler("getting extended notes")
 def get_notes_extended(ctx: Context, track_index: int, clip_index: int,
-                       start_time: float = 0.0, time_span: float = 0.0) -> str:
+                       start_time: float = 0.0, time_span: float = 0.0,
+                       offset: int = 0, limit: int = None) -> str:
     """
     Get MIDI notes with Live 11+ extended properties (probability, velocity_deviation, release_velocity).
 
@@ -3540,6 +5764,8 @@ def get_notes_extended(ctx: Context, track_index: int, clip_index: int,
     - clip_index: The index of the clip slot containing the clip
     - start_time: Start time in beats (default: 0.0)
     - time_span: Duration in beats to retrieve (default: 0.0 = entire clip)
+    - offset: Index of the first note to return (default: 0)
+    - limit: Maximum notes to return (default: all); page with the returned next_offset
     """
     _validate_index(track_index, "track_index")
     _validate_index(clip_index, "clip_index")
@@ -3549,6 +5775,7 @@ def get_notes_extended(ctx: Context, track_index: int, clip_index: int,
         "clip_index": clip_index,
         "start_time": start_time,
         "time_span": time_span,
+        **_page_params(offset, limit),
     })
     return json.dumps(result)
 @mcp.tool()
@@ -3823,6 +6050,9 @@ def discover_device_params(ctx: Context, track_index: int, device_index: int) ->
     })
 
     data = _m4l_result(result)
+    _load_param_schemas()
+    if _store_param_schema(data):
+        _save_param_schemas()
     return json.dumps(data)
 
 
@@ -4404,34 +6634,11 @@ def batch_set_hidden_parameters(
     if len(safe_params) == 0:
         return "No settable parameters after filtering (parameter 0 'Device On' is excluded)."
 
-    # Send individual set_hidden_param commands with a small delay between
-    # each to avoid overwhelming Ableton.  This is more reliable than the
-    # base64-encoded batch OSC approach which can fail with long payloads.
     m4l = get_m4l_connection()
-    ok_count = 0
-    fail_count = 0
-    errors = []
-
-    for p in safe_params:
-        try:
-            result = m4l.send_command("set_hidden_param", {
-                "track_index": track_index,
-                "device_index": device_index,
-                "parameter_index": int(p["index"]),
-                "value": float(p["value"])
-            })
-            if result.get("status") == "success":
-                ok_count += 1
-            else:
-                fail_count += 1
-                errors.append(f"[{p['index']}]: {result.get('message', '?')}")
-        except Exception as e:
-            fail_count += 1
-            errors.append(f"[{p['index']}]: {str(e)}")
-
-        # Small delay between params to let Ableton breathe
-        if len(safe_params) > 6:
-            time.sleep(0.05)
+    data = _m4l_batch_set_params(m4l, track_index, device_index, safe_params)
+    ok_count = data["params_set"]
+    fail_count = data["params_failed"]
+    errors = data["errors"]
 
     total = ok_count + fail_count
     msg = f"Batch set complete: {ok_count}/{total} parameters set successfully ({fail_count} failed)."
@@ -4465,10 +6672,7 @@ def snapshot_device_state(
     _validate_index(device_index, "device_index")
 
     m4l = get_m4l_connection()
-    result = m4l.send_command("discover_params", {
-        "track_index": track_index,
-        "device_index": device_index
-    })
+    result = _m4l_discover_params(m4l, [(track_index, device_index)])[0]
 
     if result.get("status") != "success":
         return f"M4L bridge error: {result.get('message', 'Unknown error')}"
@@ -4503,42 +6707,54 @@ def restore_device_snapshot(
     ctx: Context,
     snapshot_id: str,
     track_index: int = -1,
-    device_index: int = -1
+    device_index: int = -1,
+    tolerance: float = _RESTORE_TOLERANCE,
 ) -> str:
     """Restore a previously captured device state from a snapshot.
 
-    Applies all parameter values from the snapshot to the device using batch set.
-    By default restores to the same track/device the snapshot was taken from.
-    Optionally specify different track_index/device_index to apply to a different device.
+    Reads the device's current values first and only sets the parameters that
+    differ from the snapshot, so untouched parameters cost nothing and leave
+    no undo steps. By default restores to the same track/device the snapshot
+    was taken from. Optionally specify different track_index/device_index to
+    apply to a different device.
 
     Parameters:
     - snapshot_id: The ID of the snapshot to restore (from snapshot_device_state or list_snapshots)
     - track_index: Override target track (-1 = use original track from snapshot)
     - device_index: Override target device (-1 = use original device from snapshot)
+    - tolerance: Fraction of a parameter's range within which it counts as
+      already restored (default 0.0001; 0 = only exact matches are skipped;
+      quantized parameters always need an exact match)
 
     Requires the AbletonMCP_Bridge M4L device to be loaded on any track.
     """
     try:
         if snapshot_id not in _snapshot_store:
             return f"Snapshot '{snapshot_id}' not found. Use list_snapshots() to see available snapshots."
+        _validate_range(tolerance, "tolerance", 0.0, 1.0)
 
         snapshot = _snapshot_store[snapshot_id]
         target_track = track_index if track_index >= 0 else snapshot["track_index"]
         target_device = device_index if device_index >= 0 else snapshot["device_index"]
 
-        params_to_set = [{"index": p["index"], "value": p["value"]} for p in snapshot["parameters"]]
-
-        if not params_to_set:
+        total = len(snapshot["parameters"])
+        if not total:
             return "Snapshot contains no parameters to restore."
 
         m4l = get_m4l_connection()
-        data = _m4l_batch_set_params(m4l, target_track, target_device, params_to_set)
-        ok = data["params_set"]
-        failed = data["params_failed"]
+        params_to_set = _m4l_restore_deltas(
+            m4l, [(target_track, target_device, snapshot["parameters"])], tolerance
+        )[0]
+        ok = failed = 0
+        if params_to_set:
+            data = _m4l_batch_set_params(m4l, target_track, target_device, params_to_set)
+            ok = data["params_set"]
+            failed = data["params_failed"]
         return (
             f"Restored snapshot '{snapshot['name']}' (ID: {snapshot_id})\n"
             f"Target: track {target_track}, device {target_device}\n"
-            f"Parameters restored: {ok}/{len(params_to_set)} ({failed} failed)"
+            f"Parameters touched: {ok}/{len(params_to_set)} changed ({failed} failed), "
+            f"{total - len(params_to_set)} already matched"
         )
     except ConnectionError as e:
         return f"M4L bridge not available: {e}"
@@ -4619,15 +6835,16 @@ def get_snapshot_details(ctx: Context, snapshot_id: str) -> str:
 @mcp.tool()
 @_tool_handler("deleting all snapshots")
 def delete_all_snapshots(ctx: Context) -> str:
-    """Delete all stored snapshots, macros, and parameter maps.
+    """Delete all stored snapshots, macros, parameter maps, and morph spaces.
 
     Clears all in-memory feature data. This cannot be undone.
     """
-    global _snapshot_store, _macro_store, _param_map_store
-    count = len(_snapshot_store) + len(_macro_store) + len(_param_map_store)
+    global _snapshot_store, _macro_store, _param_map_store, _morph_space_store
+    count = len(_snapshot_store) + len(_macro_store) + len(_param_map_store) + len(_morph_space_store)
     _snapshot_store = {}
     _macro_store = {}
     _param_map_store = {}
+    _morph_space_store = {}
     return f"Cleared all feature data: {count} items deleted."
 
 
@@ -4665,36 +6882,43 @@ def snapshot_all_devices(
     snapshot_ids = []
     device_count = 0
 
-    for ti in track_indices:
-        track_info = ableton.send_command("get_track_info", {"track_index": ti})
-        devices = track_info.get("devices", [])
+    # Fetch every track's device list up front (one round trip when pipelined)
+    track_responses = ableton.send_commands(
+        [("get_track_info", {"track_index": ti}) for ti in track_indices]
+    )
 
-        for di, dev in enumerate(devices):
-            result = m4l.send_command("discover_params", {
-                "track_index": ti,
-                "device_index": di
-            })
+    targets = []
+    for ti, response in zip(track_indices, track_responses):
+        if response.get("status") == "error":
+            raise Exception(f"track {ti}: {response.get('message', 'Unknown error from Ableton')}")
+        devices = response.get("result", {}).get("devices", [])
+        targets.extend((ti, di) for di in range(len(devices)))
 
-            if result.get("status") != "success":
-                continue
+    # Discover every device concurrently (the bridge queues them back to back);
+    # layouts seen before only need their current values read
+    results = _m4l_discover_params(m4l, targets)
 
-            data = result.get("result", {})
-            snap_id = str(uuid.uuid4())[:8]
-
-            _snapshot_store[snap_id] = {
-                "id": snap_id,
-                "group_id": group_id,
-                "name": f"{data.get('device_name', 'Unknown')}_t{ti}_d{di}",
-                "timestamp": timestamp,
-                "track_index": ti,
-                "device_index": di,
-                "device_name": data.get("device_name", "Unknown"),
-                "device_class": data.get("device_class", "Unknown"),
-                "parameter_count": data.get("parameter_count", 0),
-                "parameters": data.get("parameters", [])
-            }
-            snapshot_ids.append(snap_id)
-            device_count += 1
+    for (ti, di), result in zip(targets, results):
+        if result.get("status") != "success":
+            continue
+
+        data = result.get("result", {})
+        snap_id = str(uuid.uuid4())[:8]
+
+        _snapshot_store[snap_id] = {
+            "id": snap_id,
+            "group_id": group_id,
+            "name": f"{data.get('device_name', 'Unknown')}_t{ti}_d{di}",
+            "timestamp": timestamp,
+            "track_index": ti,
+            "device_index": di,
+            "device_name": data.get("device_name", "Unknown"),
+            "device_class": data.get("device_class", "Unknown"),
+            "parameter_count": data.get("parameter_count", 0),
+            "parameters": data.get("parameters", [])
+        }
+        snapshot_ids.append(snap_id)
+        device_count += 1
 
     group_name = snapshot_name or f"group_{group_id}"
 
@@ -4716,35 +6940,42 @@ def snapshot_all_devices(
     )
 @mcp.tool()
 @_tool_handler("restoring group snapshot")
-def restore_group_snapshot(ctx: Context, group_id: str) -> str:
+def restore_group_snapshot(ctx: Context, group_id: str, tolerance: float = _RESTORE_TOLERANCE) -> str:
     """Restore all device states from a group snapshot.
 
-    Restores every device captured in a snapshot_all_devices() call.
+    Restores every device captured in a snapshot_all_devices() call. Current
+    values of all devices are read first and only parameters that differ
+    from the snapshot are set.
 
     Parameters:
     - group_id: The group snapshot ID (starts with 'group_')
+    - tolerance: Fraction of a parameter's range within which it counts as
+      already restored (default 0.0001; quantized parameters always need an
+      exact match)
 
     Requires the AbletonMCP_Bridge M4L device to be loaded on any track.
     """
     if group_id not in _snapshot_store:
         return f"Group snapshot '{group_id}' not found."
+    _validate_range(tolerance, "tolerance", 0.0, 1.0)
 
     group = _snapshot_store[group_id]
     if group.get("type") != "group":
         return f"'{group_id}' is not a group snapshot. Use restore_device_snapshot() instead."
 
+    snaps = [_snapshot_store[snap_id] for snap_id in group.get("snapshot_ids", [])
+             if snap_id in _snapshot_store and _snapshot_store[snap_id].get("parameters")]
     m4l = get_m4l_connection()
+    deltas = _m4l_restore_deltas(
+        m4l, [(snap["track_index"], snap["device_index"], snap["parameters"]) for snap in snaps], tolerance
+    )
     total_devices = 0
     total_params = 0
     total_failed = 0
+    total_matched = 0
 
-    for snap_id in group.get("snapshot_ids", []):
-        if snap_id not in _snapshot_store:
-            continue
-
-        snap = _snapshot_store[snap_id]
-        params_to_set = [{"index": p["index"], "value": p["value"]} for p in snap.get("parameters", [])]
-
+    for snap, params_to_set in zip(snaps, deltas):
+        total_matched += len(snap["parameters"]) - len(params_to_set)
         if not params_to_set:
             continue
 
@@ -4755,8 +6986,8 @@ def restore_group_snapshot(ctx: Context, group_id: str) -> str:
 
     return (
         f"Restored group snapshot '{group['name']}'\n"
-        f"Devices restored: {total_devices}\n"
-        f"Parameters restored: {total_params} ({total_failed} failed)"
+        f"Devices touched: {total_devices}/{len(snaps)}\n"
+        f"Parameters touched: {total_params} ({total_failed} failed), {total_matched} already matched"
     )
 
 
@@ -4831,6 +7062,253 @@ def compare_snapshots(ctx: Context, snapshot_a_id: str, snapshot_b_id: str) -> s
 # v1.6.0 Feature Tools — Feature 4: Preset Morph Engine
 # ==========================================================================
 
+_MORPH_EASINGS = ("linear", "exponential", "s_curve")
+_MORPH_MAX_DURATION = 600.0
+_MORPH_MAX_FPS = 60.0
+_MORPH_STEPS = 10000  # continuous values only count as changed once they move 1/10000 of their range
+_MORPH_FINAL_ATTEMPTS = 3       # tries to land the final frame before the morph is reported failed
+_MORPH_FINAL_RETRY_DELAY = 0.25  # seconds between final-frame tries
+
+
+def _morph_vectors(snap_a: Dict[str, Any], snap_b: Dict[str, Any]) -> tuple:
+    """Precompute the parameters two snapshots share as parallel lists.
+
+    Returns (indices, a_values, b_values, quantized, spans, skipped) where
+    ``skipped`` counts snapshot A parameters missing from snapshot B.
+    """
+    b_by_index = {p["index"]: p for p in snap_b.get("parameters", [])}
+    indices, a_values, b_values, quantized, spans = [], [], [], [], []
+    skipped = 0
+    for p_a in snap_a.get("parameters", []):
+        p_b = b_by_index.get(p_a["index"])
+        if p_b is None:
+            skipped += 1
+            continue
+        indices.append(p_a["index"])
+        a_values.append(p_a["value"])
+        b_values.append(p_b["value"])
+        quantized.append(bool(p_a.get("is_quantized", False)))
+        spans.append(abs(p_a.get("max", 1.0) - p_a.get("min", 0.0)) or 1.0)
+    return indices, a_values, b_values, quantized, spans, skipped
+
+
+def _morph_values(vectors: tuple, position: float, snap_point: float = 0.5) -> List[float]:
+    """Interpolated values at ``position``; quantized parameters jump to B at ``snap_point``."""
+    _, a_values, b_values, quantized, _, _ = vectors
+    return [
+        (b if position >= snap_point else a) if q else a + (b - a) * position
+        for a, b, q in zip(a_values, b_values, quantized)
+    ]
+
+
+def _morph_changes(values: List[float], quantized: List[bool], spans: List[float],
+                   sent_steps: List[Optional[float]]) -> List[tuple]:
+    """(slot, step, value) for values whose step differs from ``sent_steps``.
+
+    Quantized values are compared exactly, continuous ones in steps of
+    1/_MORPH_STEPS of their range.
+    """
+    changed = []
+    for slot, value in enumerate(values):
+        step = value if quantized[slot] else round(value / spans[slot] * _MORPH_STEPS)
+        if step != sent_steps[slot]:
+            changed.append((slot, step, value))
+    return changed
+
+
+class _MorphAnimation:
+    """One device morphing from start_position to end_position over duration seconds."""
+
+    def __init__(self, morph_id: str, m4l: M4LConnection, track_index: int, device_index: int,
+                 vectors: tuple, start_position: float, end_position: float, duration: float,
+                 easing: str, fps: float, snap_point: float, label: str):
+        self.id = morph_id
+        self.m4l = m4l
+        self.track_index = track_index
+        self.device_index = device_index
+        self.vectors = vectors
+        self.start_position = start_position
+        self.end_position = end_position
+        self.duration = duration
+        self.easing = easing
+        self.period = 1.0 / fps
+        self.snap_point = snap_point
+        self.label = label
+        self.started = time.perf_counter()
+        self.next_frame = self.started
+        self.position = start_position
+        self.frames = 0
+        self.params_sent = 0
+        self.final_attempts = 0
+        self.landed = False
+        # Last value step confirmed per parameter; None = send on the next frame
+        self.sent_steps: List[Optional[float]] = [None] * len(vectors[0])
+
+    def position_at(self, now: float) -> tuple:
+        """(morph position, finished) at perf_counter time ``now``."""
+        p = min(1.0, (now - self.started) / self.duration)
+        eased = _curve_shape(self.easing, p)
+        return self.start_position + (self.end_position - self.start_position) * eased, p >= 1.0
+
+    def changes(self, values: List[float]) -> List[tuple]:
+        """(slot, step, value) for parameters whose value step differs from the last one sent."""
+        _, _, _, quantized, spans, _ = self.vectors
+        return _morph_changes(values, quantized, spans, self.sent_steps)
+
+    def describe(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self.started
+        return {
+            "morph_id": self.id, "label": self.label,
+            "track_index": self.track_index, "device_index": self.device_index,
+            "start_position": self.start_position, "end_position": self.end_position,
+            "duration": self.duration, "easing": self.easing, "fps": round(1.0 / self.period, 2),
+            "progress": round(min(1.0, elapsed / self.duration), 3),
+            "position": round(self.position, 4), "frames": self.frames, "params_sent": self.params_sent,
+        }
+
+
+class MorphScheduler:
+    """Plays snapshot morphs frame by frame from one background thread.
+
+    Start and end vectors are computed once per morph; each frame works out
+    the eased position from the actual wake-up time (a slow frame skips
+    ahead instead of stretching the morph) and sends only the parameters
+    whose value moved since the last frame, as one M4L bundle.  Entries a
+    bundle lost are retried on the next frame; the final frame goes through
+    _m4l_batch_set_params and stays scheduled until every value is confirmed,
+    so the morph lands on its end position (after _MORPH_FINAL_ATTEMPTS
+    failed tries it is counted as failed instead of completed).  Starting a
+    morph on a device that is already morphing replaces it.
+    """
+
+    def __init__(self):
+        self._morphs: Dict[str, _MorphAnimation] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._ids = itertools.count(1)
+        self._stats = {"frames": 0, "late_frames": 0, "params_sent": 0, "params_unchanged": 0,
+                       "send_errors": 0, "completed": 0, "failed": 0, "cancelled": 0}
+
+    def start(self, m4l: M4LConnection, track_index: int, device_index: int, vectors: tuple,
+              start_position: float, end_position: float, duration: float, easing: str = "linear",
+              fps: float = 30.0, snap_point: float = 0.5, label: str = "") -> str:
+        morph = _MorphAnimation(f"morph-{next(self._ids)}", m4l, track_index, device_index, vectors,
+                                start_position, end_position, duration, easing, fps, snap_point, label)
+        with self._cond:
+            for other in [m for m in self._morphs.values()
+                          if (m.track_index, m.device_index) == (track_index, device_index)]:
+                del self._morphs[other.id]
+                self._stats["cancelled"] += 1
+            self._morphs[morph.id] = morph
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="morph-scheduler")
+                self._thread.start()
+            self._cond.notify()
+        return morph.id
+
+    def cancel(self, morph_id: Optional[str] = None) -> int:
+        """Cancel one morph (or all when morph_id is None); parameters keep their current value."""
+        with self._cond:
+            ids = list(self._morphs) if morph_id is None else [morph_id] if morph_id in self._morphs else []
+            for mid in ids:
+                del self._morphs[mid]
+            self._stats["cancelled"] += len(ids)
+        return len(ids)
+
+    def list_morphs(self) -> List[Dict[str, Any]]:
+        with self._cond:
+            morphs = list(self._morphs.values())
+        return [m.describe() for m in morphs]
+
+    def _frame(self, morph: _MorphAnimation, now: float) -> bool:
+        """Send one frame of ``morph``; returns True once it is done.
+
+        A morph is done when it has landed on its end position (``landed``)
+        or its final frame failed _MORPH_FINAL_ATTEMPTS times.
+        """
+        position, finished = morph.position_at(now)
+        morph.position = position
+        changed = morph.changes(_morph_values(morph.vectors, position, morph.snap_point))
+        self._stats["frames"] += 1
+        self._stats["params_unchanged"] += len(morph.sent_steps) - len(changed)
+        morph.frames += 1
+        if not changed:
+            morph.landed = finished
+            return finished
+        indices = morph.vectors[0]
+        try:
+            if finished or not morph.m4l.supports("bundles"):
+                result = _m4l_batch_set_params(
+                    morph.m4l, morph.track_index, morph.device_index,
+                    [{"index": indices[slot], "value": value} for slot, _, value in changed])
+                if result["params_failed"]:
+                    raise Exception(f"{result['params_failed']} parameter(s) failed: "
+                                    f"{'; '.join(result['errors'][:3])}")
+                lost = set()
+            else:
+                result = _m4l_result(morph.m4l.send_param_bundle([
+                    (morph.track_index, morph.device_index, indices[slot], float(value))
+                    for slot, _, value in changed
+                ]))
+                lost = set(result.get("missing", []))
+        except Exception as e:
+            logger.debug("Morph %s frame failed: %s", morph.id, e)
+            self._stats["send_errors"] += 1
+            if not finished:
+                return False
+            # Nothing of the final frame is marked sent, so the next try resends all of it
+            morph.final_attempts += 1
+            if morph.final_attempts < _MORPH_FINAL_ATTEMPTS:
+                return False
+            logger.warning("Morph %s did not reach its end position: %s", morph.id, e)
+            return True
+        for seq, (slot, step, _) in enumerate(changed):
+            if seq not in lost:
+                morph.sent_steps[slot] = step
+        sent = len(changed) - len(lost)
+        morph.params_sent += sent
+        self._stats["params_sent"] += sent
+        morph.landed = finished
+        return finished
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if not self._morphs:
+                        self._cond.wait()
+                        continue
+                    morph = min(self._morphs.values(), key=lambda m: m.next_frame)
+                    delay = morph.next_frame - time.perf_counter()
+                    if delay <= 0:
+                        break
+                    self._cond.wait(delay)  # woken early when morphs start or stop
+
+            finished = self._frame(morph, time.perf_counter())
+            with self._cond:
+                if morph.id not in self._morphs:
+                    continue  # cancelled or replaced mid-frame
+                if finished:
+                    del self._morphs[morph.id]
+                    self._stats["completed" if morph.landed else "failed"] += 1
+                    continue
+                morph.next_frame += morph.period
+                now = time.perf_counter()
+                if morph.final_attempts:
+                    morph.next_frame = now + _MORPH_FINAL_RETRY_DELAY
+                elif morph.next_frame < now:
+                    self._stats["late_frames"] += 1
+                    morph.next_frame = now + morph.period
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            active = len(self._morphs)
+        return dict(self._stats, active_morphs=active)
+
+
+_morph_scheduler = MorphScheduler()
+
+
 @mcp.tool()
 @_tool_handler("during morph")
 def morph_between_snapshots(
@@ -4839,24 +7317,41 @@ def morph_between_snapshots(
     snapshot_b_id: str,
     position: float,
     track_index: int = -1,
-    device_index: int = -1
+    device_index: int = -1,
+    duration: float = 0.0,
+    start_position: float = 0.0,
+    easing: str = "linear",
+    fps: float = 30.0,
+    snap_point: float = 0.5,
 ) -> str:
     """Morph between two device snapshots by interpolating all parameters.
 
     Takes two previously captured snapshots and smoothly blends between them.
     Position 0.0 = fully snapshot A, position 1.0 = fully snapshot B.
-    Quantized parameters (e.g. waveform selectors) snap at the midpoint.
+    Quantized parameters (e.g. waveform selectors) snap at snap_point.
+
+    With duration > 0 the morph is animated in the background from
+    start_position to position and the call returns a morph ID straight away;
+    each frame only sends the parameters whose value changed. Stop it with
+    cancel_morph(), watch it with list_morphs().
 
     Parameters:
     - snapshot_a_id: ID of the first snapshot (position 0.0)
     - snapshot_b_id: ID of the second snapshot (position 1.0)
-    - position: Morph position (0.0 to 1.0)
+    - position: Morph position (0.0 to 1.0); with duration, where the animation ends
     - track_index: Override target track (-1 = use snapshot A's track)
     - device_index: Override target device (-1 = use snapshot A's device)
+    - duration: Animation length in seconds (0 = jump straight to position, max 600)
+    - start_position: Where the animation starts (0.0 to 1.0, default 0.0)
+    - easing: "linear" (default), "exponential" (slow start, fast finish) or "s_curve" (eased in and out)
+    - fps: Animation frames per second (1 to 60, default 30)
+    - snap_point: Position at which quantized parameters switch from A to B (default 0.5)
 
     Requires the AbletonMCP_Bridge M4L device to be loaded on any track.
     """
     _validate_range(position, "position", 0.0, 1.0)
+    _validate_range(duration, "duration", 0.0, _MORPH_MAX_DURATION)
+    _validate_range(snap_point, "snap_point", 0.0, 1.0)
 
     if snapshot_a_id not in _snapshot_store:
         return f"Snapshot A '{snapshot_a_id}' not found."
@@ -4869,43 +7364,516 @@ def morph_between_snapshots(
     target_track = track_index if track_index >= 0 else snap_a["track_index"]
     target_device = device_index if device_index >= 0 else snap_a["device_index"]
 
-    b_by_index = {p["index"]: p for p in snap_b.get("parameters", [])}
-
-    params_to_set = []
-    skipped = 0
-    for p_a in snap_a.get("parameters", []):
-        idx = p_a["index"]
-        if idx not in b_by_index:
-            skipped += 1
-            continue
-
-        p_b = b_by_index[idx]
-        val_a = p_a["value"]
-        val_b = p_b["value"]
-
-        if p_a.get("is_quantized", False):
-            interpolated = val_a if position < 0.5 else val_b
-        else:
-            interpolated = val_a + (val_b - val_a) * position
-
-        params_to_set.append({"index": idx, "value": interpolated})
-
-    if not params_to_set:
+    vectors = _morph_vectors(snap_a, snap_b)
+    indices, skipped = vectors[0], vectors[5]
+    if not indices:
         return "No matching parameters found between the two snapshots."
+    label = f"'{snap_a.get('name', snapshot_a_id)}' -> '{snap_b.get('name', snapshot_b_id)}'"
 
     m4l = get_m4l_connection()
+    if duration > 0:
+        _validate_range(start_position, "start_position", 0.0, 1.0)
+        _validate_range(fps, "fps", 1.0, _MORPH_MAX_FPS)
+        if easing not in _MORPH_EASINGS:
+            raise ValueError(f"easing must be one of {', '.join(_MORPH_EASINGS)}")
+        morph_id = _morph_scheduler.start(m4l, target_track, target_device, vectors, start_position,
+                                          position, duration, easing, fps, snap_point, label)
+        return (
+            f"Started {easing} morph {morph_id} ({label}): {start_position:.2f} -> {position:.2f} "
+            f"over {duration}s at {fps:g} fps\n"
+            f"Parameters: {len(indices)}, skipped {skipped} (unmatched)\n"
+            f"Target: track {target_track}, device {target_device}"
+        )
+
+    values = _morph_values(vectors, position, snap_point)
+    params_to_set = [{"index": idx, "value": value} for idx, value in zip(indices, values)]
     data = _m4l_batch_set_params(m4l, target_track, target_device, params_to_set)
     ok = data["params_set"]
     return (
-            f"Morph at position {position:.2f} "
-            f"('{snap_a.get('name', snapshot_a_id)}' -> '{snap_b.get('name', snapshot_b_id)}')\n"
+            f"Morph at position {position:.2f} ({label})\n"
             f"Interpolated {ok} parameters, skipped {skipped} (unmatched)\n"
             f"Target: track {target_track}, device {target_device}"
         )
+
+
+@mcp.tool()
+@_tool_handler("cancelling morph")
+def cancel_morph(ctx: Context, morph_id: str = "all") -> str:
+    """
+    Stop a running snapshot morph; parameters keep the last values sent.
+
+    Parameters:
+    - morph_id: ID returned by morph_between_snapshots, or "all" (default) to stop every morph
+    """
+    count = _morph_scheduler.cancel(None if morph_id == "all" else morph_id)
+    if not count and morph_id != "all":
+        return f"Morph '{morph_id}' not found (it may have finished). Use list_morphs() to see active morphs."
+    return f"Cancelled {count} morph(s)"
+
+
+@mcp.tool()
+@_tool_handler("listing morphs")
+def list_morphs(ctx: Context) -> str:
+    """
+    List running snapshot morphs with their progress, plus scheduler statistics
+    (frames, late frames, parameters sent vs. left unchanged).
+    """
+    return json.dumps({"morphs": _morph_scheduler.list_morphs(), "scheduler": _morph_scheduler.stats()})
+
+
+# --- Morph spaces: K snapshots of one device blended by weights or an XY position ---
+_MORPH_SPACE_MAX_SNAPSHOTS = 16
+_MORPH_SPACE_IDW_POWER = 2.0
+_MORPH_SPACE_CORNERS = ((0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0))
+
+
+def _morph_space_points(count: int) -> List[tuple]:
+    """Default XY positions: the unit square's corners for 4 snapshots, else a circle."""
+    if count == 4:
+        return list(_MORPH_SPACE_CORNERS)
+    return [(0.5 + 0.5 * math.cos(2 * math.pi * k / count), 0.5 + 0.5 * math.sin(2 * math.pi * k / count))
+            for k in range(count)]
+
+
+def _morph_space_weights(space: Dict[str, Any], x: float, y: float, mode: str) -> List[float]:
+    """Blend weights for position (x, y): bilinear over the 4 corners, or inverse-distance."""
+    points = space["points"]
+    on_corners = len(points) == 4 and set(points) == set(_MORPH_SPACE_CORNERS)
+    if mode == "auto":
+        mode = "bilinear" if on_corners else "idw"
+    if mode == "bilinear":
+        if not on_corners:
+            raise ValueError("bilinear blending needs 4 snapshots at the corners (0,0), (1,0), (0,1), (1,1)")
+        corner_weights = {(0.0, 0.0): (1 - x) * (1 - y), (1.0, 0.0): x * (1 - y),
+                          (0.0, 1.0): (1 - x) * y, (1.0, 1.0): x * y}
+        return [corner_weights[point] for point in points]
+    weights = []
+    for px, py in points:
+        distance = math.hypot(x - px, y - py)
+        if distance < 1e-9:
+            return [1.0 if (qx, qy) == (px, py) else 0.0 for qx, qy in points]
+        weights.append(1.0 / distance ** _MORPH_SPACE_IDW_POWER)
+    return weights
+
+
+def _morph_space_blend(space: Dict[str, Any], weights: List[float]) -> List[float]:
+    """Blend the K×P value matrix with normalised weights (one weighted sum per column).
+
+    Quantized parameters take the value of the heaviest-weighted snapshot.
+    """
+    total = sum(weights)
+    weights = [w / total for w in weights]
+    heaviest = max(range(len(weights)), key=weights.__getitem__)
+    return [
+        row_values[heaviest] if q else sum(map(operator.mul, weights, row_values))
+        for row_values, q in zip(space["columns"], space["quantized"])
+    ]
+
+
+@mcp.tool()
+@_tool_handler("creating morph space")
+def create_morph_space(
+    ctx: Context,
+    name: str,
+    snapshot_ids: List[str],
+    positions: Optional[List[List[float]]] = None,
+    track_index: int = -1,
+    device_index: int = -1,
+) -> str:
+    """Combine several snapshots of one device into a morph space for XY / N-way blending.
+
+    The parameters all snapshots share are stored once as a K×P value matrix
+    with a quantized-parameter mask; set_morph_space_position() then blends
+    it with weights or an XY position and sends only the parameters that
+    differ from the device's current values.
+
+    Parameters:
+    - name: Human-readable name for the space
+    - snapshot_ids: 2 to 16 snapshot IDs of the same device
+    - positions: Optional [x, y] per snapshot in the 0.0-1.0 square (default:
+      the corners (0,0), (1,0), (0,1), (1,1) for 4 snapshots, otherwise a circle)
+    - track_index: Override target track (-1 = use the first snapshot's track)
+    - device_index: Override target device (-1 = use the first snapshot's device)
+
+    Requires the AbletonMCP_Bridge M4L device to be loaded on any track (when blending).
+    """
+    if not isinstance(snapshot_ids, list) or not 2 <= len(snapshot_ids) <= _MORPH_SPACE_MAX_SNAPSHOTS:
+        raise ValueError(f"snapshot_ids must list 2 to {_MORPH_SPACE_MAX_SNAPSHOTS} snapshots.")
+    missing = [sid for sid in snapshot_ids if sid not in _snapshot_store]
+    if missing:
+        return f"Snapshot(s) not found: {', '.join(missing)}. Use list_snapshots() to see available snapshots."
+    snaps = [_snapshot_store[sid] for sid in snapshot_ids]
+    if any(snap.get("type") == "group" for snap in snaps):
+        raise ValueError("Morph spaces take device snapshots, not group snapshots.")
+    if len({snap.get("device_class") for snap in snaps}) > 1:
+        raise ValueError("All snapshots in a morph space must come from the same kind of device.")
+
+    if positions is None:
+        points = _morph_space_points(len(snaps))
+    else:
+        if not isinstance(positions, list) or len(positions) != len(snaps):
+            raise ValueError("positions must give one [x, y] pair per snapshot.")
+        points = []
+        for i, pos in enumerate(positions):
+            if not isinstance(pos, (list, tuple)) or len(pos) != 2:
+                raise ValueError(f"Position at index {i} must be an [x, y] pair.")
+            _validate_range(pos[0], f"positions[{i}] x", 0.0, 1.0)
+            _validate_range(pos[1], f"positions[{i}] y", 0.0, 1.0)
+            points.append((float(pos[0]), float(pos[1])))
+
+    by_index = [{p["index"]: p for p in snap.get("parameters", [])} for snap in snaps]
+    shared = [p for p in snaps[0].get("parameters", []) if all(p["index"] in other for other in by_index[1:])]
+    if not shared:
+        return "The snapshots have no parameters in common."
+
+    space_id = "space_" + str(uuid.uuid4())[:8]
+    _morph_space_store[space_id] = {
+        "id": space_id,
+        "name": name,
+        "snapshot_ids": list(snapshot_ids),
+        "track_index": track_index if track_index >= 0 else snaps[0]["track_index"],
+        "device_index": device_index if device_index >= 0 else snaps[0]["device_index"],
+        "points": points,
+        "indices": [p["index"] for p in shared],
+        # One column of K snapshot values per parameter
+        "columns": [tuple(float(values[p["index"]]["value"]) for values in by_index) for p in shared],
+        "quantized": [bool(p.get("is_quantized", False)) for p in shared],
+        "spans": [abs(p.get("max", 1.0) - p.get("min", 0.0)) or 1.0 for p in shared],
+        "sent_steps": [None] * len(shared),
+        "write_gen": 0,
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    skipped = len(snaps[0].get("parameters", [])) - len(shared)
+    corners = ", ".join(f"{snap.get('name', sid)} @ ({px:g}, {py:g})"
+                        for sid, snap, (px, py) in zip(snapshot_ids, snaps, points))
+    return (
+        f"Morph space '{name}' created (ID: {space_id})\n"
+        f"Snapshots: {corners}\n"
+        f"Parameters: {len(shared)} shared, {skipped} skipped (not in every snapshot)\n"
+        f"Use set_morph_space_position('{space_id}', x, y) or pass weights to blend"
+    )
+
+
+@mcp.tool()
+@_tool_handler("setting morph space position")
+def set_morph_space_position(
+    ctx: Context,
+    space_id: str,
+    x: float = 0.5,
+    y: float = 0.5,
+    weights: Optional[List[float]] = None,
+    mode: str = "auto",
+) -> str:
+    """Blend a morph space's snapshots and apply the result to the device.
+
+    Only parameters whose blended value differs from the device's current
+    value are sent, so a controller can drive the position at interactive
+    rates.  (Bridges without get_param_values compare against this space's
+    previous call instead, starting over whenever another tool writes the
+    device.)
+
+    Parameters:
+    - space_id: ID returned by create_morph_space
+    - x, y: Position in the 0.0-1.0 square (ignored when weights are given)
+    - weights: Optional blend weight per snapshot (non-negative, normalised to sum 1)
+    - mode: "auto" (default: bilinear for 4 corner snapshots, otherwise inverse-distance),
+      "bilinear" or "idw" (inverse-distance weighting)
+
+    Requires the AbletonMCP_Bridge M4L device to be loaded on any track.
+    """
+    if space_id not in _morph_space_store:
+        return f"Morph space '{space_id}' not found. Use create_morph_space() first."
+    space = _morph_space_store[space_id]
+    count = len(space["points"])
+
+    if weights is not None:
+        if not isinstance(weights, list) or len(weights) != count:
+            raise ValueError(f"weights must give one value per snapshot ({count}).")
+        for i, w in enumerate(weights):
+            _validate_range(w, f"weights[{i}]", 0.0, float("inf"))
+        if sum(weights) <= 0:
+            raise ValueError("At least one weight must be greater than 0.")
+        weights = [float(w) for w in weights]
+    else:
+        _validate_range(x, "x", 0.0, 1.0)
+        _validate_range(y, "y", 0.0, 1.0)
+        if mode not in ("auto", "bilinear", "idw"):
+            raise ValueError("mode must be 'auto', 'bilinear' or 'idw'")
+        weights = _morph_space_weights(space, x, y, mode)
+
+    track_index, device_index = space["track_index"], space["device_index"]
+    m4l = get_m4l_connection()
+    current = _m4l_param_values(m4l, track_index, device_index)
+    if current is not None:
+        # Diff against what the device holds now, so changes made by other
+        # tools or by hand since the last call are put right
+        space["sent_steps"] = [
+            None if index >= len(current) else current[index] if q else round(current[index] / span * _MORPH_STEPS)
+            for index, q, span in zip(space["indices"], space["quantized"], space["spans"])
+        ]
+    elif _device_write_gen(track_index, device_index) != space["write_gen"]:
+        space["sent_steps"] = [None] * len(space["indices"])  # another tool wrote the device
+
+    values = _morph_space_blend(space, weights)
+    changed = _morph_changes(values, space["quantized"], space["spans"], space["sent_steps"])
+    ok = failed = 0
+    if changed:
+        data = _m4l_batch_set_params(m4l, track_index, device_index,
+                                     [{"index": space["indices"][slot], "value": value}
+                                      for slot, _, value in changed])
+        ok = data["params_set"]
+        failed = data["params_failed"]
+        if not failed:
+            for slot, step, _ in changed:
+                space["sent_steps"][slot] = step
+        else:
+            space["sent_steps"] = [None] * len(space["indices"])  # resend everything next time
+    space["write_gen"] = _device_write_gen(track_index, device_index)
+
+    total = sum(weights)
+    mix = ", ".join(f"{w / total:.2f}" for w in weights)
+    return (
+        f"Morph space '{space['name']}' blended (weights: {mix})\n"
+        f"Parameters sent: {ok}/{len(changed)} ({failed} failed), "
+        f"{len(values) - len(changed)} unchanged\n"
+        f"Target: track {space['track_index']}, device {space['device_index']}"
+    )
+
+
+@mcp.tool()
+@_tool_handler("listing morph spaces")
+def list_morph_spaces(ctx: Context) -> str:
+    """List all morph spaces.
+
+    Shows space IDs, names, snapshots with their XY positions, target device,
+    and number of shared parameters.
+    """
+    if not _morph_space_store:
+        return "No morph spaces created. Use create_morph_space() to create one."
+
+    output = f"Morph spaces ({len(_morph_space_store)}):\n\n"
+    for space_id, space in _morph_space_store.items():
+        snapshots = ", ".join(f"{sid} @ ({px:g}, {py:g})"
+                              for sid, (px, py) in zip(space["snapshot_ids"], space["points"]))
+        output += (
+            f"  ID: {space_id}\n"
+            f"  Name: {space['name']}\n"
+            f"  Snapshots: {snapshots}\n"
+            f"  Target: track {space['track_index']}, device {space['device_index']}\n"
+            f"  Parameters: {len(space['indices'])}\n"
+            f"  Created: {space['created']}\n\n"
+        )
+    return output
+
+
+@mcp.tool()
+@_tool_handler("deleting morph space")
+def delete_morph_space(ctx: Context, space_id: str) -> str:
+    """Delete a morph space (its snapshots are kept).
+
+    Parameters:
+    - space_id: The ID of the morph space to delete
+    """
+    if space_id not in _morph_space_store:
+        return f"Morph space '{space_id}' not found."
+    name = _morph_space_store.pop(space_id)["name"]
+    return f"Deleted morph space '{name}' (ID: {space_id})."
 # ==========================================================================
 # v1.6.0 Feature Tools — Feature 2: Smart Macro Controller
 # ==========================================================================
 
+MACRO_STREAM_RATE_HZ = min(200.0, max(10.0, float(os.environ.get("ABLETON_MCP_MACRO_RATE", "50"))))
+_MACRO_CURVES = ("linear", "exponential", "logarithmic", "stepped")
+_MACRO_DEFAULT_STEPS = 4
+_MACRO_STREAM_MAX_VALUES = 10000
+
+
+def _macro_curve(curve: str, steps: int, value: float) -> float:
+    """Shape a 0..1 macro value: linear, exponential (slow start), logarithmic (fast start) or stepped."""
+    if curve == "exponential":
+        return _curve_shape("exponential", value)
+    if curve == "logarithmic":
+        return math.log1p((math.exp(_RAMP_EXP_K) - 1) * value) / _RAMP_EXP_K
+    if curve == "stepped":
+        return round(value * (steps - 1)) / (steps - 1)
+    return value
+
+
+def _compile_macro(mappings: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Compile macro mappings into per-device parallel arrays, once at creation.
+
+    Each device gets parameter indices, minimums, spans and an index into
+    ``shapes`` (the distinct (curve, steps) pairs), so evaluating a macro
+    value shapes it once per curve and is then one multiply-add per
+    parameter.  ``sent_steps`` remembers what was last sent per parameter
+    for delta streaming, and ``write_gen`` the device's write generation at
+    that point (a different one means another tool has written the device
+    since).  ``lock`` guards both; the streamer and set_macro_value hold it
+    while they send.
+    """
+    shapes: List[tuple] = []
+    devices: Dict[tuple, Dict[str, Any]] = {}
+    for m in mappings:
+        shape = (m.get("curve", "linear"), int(m.get("steps", _MACRO_DEFAULT_STEPS)))
+        if shape not in shapes:
+            shapes.append(shape)
+        key = (m["track_index"], m["device_index"])
+        device = devices.setdefault(key, {"track_index": key[0], "device_index": key[1], "indices": [],
+                                          "minimums": [], "spans": [], "shapes": []})
+        device["indices"].append(int(m["parameter_index"]))
+        device["minimums"].append(float(m["min_value"]))
+        device["spans"].append(float(m["max_value"]) - float(m["min_value"]))
+        device["shapes"].append(shapes.index(shape))
+    for device in devices.values():
+        device["resolution"] = [abs(span) or 1.0 for span in device["spans"]]
+        device["exact"] = [False] * len(device["indices"])
+        device["sent_steps"] = [None] * len(device["indices"])
+        device["write_gen"] = 0
+    return {"shapes": shapes, "devices": list(devices.values()), "lock": threading.Lock()}
+
+
+def _macro_values(compiled: Dict[str, Any], value: float) -> List[List[float]]:
+    """Parameter values per compiled device for macro ``value``."""
+    shaped = [_macro_curve(curve, steps, value) for curve, steps in compiled["shapes"]]
+    return [
+        [lo + span * shaped[k] for lo, span, k in zip(d["minimums"], d["spans"], d["shapes"])]
+        for d in compiled["devices"]
+    ]
+
+
+class MacroStreamer:
+    """Applies streamed macro values from one background thread at a capped rate.
+
+    Values queued with push() are due at their own times; each tick takes the
+    newest due value per macro (older ones are coalesced away), evaluates
+    the compiled macro and sends only the parameters whose value moved,
+    across all of the macro's devices in a single M4L bundle.  Bundle entries
+    lost in transit are resent on the next tick.  The thread sleeps while no
+    values are queued.
+    """
+
+    def __init__(self, rate_hz: float = MACRO_STREAM_RATE_HZ):
+        self.rate_hz = rate_hz
+        self._queues: Dict[str, deque] = {}
+        self._macros: Dict[str, Dict[str, Any]] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {"ticks": 0, "values_received": 0, "values_coalesced": 0, "values_applied": 0,
+                       "params_sent": 0, "params_unchanged": 0, "send_errors": 0}
+
+    def push(self, macro: Dict[str, Any], values: List[float], interval: float = 0.0) -> int:
+        """Queue values for a macro, ``interval`` seconds apart starting now; returns the queue length."""
+        now = time.perf_counter()
+        with self._cond:
+            queue = self._queues.setdefault(macro["id"], deque())
+            self._macros[macro["id"]] = macro
+            for i, value in enumerate(values):
+                queue.append((now + i * interval, float(value)))
+            self._stats["values_received"] += len(values)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="macro-streamer")
+                self._thread.start()
+            self._cond.notify()
+            return len(queue)
+
+    def cancel(self, macro_id: str) -> int:
+        """Drop a macro's queued values; returns how many were discarded."""
+        with self._cond:
+            self._macros.pop(macro_id, None)
+            return len(self._queues.pop(macro_id, ()))
+
+    def _due(self, now: float) -> List[tuple]:
+        """(macro, newest due value) per macro; lock held by caller."""
+        due = []
+        for macro_id, queue in list(self._queues.items()):
+            value = None
+            taken = 0
+            while queue and queue[0][0] <= now:
+                value = queue.popleft()[1]
+                taken += 1
+            if taken:
+                self._stats["values_coalesced"] += taken - 1
+                due.append((self._macros[macro_id], value))
+            if not queue:
+                del self._queues[macro_id]
+                self._macros.pop(macro_id, None)
+        return due
+
+    def _apply(self, macro: Dict[str, Any], value: float):
+        compiled = macro["compiled"]
+        with compiled["lock"]:
+            counts = self._send(compiled, value)
+        macro["current_value"] = value
+        with self._cond:
+            self._stats["values_applied"] += 1
+            for key, n in counts.items():
+                self._stats[key] += n
+
+    def _send(self, compiled: Dict[str, Any], value: float) -> Dict[str, int]:
+        """Send the parameters ``value`` changes; compiled["lock"] held by caller. Returns stat increments."""
+        entries = []
+        changed_by_device = []
+        unchanged = 0
+        for device, values in zip(compiled["devices"], _macro_values(compiled, value)):
+            if _device_write_gen(device["track_index"], device["device_index"]) != device["write_gen"]:
+                device["sent_steps"] = [None] * len(values)  # another tool wrote the device
+            changed = _morph_changes(values, device["exact"], device["resolution"], device["sent_steps"])
+            changed_by_device.append(changed)
+            entries.extend((device["track_index"], device["device_index"], device["indices"][slot], float(v))
+                           for slot, _, v in changed)
+            unchanged += len(values) - len(changed)
+        if not entries:
+            return {"params_unchanged": unchanged}
+        try:
+            m4l = get_m4l_connection()
+            lost = set()
+            if m4l.supports("bundles"):
+                lost = set(_m4l_result(m4l.send_param_bundle(entries)).get("missing", []))
+            else:
+                for device, changed in zip(compiled["devices"], changed_by_device):
+                    if changed:
+                        _m4l_batch_set_params(m4l, device["track_index"], device["device_index"],
+                                              [{"index": device["indices"][slot], "value": v}
+                                               for slot, _, v in changed])
+        except Exception as e:
+            logger.debug("Macro stream send failed: %s", e)
+            return {"params_unchanged": unchanged, "send_errors": 1}
+        seq = 0
+        for device, changed in zip(compiled["devices"], changed_by_device):
+            for slot, step, _ in changed:
+                if seq not in lost:
+                    device["sent_steps"][slot] = step
+                seq += 1
+            device["write_gen"] = _device_write_gen(device["track_index"], device["device_index"])
+        return {"params_unchanged": unchanged, "params_sent": len(entries) - len(lost)}
+
+    def _run(self):
+        period = 1.0 / self.rate_hz
+        while True:
+            with self._cond:
+                while not self._queues:
+                    self._cond.wait()
+                now = time.perf_counter()
+                due = self._due(now)
+                if not due:
+                    # Nothing due yet: sleep until the earliest queued value (or a push)
+                    self._cond.wait(min(q[0][0] for q in self._queues.values()) - now)
+                    continue
+                self._stats["ticks"] += 1
+            started = time.perf_counter()
+            for macro, value in due:
+                self._apply(macro, value)
+            time.sleep(max(0.0, period - (time.perf_counter() - started)))  # rate cap
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            queued = sum(len(q) for q in self._queues.values())
+        return dict(self._stats, rate_hz=self.rate_hz, queued_values=queued)
+
+
+_macro_streamer = MacroStreamer()
+
+
 @mcp.tool()
 @_tool_handler("creating macro controller")
 def create_macro_controller(
@@ -4916,7 +7884,7 @@ def create_macro_controller(
     """Create a macro controller that links multiple device parameters together.
 
     A macro controller maps a single 0.0-1.0 value to multiple device parameters,
-    each with their own range mapping.
+    each with their own range mapping and curve.
 
     Parameters:
     - name: Human-readable name for the macro (e.g., "Brightness", "Intensity")
@@ -4926,8 +7894,12 @@ def create_macro_controller(
         - parameter_index: int (LOM index from discover_device_params)
         - min_value: float (parameter value when macro = 0.0)
         - max_value: float (parameter value when macro = 1.0)
+        - curve: optional "linear" (default), "exponential" (slow start),
+          "logarithmic" (fast start) or "stepped"
+        - steps: optional number of positions for curve="stepped" (default 4)
 
-    After creation, use set_macro_value() to control all linked parameters at once.
+    After creation, use set_macro_value() to control all linked parameters at once,
+    or stream_macro_values() for continuous movement.
 
     Requires the AbletonMCP_Bridge M4L device to be loaded on any track.
     """
@@ -4940,12 +7912,19 @@ def create_macro_controller(
         missing = required - m.keys()
         if missing:
             raise ValueError(f"Mapping at index {i} missing keys: {', '.join(sorted(missing))}")
+        if m.get("curve", "linear") not in _MACRO_CURVES:
+            raise ValueError(f"Mapping at index {i}: curve must be one of {', '.join(_MACRO_CURVES)}")
+        if m.get("curve") == "stepped":
+            steps = m.get("steps", _MACRO_DEFAULT_STEPS)
+            if not isinstance(steps, int) or isinstance(steps, bool) or steps < 2:
+                raise ValueError(f"Mapping at index {i}: steps must be an integer of at least 2")
 
     macro_id = str(uuid.uuid4())[:8]
     _macro_store[macro_id] = {
         "id": macro_id,
         "name": name,
         "mappings": mappings,
+        "compiled": _compile_macro(mappings),
         "current_value": 0.0,
         "created": time.strftime("%Y-%m-%d %H:%M:%S")
     }
@@ -4957,10 +7936,12 @@ def create_macro_controller(
         f"Mappings:\n"
     )
     for m in mappings:
+        curve = m.get("curve", "linear")
         output += (
             f"  - Track {m['track_index']}, Device {m['device_index']}, "
             f"Param [{m['parameter_index']}]: "
-            f"{m['min_value']} -> {m['max_value']}\n"
+            f"{m['min_value']} -> {m['max_value']}"
+            f"{'' if curve == 'linear' else f' ({curve})'}\n"
         )
 
     return output
@@ -4969,8 +7950,8 @@ def create_macro_controller(
 def set_macro_value(ctx: Context, macro_id: str, value: float) -> str:
     """Set the value of a macro controller, updating all linked parameters.
 
-    Interpolates the macro value (0.0-1.0) across all mapped parameters
-    and applies them via batch set.
+    Evaluates the macro's compiled mappings at value (0.0-1.0) and applies
+    them via batch set, one batch per device.
 
     Parameters:
     - macro_id: The ID of the macro controller
@@ -4984,31 +7965,69 @@ def set_macro_value(ctx: Context, macro_id: str, value: float) -> str:
 
     macro = _macro_store[macro_id]
     macro["current_value"] = value
-
-    grouped: Dict[tuple, list] = {}
-    for m in macro["mappings"]:
-        key = (m["track_index"], m["device_index"])
-        interpolated = m["min_value"] + (m["max_value"] - m["min_value"]) * value
-        if key not in grouped:
-            grouped[key] = []
-        grouped[key].append({"index": m["parameter_index"], "value": interpolated})
+    compiled = macro["compiled"]
 
     m4l = get_m4l_connection()
     total_set = 0
     total_failed = 0
 
-    for (ti, di), params in grouped.items():
-        data = _m4l_batch_set_params(m4l, ti, di, params)
-        total_set += data["params_set"]
-        total_failed += data["params_failed"]
+    with compiled["lock"]:
+        for device, values in zip(compiled["devices"], _macro_values(compiled, value)):
+            data = _m4l_batch_set_params(m4l, device["track_index"], device["device_index"],
+                                         [{"index": idx, "value": v} for idx, v in zip(device["indices"], values)])
+            total_set += data["params_set"]
+            total_failed += data["params_failed"]
+            # Everything was just sent; streaming continues from here
+            device["sent_steps"] = [None] * len(values) if data["params_failed"] else [
+                round(v / res * _MORPH_STEPS) for v, res in zip(values, device["resolution"])
+            ]
+            device["write_gen"] = _device_write_gen(device["track_index"], device["device_index"])
 
     return (
         f"Macro '{macro['name']}' set to {value:.2f}\n"
-        f"Updated {total_set} parameters across {len(grouped)} device(s) "
+        f"Updated {total_set} parameters across {len(compiled['devices'])} device(s) "
         f"({total_failed} failed)"
     )
 
 
+@mcp.tool()
+@_tool_handler("streaming macro values")
+def stream_macro_values(ctx: Context, macro_id: str, values: List[float], interval: float = 0.0) -> str:
+    """Stream macro values in the background for continuous, real-time movement.
+
+    Returns immediately. Values are applied by a background streamer at most
+    ABLETON_MCP_MACRO_RATE times per second (default 50): when values arrive
+    faster only the newest is applied, and each update only sends the
+    parameters whose value actually changed, in one M4L bundle for all of
+    the macro's devices. Call repeatedly with single values to drive a macro
+    live, or pass a whole gesture with an interval.
+
+    Parameters:
+    - macro_id: The ID of the macro controller
+    - values: Macro values (0.0 to 1.0) to apply in order
+    - interval: Seconds between successive values (0 = apply the newest right away)
+
+    Requires the AbletonMCP_Bridge M4L device to be loaded on any track.
+    """
+    if macro_id not in _macro_store:
+        return f"Macro '{macro_id}' not found. Use list_macros() to see available macros."
+    if not isinstance(values, list) or not 1 <= len(values) <= _MACRO_STREAM_MAX_VALUES:
+        raise ValueError(f"values must be a list of 1 to {_MACRO_STREAM_MAX_VALUES} numbers.")
+    for i, value in enumerate(values):
+        _validate_range(value, f"values[{i}]", 0.0, 1.0)
+    _validate_range(interval, "interval", 0.0, 10.0)
+
+    macro = _macro_store[macro_id]
+    queued = _macro_streamer.push(macro, values, interval)
+    stats = _macro_streamer.stats()
+    return (
+        f"Streaming {len(values)} value(s) to macro '{macro['name']}' "
+        f"({queued} queued, at most {_macro_streamer.rate_hz:g} updates/s)\n"
+        f"Streamer: {stats['values_applied']} values applied, {stats['values_coalesced']} coalesced, "
+        f"{stats['params_sent']} parameters sent, {stats['params_unchanged']} unchanged"
+    )
+
+
 @mcp.tool()
 @_tool_handler("listing macros")
 def list_macros(ctx: Context) -> str:
@@ -5043,6 +8062,7 @@ def delete_macro(ctx: Context, macro_id: str) -> str:
         return f"Macro '{macro_id}' not found."
     name = _macro_store[macro_id]["name"]
     del _macro_store[macro_id]
+    _macro_streamer.cancel(macro_id)
     return f"Deleted macro controller '{name}' (ID: {macro_id})."
 
 
@@ -5083,10 +8103,7 @@ def generate_preset(
         raise ValueError("variation_count must be between 1 and 5.")
 
     m4l = get_m4l_connection()
-    result = m4l.send_command("discover_params", {
-        "track_index": track_index,
-        "device_index": device_index
-    })
+    result = _m4l_discover_params(m4l, [(track_index, device_index)])[0]
 
     if result.get("status") != "success":
         return f"M4L bridge error: {result.get('message', 'Unknown error')}"
@@ -5170,10 +8187,7 @@ def create_parameter_map(
         raise ValueError("friendly_names must be a non-empty list.")
 
     m4l = get_m4l_connection()
-    result = m4l.send_command("discover_params", {
-        "track_index": track_index,
-        "device_index": device_index
-    })
+    result = _m4l_discover_params(m4l, [(track_index, device_index)])[0]
 
     data = _m4l_result(result)
     device_name = data.get("device_name", "Unknown")
@@ -5437,7 +8451,9 @@ def observe_property(ctx: Context, lom_path: str, property_name: str) -> str:
     - "live_set" + "current_song_time" — track playback position
     - "live_set tracks N" + "output_meter_level" — track level meter
 
-    Use get_property_changes() to retrieve accumulated changes.
+    Bridges that support it push changes to the server as they happen
+    (coalesced every 20ms per observer), so fast-changing properties don't
+    need polling. Use get_property_changes() to retrieve accumulated changes.
 
     Requires the AbletonMCP_Bridge M4L device to be loaded on any track.
     """
@@ -5450,7 +8466,14 @@ def observe_property(ctx: Context, lom_path: str, property_name: str) -> str:
     data = _m4l_result(result)
     if data.get("already_observing"):
         return f"Already observing {data.get('key', '?')}."
-    return f"Now observing: {data.get('path', '?')}.{data.get('property', '?')}"
+    if _m4l_events.mode == "off" or m4l.bridge_event_mode == "off":
+        try:
+            _m4l_events.enable(m4l)
+            m4l.bridge_event_mode = _m4l_events.mode
+        except Exception as e:
+            logger.warning("M4L event push unavailable, changes will be polled: %s", e)
+    delivery = "pushed" if _m4l_events.mode != "off" else "polled"
+    return f"Now observing: {data.get('path', '?')}.{data.get('property', '?')} (changes {delivery})"
 
 
 @mcp.tool()
@@ -5471,6 +8494,7 @@ def stop_observing(ctx: Context, lom_path: str, property_name: str) -> str:
     })
 
     data = _m4l_result(result)
+    _m4l_events.forget(data.get("key", f"{lom_path}:{property_name}"))
     if not data.get("was_observing", True):
         return f"Was not observing {data.get('key', '?')}."
     return (
@@ -5481,25 +8505,53 @@ def stop_observing(ctx: Context, lom_path: str, property_name: str) -> str:
 
 @mcp.tool()
 @_tool_handler("getting property changes")
-def get_property_changes(ctx: Context) -> str:
+def get_property_changes(ctx: Context, since: int = -1, key_filter: str = "") -> str:
     """Get accumulated property change events from all active observers.
 
     Returns all changes since the last call (changes are cleared after reading).
     Each change includes the property name, new value, and timestamp.
 
+    When the bridge pushes changes this is a local read: the server keeps the
+    last 1000 events per observer, each with a sequence number.
+
+    Parameters:
+    - since: Return events after this sequence number instead of since the
+      last call (pushed changes only; -1 = since the last call)
+    - key_filter: Only observers whose "path:property" key contains this text
+
     Use observe_property() first to start monitoring properties.
 
     Requires the AbletonMCP_Bridge M4L device to be loaded on any track.
     """
+    if _m4l_events.mode != "off" and _m4l_connection and _m4l_connection.bridge_event_mode != "off":
+        changes, newest = _m4l_events.read(None if since < 0 else since, key_filter)
+        total = sum(len(events) for events in changes.values())
+        if total == 0:
+            return f"No changes detected (cursor {newest})."
+        output = f"Property Changes ({total} total, {len(changes)} observers, cursor {newest}):\n\n"
+        for key, events in changes.items():
+            output += f"  {key}:\n"
+            for evt in events[-20:]:  # Show last 20 per observer
+                coalesced = f" (+{evt['coalesced']} coalesced)" if evt.get("coalesced") else ""
+                output += (f"    #{evt['seq']} [{evt.get('time', '?')}] "
+                           f"{evt.get('property', '?')} = {evt.get('value', '?')}{coalesced}\n")
+            if len(events) > 20:
+                output += f"    ... ({len(events) - 20} more)\n"
+        return output
+
+    _m4l_events.mode = "off"  # bridge reloaded (or never pushed); poll it
     m4l = get_m4l_connection()
     result = m4l.send_command("get_observed_changes")
 
     data = _m4l_result(result)
-    total = data.get("total_changes", 0)
     obs_count = data.get("observer_count", 0)
-    changes = data.get("changes", {})
+    # The bridge clears what it returns; changes outside key_filter wait
+    # locally for a later call instead of being lost
+    _m4l_events.store_polled(data.get("changes", {}))
+    changes, _ = _m4l_events.read(None, key_filter)
+    total = sum(len(events) for events in changes.values())
 
-    if obs_count == 0:
+    if obs_count == 0 and total == 0:
         return "No active observers. Use observe_property() to start monitoring."
 
     if total == 0:
@@ -6146,6 +9198,8 @@ def clip_to_grid(ctx: Context, track_index: int, clip_index: int) -> str:
         _validate_index(track_index, "track_index")
         _validate_index(clip_index, "clip_index")
         ableton = get_ableton_connection()
+        # One unpaged read: the grid needs every note, and each page would
+        # make Live read the whole clip again
         result = ableton.send_command("get_clip_notes", {
             "track_index": track_index,
             "clip_index": clip_index,
@@ -6364,10 +9418,16 @@ def tap_tempo(ctx: Context) -> str:
 
 @mcp.tool()
 @_tool_handler("getting all tracks info")
-def get_all_tracks_info(ctx: Context) -> str:
-    """Get information about all tracks in the session at once (bulk query)."""
+def get_all_tracks_info(ctx: Context, offset: int = 0, limit: int = None) -> str:
+    """Get information about all tracks in the session at once (bulk query).
+
+    Parameters:
+    - offset: Index of the first track to return (default: 0)
+    - limit: Maximum tracks to return (default: all). On large sets, page through
+      with limit and the returned next_offset (null on the last page).
+    """
     ableton = get_ableton_connection()
-    result = ableton.send_command("get_all_tracks_info")
+    result = ableton.send_command("get_all_tracks_info", _page_params(offset, limit))
     return json.dumps(result)
 
 
@@ -6621,15 +9681,20 @@ def apply_groove(ctx: Context, track_index: int, clip_index: int, groove_amount:
 
 @mcp.tool()
 @_tool_handler("getting arrangement clips")
-def get_arrangement_clips(ctx: Context, track_index: int) -> str:
+def get_arrangement_clips(ctx: Context, track_index: int, offset: int = 0, limit: int = None) -> str:
     """Get all clips in arrangement view for a track.
 
     Parameters:
     - track_index: The index of the track to get arrangement clips from
+    - offset: Index of the first clip to return (default: 0)
+    - limit: Maximum clips to return (default: all); page with the returned next_offset
     """
     _validate_index(track_index, "track_index")
     ableton = get_ableton_connection()
-    result = ableton.send_command("get_arrangement_clips", {"track_index": track_index})
+    result = ableton.send_command("get_arrangement_clips", {
+        "track_index": track_index,
+        **_page_params(offset, limit),
+    })
     return json.dumps(result)
 
 